@@ -211,6 +211,12 @@ AVAILABLE_CLI_OPTIONS = {
         default=constants.BACKTEST_CACHE_DEFAULT,
         choices=constants.BACKTEST_CACHE_AGE,
     ),
+    "backtest_engine": Arg(
+        '--backtest-engine',
+        help='Select the backtesting engine. `vectorized` evaluates exit conditions on NumPy '
+        'arrays and skips candles where no exit can occur. (default: `loop`).',
+        choices=constants.BACKTEST_ENGINES,
+    ),
     # Edge
     "stoploss_range": Arg(
         '--stoplosses',
@@ -280,6 +286,27 @@ AVAILABLE_CLI_OPTIONS = {
         metavar='JOBS',
         default=-1,
     ),
+    "hyperopt_warm_workers": Arg(
+        '--warm-workers',
+        help='Keep hyperopt worker processes warm. Each worker builds the strategy once, '
+        'only the parameters of an epoch are sent to the workers afterwards.',
+        action='store_true',
+        default=False,
+    ),
+    "hyperopt_lean_metrics": Arg(
+        '--lean-metrics',
+        help='Only calculate summary metrics for each epoch. The full backtest report is '
+        'only generated for the best epoch.',
+        action='store_true',
+        default=False,
+    ),
+    "hyperopt_crash_safe": Arg(
+        '--crash-safe',
+        help='Sync hyperopt results to disk after every batch of epochs. '
+        'At most one batch of epochs is lost if hyperopt crashes.',
+        action='store_true',
+        default=False,
+    ),
     "hyperopt_random_state": Arg(
         '--random-state',
         help='Set random state to some positive integer for reproducible hyperopt results.',
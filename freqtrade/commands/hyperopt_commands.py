@@ -1,5 +1,4 @@
 import logging
-from operator import itemgetter
 from typing import Any, Dict
 
 from colorama import init as colorama_init
@@ -18,6 +17,7 @@ def start_hyperopt_list(args: Dict[str, Any]) -> None:
     """
     List hyperopt epochs previously evaluated
     """
+    from freqtrade.optimize.hyperopt_results_store import HyperoptResultsStore
     from freqtrade.optimize.hyperopt_tools import HyperoptTools
 
     config = setup_utils_configuration(args, RunMode.UTIL_NO_EXCHANGE)
@@ -32,8 +32,9 @@ def start_hyperopt_list(args: Dict[str, Any]) -> None:
         config['user_data_dir'] / 'hyperopt_results',
         config.get('hyperoptexportfilename'))
 
-    # Previous evaluations
-    epochs, total_epochs = HyperoptTools.load_filtered_results(results_file, config)
+    # Previous evaluations - the result table only needs the metrics from the index
+    store, records, total_epochs = HyperoptTools.load_filtered_index(results_file, config)
+    epochs = HyperoptResultsStore.summary_epochs(records)
 
     if print_colorized:
         colorama_init(autoreset=True)
@@ -47,13 +48,13 @@ def start_hyperopt_list(args: Dict[str, Any]) -> None:
             print('User interrupted..')
 
     if epochs and not no_details:
-        sorted_epochs = sorted(epochs, key=itemgetter('loss'))
-        results = sorted_epochs[0]
+        best = records[[records['loss'].argmin()]]
+        results = store.load_epochs(best)[0]
         HyperoptTools.show_epoch_details(results, total_epochs, print_json, no_header)
 
     if epochs and export_csv:
         HyperoptTools.export_csv_file(
-            config, epochs, export_csv
+            config, store.load_epochs(records), export_csv
         )
 
 
@@ -74,7 +75,7 @@ def start_hyperopt_show(args: Dict[str, Any]) -> None:
     n = config.get('hyperopt_show_index', -1)
 
     # Previous evaluations
-    epochs, total_epochs = HyperoptTools.load_filtered_results(results_file, config)
+    store, epochs, total_epochs = HyperoptTools.load_filtered_index(results_file, config)
 
     filtered_epochs = len(epochs)
 
@@ -89,8 +90,9 @@ def start_hyperopt_show(args: Dict[str, Any]) -> None:
     if n > 0:
         n -= 1
 
-    if epochs:
-        val = epochs[n]
+    if filtered_epochs:
+        # Only load the selected epoch
+        val = store.load_epochs(epochs[[n]])[0]
 
         metrics = val['results_metrics']
         if 'strategy_name' in metrics:
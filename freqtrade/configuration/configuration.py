@@ -279,6 +279,9 @@ class Configuration:
         self._args_to_config(config, argname='backtest_cache',
                              logstring='Parameter --cache={} detected ...')
 
+        self._args_to_config(config, argname='backtest_engine',
+                             logstring='Parameter --backtest-engine={} detected ...')
+
         self._args_to_config(config, argname='disableparamexport',
                              logstring='Parameter --disableparamexport detected: {} ...')
 
@@ -326,6 +329,15 @@ class Configuration:
         self._args_to_config(config, argname='hyperopt_jobs',
                              logstring='Parameter -j/--job-workers detected: {}')
 
+        self._args_to_config(config, argname='hyperopt_warm_workers',
+                             logstring='Parameter --warm-workers detected ...')
+
+        self._args_to_config(config, argname='hyperopt_lean_metrics',
+                             logstring='Parameter --lean-metrics detected ...')
+
+        self._args_to_config(config, argname='hyperopt_crash_safe',
+                             logstring='Parameter --crash-safe detected ...')
+
         self._args_to_config(config, argname='hyperopt_random_state',
                              logstring='Parameter --random-state detected: {}')
 
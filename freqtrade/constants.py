@@ -11,6 +11,7 @@ from freqtrade.enums import CandleType
 DEFAULT_CONFIG = 'config.json'
 DEFAULT_EXCHANGE = 'bittrex'
 PROCESS_THROTTLE_SECS = 5  # sec
+CANDLE_CLOSE_OFFSET_SECS = 1.0  # sec
 HYPEROPT_EPOCH = 100  # epochs
 RETRY_TIMEOUT = 30  # sec
 TIMEOUT_UNITS = ['minutes', 'seconds']
@@ -34,10 +35,12 @@ AVAILABLE_PAIRLISTS = ['StaticPairList', 'VolumePairList',
                        'PrecisionFilter', 'PriceFilter', 'RangeStabilityFilter',
                        'ShuffleFilter', 'SpreadFilter', 'VolatilityFilter']
 AVAILABLE_PROTECTIONS = ['CooldownPeriod', 'LowProfitPairs', 'MaxDrawdown', 'StoplossGuard']
-AVAILABLE_DATAHANDLERS = ['json', 'jsongz', 'hdf5']
+AVAILABLE_DATAHANDLERS = ['json', 'jsongz', 'hdf5', 'feather']
 BACKTEST_BREAKDOWNS = ['day', 'week', 'month']
 BACKTEST_CACHE_AGE = ['none', 'day', 'week', 'month']
 BACKTEST_CACHE_DEFAULT = 'day'
+BACKTEST_ENGINES = ['loop', 'vectorized']
+BACKTEST_ENGINE_DEFAULT = 'loop'
 DRY_RUN_WALLET = 1000
 DATETIME_PRINT_FORMAT = '%Y-%m-%d %H:%M:%S'
 MATH_CLOSE_PREC = 1e-14  # Precision used for float comparisons
@@ -136,6 +139,7 @@ CONF_SCHEMA = {
         'dry_run_wallet': {'type': 'number', 'default': DRY_RUN_WALLET},
         'cancel_open_orders_on_exit': {'type': 'boolean', 'default': False},
         'process_only_new_candles': {'type': 'boolean'},
+        'incremental_candle_count': {'type': 'integer', 'minimum': 0},
         'minimal_roi': {
             'type': 'object',
             'patternProperties': {
@@ -160,6 +164,7 @@ CONF_SCHEMA = {
             'type': 'array',
             'items': {'type': 'string', 'enum': BACKTEST_BREAKDOWNS}
         },
+        'backtest_engine': {'type': 'string', 'enum': BACKTEST_ENGINES},
         'bot_name': {'type': 'string'},
         'unfilledtimeout': {
             'type': 'object',
@@ -364,6 +369,9 @@ CONF_SCHEMA = {
             'default': {},
             'properties': {
                 'process_throttle_secs': {'type': 'integer'},
+                'analysis_workers': {'type': 'integer', 'minimum': 1},
+                'process_on_candle_close': {'type': 'boolean'},
+                'candle_close_offset_secs': {'type': 'number', 'minimum': 0},
                 'interval': {'type': 'integer'},
                 'sd_notify': {'type': 'boolean'},
             }
@@ -378,6 +386,7 @@ CONF_SCHEMA = {
             'enum': AVAILABLE_DATAHANDLERS,
             'default': 'jsongz'
         },
+        'data_load_workers': {'type': 'integer', 'minimum': 1},
         'position_adjustment_enable': {'type': 'boolean'},
         'max_entry_position_adjustment': {'type': ['integer', 'number'], 'minimum': -1},
     },
@@ -408,6 +417,7 @@ CONF_SCHEMA = {
                 'unknown_fee_rate': {'type': 'number'},
                 'outdated_offset': {'type': 'integer', 'minimum': 1},
                 'markets_refresh_interval': {'type': 'integer'},
+                'batch_pricing': {'type': 'boolean'},
                 'ccxt_config': {'type': 'object'},
                 'ccxt_async_config': {'type': 'object'}
             },
@@ -427,7 +437,9 @@ CONF_SCHEMA = {
                 'minimum_expectancy': {'type': 'number'},
                 'min_trade_number': {'type': 'number'},
                 'max_trade_duration_minute': {'type': 'integer'},
-                'remove_pumps': {'type': 'boolean'}
+                'remove_pumps': {'type': 'boolean'},
+                'calculation_workers': {'type': 'integer', 'minimum': 1},
+                'background_calculation': {'type': 'boolean'}
             },
             'required': ['process_throttle_secs', 'allowed_risk']
         }
@@ -5,8 +5,9 @@ import itertools
 import logging
 from datetime import datetime, timezone
 from operator import itemgetter
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame, to_datetime
 
@@ -46,6 +47,49 @@ def ohlcv_to_dataframe(ohlcv: list, timeframe: str, pair: str, *,
                                  drop_incomplete=drop_incomplete)
 
 
+def ohlcv_append_to_dataframe(dataframe: DataFrame, ohlcv: list, timeframe: str, *,
+                              drop_incomplete: bool = True) -> Optional[DataFrame]:
+    """
+    Update a candle (OHLCV) dataframe (as created by ohlcv_to_dataframe with fill_missing)
+    with the latest candles, without converting all candles again.
+    Candles before the last candle of dataframe are considered final - only the last candle
+    of dataframe and newer candles are taken from ohlcv.
+    The result covers the same candles as ohlcv_to_dataframe(ohlcv, ...) would.
+    :param dataframe: DataFrame containing candle (OHLCV) data, without gaps
+    :param ohlcv: list with candle (OHLCV) data, as returned by exchange.async_get_candle_history
+    :param timeframe: timeframe (e.g. 5m)
+    :param drop_incomplete: Drop the last candle of the dataframe, assuming it's incomplete
+    :return: DataFrame, or None if ohlcv does not continue dataframe without gaps
+        (or contains duplicate, unsorted or missing values) - requiring a full conversion.
+    """
+    from freqtrade.exchange import timeframe_to_msecs
+
+    if dataframe.empty or not ohlcv:
+        return None
+    timeframe_ms = timeframe_to_msecs(timeframe)
+    dates = np.fromiter((candle[0] for candle in ohlcv), dtype='int64', count=len(ohlcv))
+    df_first = dataframe['date'].iloc[0].value // 1_000_000
+    df_last = dataframe['date'].iloc[-1].value // 1_000_000
+    if ((dates[1:] - dates[:-1] != timeframe_ms).any()
+            or not df_first <= dates[0] <= df_last <= dates[-1]
+            or (df_last - dates[0]) % timeframe_ms
+            or (df_last - df_first) // timeframe_ms != len(dataframe) - 1):
+        return None
+
+    start = int(df_last - dates[0]) // timeframe_ms
+    new = DataFrame(ohlcv[start:], columns=DEFAULT_DATAFRAME_COLUMNS)
+    if new.isnull().values.any():
+        return None
+    new['date'] = to_datetime(new['date'], unit='ms', utc=True)
+    new = new.astype(dtype={'open': 'float', 'high': 'float', 'low': 'float', 'close': 'float',
+                            'volume': 'float'})
+    data = pd.concat([dataframe.iloc[len(dataframe) - 1 - start:-1], new], ignore_index=True)
+    if drop_incomplete:
+        data = data.iloc[:-1]
+        logger.debug('Dropping last candle')
+    return data
+
+
 def clean_ohlcv_dataframe(data: DataFrame, timeframe: str, pair: str, *,
                           fill_missing: bool = True,
                           drop_incomplete: bool = True) -> DataFrame:
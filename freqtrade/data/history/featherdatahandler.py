@@ -0,0 +1,221 @@
+import logging
+import re
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import pyarrow as pa
+from pandas import DataFrame, read_feather
+
+from freqtrade.configuration import TimeRange
+from freqtrade.constants import (DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS,
+                                 ListPairsWithTimeframes, TradeList)
+from freqtrade.enums import CandleType
+
+from .idatahandler import IDataHandler
+
+
+logger = logging.getLogger(__name__)
+
+# Number of candles per record batch. Loading a timerange only reads the batches covering it.
+OHLCV_BATCH_SIZE = 50_000
+
+
+class FeatherDataHandler(IDataHandler):
+
+    _columns = DEFAULT_DATAFRAME_COLUMNS
+
+    @classmethod
+    def ohlcv_get_available_data(cls, datadir: Path, trading_mode: str) -> ListPairsWithTimeframes:
+        """
+        Returns a list of all pairs with ohlcv data available in this datadir
+        :param datadir: Directory to search for ohlcv files
+        :param trading_mode: trading-mode to be used
+        :return: List of Tuples of (pair, timeframe)
+        """
+        if trading_mode == 'futures':
+            datadir = datadir.joinpath('futures')
+        _tmp = [
+            re.search(
+                cls._OHLCV_REGEX, p.name
+            ) for p in datadir.glob(f"*.{cls._get_file_extension()}")]
+        return [
+            (
+                cls.rebuild_pair_from_filename(match[1]),
+                match[2],
+                CandleType.from_string(match[3])
+            ) for match in _tmp if match and len(match.groups()) > 1]
+
+    @classmethod
+    def ohlcv_get_pairs(cls, datadir: Path, timeframe: str, candle_type: CandleType) -> List[str]:
+        """
+        Returns a list of all pairs with ohlcv data available in this datadir
+        for the specified timeframe
+        :param datadir: Directory to search for ohlcv files
+        :param timeframe: Timeframe to search pairs for
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: List of Pairs
+        """
+        candle = ""
+        if candle_type != CandleType.SPOT:
+            datadir = datadir.joinpath('futures')
+            candle = f"-{candle_type}"
+
+        _tmp = [re.search(r'^(\S+)(?=\-' + timeframe + candle + '.feather)', p.name)
+                for p in datadir.glob(f"*{timeframe}{candle}.{cls._get_file_extension()}")]
+        # Check if regex found something and only return these results
+        return [cls.rebuild_pair_from_filename(match[0]) for match in _tmp if match]
+
+    def ohlcv_store(
+            self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType) -> None:
+        """
+        Store data in feather (Arrow IPC) format.
+        Data is stored uncompressed and sorted by date, in batches of OHLCV_BATCH_SIZE candles,
+        so it can be memory-mapped and loaded partially.
+        :param pair: Pair - used to generate filename
+        :param timeframe: Timeframe - used to generate filename
+        :param data: Dataframe containing OHLCV data
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: None
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        self.create_dir_if_needed(filename)
+
+        _data = data.loc[:, self._columns].sort_values('date').reset_index(drop=True)
+        table = pa.Table.from_pandas(_data, preserve_index=False)
+        with pa.OSFile(str(filename), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table, max_chunksize=OHLCV_BATCH_SIZE)
+
+    def _ohlcv_load(self, pair: str, timeframe: str,
+                    timerange: Optional[TimeRange], candle_type: CandleType
+                    ) -> DataFrame:
+        """
+        Internal method used to load data for one pair from disk.
+        Implements the loading and conversion to a Pandas dataframe.
+        Timerange trimming and dataframe validation happens outside of this method.
+        :param pair: Pair to load data
+        :param timeframe: Timeframe (e.g. "5m")
+        :param timerange: Limit data to be loaded to this timerange.
+                        Optionally implemented by subclasses to avoid loading
+                        all data where possible.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: DataFrame with ohlcv data, or empty DataFrame
+        """
+        filename = self._pair_data_filename(
+            self._datadir, pair, timeframe, candle_type=candle_type)
+        if not filename.exists():
+            return DataFrame(columns=self._columns)
+
+        with pa.memory_map(str(filename), 'r') as source:
+            reader = pa.ipc.open_file(source)
+            batches = self._ohlcv_batches(reader, timerange)
+            pairdata = pa.Table.from_batches(batches, schema=reader.schema).to_pandas()
+
+        if list(pairdata.columns) != self._columns:
+            raise ValueError("Wrong dataframe format")
+        pairdata = pairdata.astype(dtype={'open': 'float', 'high': 'float',
+                                          'low': 'float', 'close': 'float', 'volume': 'float'})
+        return pairdata
+
+    @staticmethod
+    def _ohlcv_batches(reader: pa.ipc.RecordBatchFileReader,
+                       timerange: Optional[TimeRange]) -> List[pa.RecordBatch]:
+        """
+        Get the record batches (sliced to) covering timerange.
+        Relies on the data being sorted by date - batches after the end of the timerange
+        are not read at all, and only the date column of batches before its start is read.
+        """
+        start = stop = None
+        if timerange and timerange.starttype == 'date':
+            start = np.datetime64(timerange.startts, 's')
+        if timerange and timerange.stoptype == 'date':
+            stop = np.datetime64(timerange.stopts, 's')
+
+        batches = []
+        date_idx = reader.schema.get_field_index('date')
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            if start is None and stop is None:
+                batches.append(batch)
+                continue
+            dates = batch.column(date_idx).to_numpy()
+            first = np.searchsorted(dates, start, side='left') if start is not None else 0
+            last = np.searchsorted(dates, stop, side='right') if stop is not None else len(dates)
+            if last > first:
+                batches.append(batch.slice(first, last - first))
+            if last < len(dates):
+                break
+        return batches
+
+    def ohlcv_append(
+        self,
+        pair: str,
+        timeframe: str,
+        data: DataFrame,
+        candle_type: CandleType
+    ) -> None:
+        """
+        Append data to existing data structures
+        :param pair: Pair
+        :param timeframe: Timeframe this ohlcv data is for
+        :param data: Data to append.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        """
+        raise NotImplementedError()
+
+    @classmethod
+    def trades_get_pairs(cls, datadir: Path) -> List[str]:
+        """
+        Returns a list of all pairs for which trade data is available in this
+        :param datadir: Directory to search for ohlcv files
+        :return: List of Pairs
+        """
+        _tmp = [re.search(r'^(\S+)(?=\-trades.feather)', p.name)
+                for p in datadir.glob("*trades.feather")]
+        # Check if regex found something and only return these results to avoid exceptions.
+        return [cls.rebuild_pair_from_filename(match[0]) for match in _tmp if match]
+
+    def trades_store(self, pair: str, data: TradeList) -> None:
+        """
+        Store trades data (list of Dicts) to file
+        :param pair: Pair - used for filename
+        :param data: List of Lists containing trade data,
+                     column sequence as in DEFAULT_TRADES_COLUMNS
+        """
+        filename = self._pair_trades_filename(self._datadir, pair)
+        DataFrame(data, columns=DEFAULT_TRADES_COLUMNS).to_feather(
+            filename, compression_level=9, compression='lz4')
+
+    def trades_append(self, pair: str, data: TradeList):
+        """
+        Append data to existing files
+        :param pair: Pair - used for filename
+        :param data: List of Lists containing trade data,
+                     column sequence as in DEFAULT_TRADES_COLUMNS
+        """
+        raise NotImplementedError()
+
+    def _trades_load(self, pair: str, timerange: Optional[TimeRange] = None) -> TradeList:
+        """
+        Load a pair from feather file.
+        :param pair: Load trades for this pair
+        :param timerange: Timerange to load trades for
+        :return: List of trades
+        """
+        filename = self._pair_trades_filename(self._datadir, pair)
+        if not filename.exists():
+            return []
+
+        trades = read_feather(filename)
+        if timerange:
+            if timerange.starttype == 'date':
+                trades = trades.loc[trades['timestamp'] >= timerange.startts * 1e3]
+            if timerange.stoptype == 'date':
+                trades = trades.loc[trades['timestamp'] < timerange.stopts * 1e3]
+        trades[['id', 'type']] = trades[['id', 'type']].replace({np.nan: None})
+        return trades.values.tolist()
+
+    @classmethod
+    def _get_file_extension(cls):
+        return "feather"
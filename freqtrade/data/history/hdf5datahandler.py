@@ -121,7 +121,8 @@ class HDF5DataHandler(IDataHandler):
             raise ValueError("Wrong dataframe format")
         pairdata = pairdata.astype(dtype={'open': 'float', 'high': 'float',
                                           'low': 'float', 'close': 'float', 'volume': 'float'})
-        return pairdata
+        # Appended candles keep the index of the appended dataframe
+        return pairdata.reset_index(drop=True)
 
     def ohlcv_append(
         self,
@@ -131,13 +132,26 @@ class HDF5DataHandler(IDataHandler):
         candle_type: CandleType
     ) -> None:
         """
-        Append data to existing data structures
+        Append data to existing data structures.
+        Candles are appended to the existing table, replacing stored candles from the first
+        appended date onwards - without rewriting the remaining data.
         :param pair: Pair
         :param timeframe: Timeframe this ohlcv data is for
         :param data: Data to append.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
-        raise NotImplementedError()
+        key = self._pair_ohlcv_key(pair, timeframe)
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not filename.exists():
+            self.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
+            return
+        if data.empty:
+            return
+
+        _data = data.loc[:, self._columns].sort_values('date')
+        with pd.HDFStore(filename, mode='a', complevel=9, complib='blosc') as store:
+            store.remove(key, where=[f"date >= Timestamp({_data.iloc[0]['date'].value})"])
+            store.append(key, _data, format='table', data_columns=['date'])
 
     @classmethod
     def trades_get_pairs(cls, datadir: Path) -> List[str]:
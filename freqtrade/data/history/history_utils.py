@@ -1,8 +1,10 @@
 import logging
 import operator
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
 
 import arrow
 from pandas import DataFrame
@@ -68,7 +70,8 @@ def load_data(datadir: Path,
               startup_candles: int = 0,
               fail_without_data: bool = False,
               data_format: str = 'json',
-              candle_type: CandleType = CandleType.SPOT
+              candle_type: CandleType = CandleType.SPOT,
+              data_load_workers: int = 1,
               ) -> Dict[str, DataFrame]:
     """
     Load ohlcv history data for a list of pairs.
@@ -82,6 +85,8 @@ def load_data(datadir: Path,
     :param fail_without_data: Raise OperationalException if no data is found.
     :param data_format: Data format which should be used. Defaults to json
     :param candle_type: Any of the enum CandleType (must match trading mode!)
+    :param data_load_workers: Number of processes loading pairs concurrently.
+                              1 loads all pairs sequentially within this process.
     :return: dict(<pair>:<Dataframe>)
     """
     result: Dict[str, DataFrame] = {}
@@ -89,15 +94,16 @@ def load_data(datadir: Path,
         logger.info(f'Using indicator startup period: {startup_candles} ...')
 
     data_handler = get_datahandler(datadir, data_format)
+    load_args = dict(timeframe=timeframe, datadir=datadir, timerange=timerange,
+                     fill_up_missing=fill_up_missing, startup_candles=startup_candles,
+                     data_handler=data_handler, candle_type=candle_type)
 
-    for pair in pairs:
-        hist = load_pair_history(pair=pair, timeframe=timeframe,
-                                 datadir=datadir, timerange=timerange,
-                                 fill_up_missing=fill_up_missing,
-                                 startup_candles=startup_candles,
-                                 data_handler=data_handler,
-                                 candle_type=candle_type
-                                 )
+    if data_load_workers > 1 and len(pairs) > 1:
+        histories = _load_pair_histories_concurrently(pairs, data_load_workers, load_args)
+    else:
+        histories = (load_pair_history(pair=pair, **load_args) for pair in pairs)
+
+    for pair, hist in zip(pairs, histories):
         if not hist.empty:
             result[pair] = hist
 
@@ -106,6 +112,27 @@ def load_data(datadir: Path,
     return result
 
 
+def _load_pair_histories_concurrently(pairs: List[str], workers: int,
+                                      load_args: Dict[str, Any]) -> Iterator[DataFrame]:
+    """
+    Load history for multiple pairs using a pool of processes.
+    Results are yielded in the order of `pairs`. To limit memory usage, no more than
+    2 * workers pairs are loaded ahead of the result currently consumed.
+    :param pairs: List of pairs to load
+    :param workers: Number of worker processes
+    :param load_args: Arguments for load_pair_history()
+    """
+    logger.info(f"Loading data for {len(pairs)} pairs using {workers} processes.")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Deque = deque()
+        for pair in pairs:
+            pending.append(executor.submit(load_pair_history, pair=pair, **load_args))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
 def refresh_data(datadir: Path,
                  timeframe: str,
                  pairs: List[str],
@@ -170,6 +197,28 @@ def _load_cached_data_for_updating(
     return data, start_ms
 
 
+def _append_new_candles(pair: str, timeframe: str, data: DataFrame, new_dataframe: DataFrame, *,
+                        data_handler: IDataHandler, candle_type: CandleType) -> DataFrame:
+    """
+    Store newly downloaded candles, appending them to the stored data if the data handler
+    supports this - otherwise the combined data is stored.
+    :param data: Cached data the download continued from.
+    :param new_dataframe: Downloaded candles.
+    :return: Combined data
+    """
+    # Run cleaning again to ensure there were no duplicate candles
+    # Especially between existing and new data.
+    combined = clean_ohlcv_dataframe(data.append(new_dataframe), timeframe, pair,
+                                     fill_missing=False, drop_incomplete=False)
+    try:
+        # Candles up to the last cached candle are unchanged. Later candles replace stored ones.
+        new_candles = combined.loc[combined['date'] > data.iloc[-1]['date']]
+        data_handler.ohlcv_append(pair, timeframe, data=new_candles, candle_type=candle_type)
+    except NotImplementedError:
+        data_handler.ohlcv_store(pair, timeframe, data=combined, candle_type=candle_type)
+    return combined
+
+
 def _download_pair_history(pair: str, *,
                            datadir: Path,
                            exchange: Exchange,
@@ -226,18 +275,16 @@ def _download_pair_history(pair: str, *,
                                            fill_missing=False, drop_incomplete=True)
         if data.empty:
             data = new_dataframe
+            data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
         else:
-            # Run cleaning again to ensure there were no duplicate candles
-            # Especially between existing and new data.
-            data = clean_ohlcv_dataframe(data.append(new_dataframe), timeframe, pair,
-                                         fill_missing=False, drop_incomplete=False)
+            data = _append_new_candles(pair, timeframe, data, new_dataframe,
+                                       data_handler=data_handler, candle_type=candle_type)
 
         logger.debug("New  Start: %s",
                      f"{data.iloc[0]['date']:%Y-%m-%d %H:%M:%S}" if not data.empty else 'None')
         logger.debug("New End: %s",
                      f"{data.iloc[-1]['date']:%Y-%m-%d %H:%M:%S}" if not data.empty else 'None')
 
-        data_handler.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
         return True
 
     except Exception:
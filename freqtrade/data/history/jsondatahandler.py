@@ -1,10 +1,12 @@
+import gzip
 import logging
 import re
 from pathlib import Path
 from typing import List, Optional
 
 import numpy as np
-from pandas import DataFrame, read_json, to_datetime
+import rapidjson
+from pandas import DataFrame, concat, read_json, to_datetime
 
 from freqtrade import misc
 from freqtrade.configuration import TimeRange
@@ -17,6 +19,9 @@ from .idatahandler import IDataHandler
 
 logger = logging.getLogger(__name__)
 
+# Appended candles are merged into the main data file once the tail holds more candles.
+OHLCV_TAIL_MAX_CANDLES = 10000
+
 
 class JsonDataHandler(IDataHandler):
 
@@ -87,6 +92,11 @@ class JsonDataHandler(IDataHandler):
             filename, orient="values",
             compression='gzip' if self._use_zip else None)
 
+        # All data is in the main file now
+        tail_filename = self._pair_data_tail_filename(filename)
+        if tail_filename.exists():
+            tail_filename.unlink()
+
     def _ohlcv_load(self, pair: str, timeframe: str,
                     timerange: Optional[TimeRange], candle_type: CandleType
                     ) -> DataFrame:
@@ -111,6 +121,14 @@ class JsonDataHandler(IDataHandler):
         except ValueError:
             logger.error(f"Could not load data for {pair}.")
             return DataFrame(columns=self._columns)
+
+        tail_filename = self._pair_data_tail_filename(filename)
+        if tail_filename.exists():
+            pairdata = concat([pairdata, self._ohlcv_load_tail(tail_filename)])
+            # Appended candles replace candles with the same date
+            pairdata = pairdata.drop_duplicates(subset='date', keep='last').sort_values('date')
+            pairdata = pairdata.reset_index(drop=True)
+
         pairdata = pairdata.astype(dtype={'open': 'float', 'high': 'float',
                                           'low': 'float', 'close': 'float', 'volume': 'float'})
         pairdata['date'] = to_datetime(pairdata['date'],
@@ -119,6 +137,14 @@ class JsonDataHandler(IDataHandler):
                                        infer_datetime_format=True)
         return pairdata
 
+    def _ohlcv_load_tail(self, tail_filename: Path) -> DataFrame:
+        """
+        Load candles appended to the tail file - one json list per line.
+        """
+        with self._open_tail(tail_filename, 'rt') as f:
+            candles = [rapidjson.loads(line) for line in f if line.strip()]
+        return DataFrame(candles, columns=self._columns)
+
     def ohlcv_append(
         self,
         pair: str,
@@ -127,13 +153,62 @@ class JsonDataHandler(IDataHandler):
         candle_type: CandleType
     ) -> None:
         """
-        Append data to existing data structures
+        Append data to existing data structures.
+        Candles are appended to a tail file (without rewriting the main data file), replacing
+        existing candles with the same date. Once the tail holds more than
+        OHLCV_TAIL_MAX_CANDLES candles, it's merged into the main data file.
         :param pair: Pair
         :param timeframe: Timeframe this ohlcv data is for
         :param data: Data to append.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
-        raise NotImplementedError()
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not filename.exists():
+            self.ohlcv_store(pair, timeframe, data=data, candle_type=candle_type)
+            return
+        if data.empty:
+            return
+
+        _data = data.loc[:, self._columns].copy()
+        # Convert date to int
+        _data['date'] = _data['date'].view(np.int64) // 1000 // 1000
+        tail_filename = self._pair_data_tail_filename(filename)
+        with self._open_tail(tail_filename, 'at') as f:
+            for candle in _data.itertuples(index=False):
+                f.write(rapidjson.dumps([int(candle[0]), *candle[1:]]) + '\n')
+
+        with self._open_tail(tail_filename, 'rt') as f:
+            tail_candles = sum(1 for _ in f)
+        if tail_candles > OHLCV_TAIL_MAX_CANDLES:
+            logger.info(f"Merging {tail_candles} appended candles into {filename}.")
+            pairdata = self._ohlcv_load(pair, timeframe, None, candle_type=candle_type)
+            self.ohlcv_store(pair, timeframe, data=pairdata, candle_type=candle_type)
+
+    def ohlcv_purge(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
+        """
+        Remove data for this pair
+        :param pair: Delete data for this pair.
+        :param timeframe: Timeframe (e.g. "5m")
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: True when deleted, false if file did not exist.
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        tail_filename = self._pair_data_tail_filename(filename)
+        if tail_filename.exists():
+            tail_filename.unlink()
+        return super().ohlcv_purge(pair, timeframe, candle_type)
+
+    @staticmethod
+    def _pair_data_tail_filename(filename: Path) -> Path:
+        return filename.with_name(f"{filename.name}.tail")
+
+    def _open_tail(self, tail_filename: Path, mode: str):
+        """
+        Open the tail file. Zipped tails consist of one gzip member per append.
+        """
+        if self._use_zip:
+            return gzip.open(tail_filename, mode)
+        return tail_filename.open(mode)
 
     @classmethod
     def trades_get_pairs(cls, datadir: Path) -> List[str]:
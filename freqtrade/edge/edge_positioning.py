@@ -1,14 +1,18 @@
 # pragma pylint: disable=W0603
 """ Edge positioning package """
 import logging
+import traceback
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
-from typing import Any, Dict, List, NamedTuple
+from multiprocessing import get_context
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 
 import arrow
 import numpy as np
-import utils_find_1st as utf1st
-from pandas import DataFrame
+from pandas import DataFrame, concat, factorize
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DATETIME_PRINT_FORMAT, UNLIMITED_STAKE_AMOUNT
@@ -68,6 +72,11 @@ class Edge:
         self._since_number_of_days: int = self.edge_config.get('calculate_since_number_of_days', 14)
         self._last_updated: int = 0  # Timestamp of pairs last updated time
         self._refresh_pairs = True
+        # Run calculations in a separate process, without blocking the caller
+        self._background: bool = self.edge_config.get('background_calculation', False)
+        self._process: Optional[BaseProcess] = None
+        # Receiving end of the pipe the calculation process sends its result through
+        self._result_conn: Optional[Connection] = None
 
         self._stoploss_range_min = float(self.edge_config.get('stoploss_range_min', -0.01))
         self._stoploss_range_max = float(self.edge_config.get('stoploss_range_max', -0.05))
@@ -92,6 +101,16 @@ class Edge:
                 self.fee = None
 
     def calculate(self, pairs: List[str]) -> bool:
+        """
+        Recalculate the Edge of pairs, if process_throttle_secs passed since the last calculation.
+        With background_calculation, the calculation runs in a separate process. Results are
+        published once this is called after the calculation finished - until then, the results
+        of the previous calculation remain in use.
+        :return: True if new results are available
+        """
+        if self._process:
+            return self._collect_background_calculation()
+
         if self.fee is None and pairs:
             self.fee = self.exchange.get_fee(pairs[0])
 
@@ -101,6 +120,63 @@ class Edge:
                 self._last_updated + heartbeat > arrow.utcnow().int_timestamp):
             return False
 
+        if self._background:
+            self._start_background_calculation(pairs)
+            return False
+
+        return self._calculate(pairs)
+
+    def _start_background_calculation(self, pairs: List[str]) -> None:
+        # Spawn (instead of fork) - the bot runs other threads (rpc, api server).
+        context = get_context('spawn')
+        self._result_conn, sender = context.Pipe(duplex=False)
+        self._process = context.Process(
+            target=_run_in_process, name='edge_calculation', daemon=True,
+            args=(sender, _calculate_in_process, self.config, pairs, self.fee, self._timerange,
+                  self._cached_pairs))
+        logger.info('Starting Edge calculation in background ...')
+        self._process.start()
+        # Only the calculation process sends - so receiving fails once it exited without result
+        sender.close()
+
+    def _collect_background_calculation(self) -> bool:
+        """
+        Publish the results of the background calculation, if it finished.
+        """
+        if not self._process or not self._result_conn:
+            return False
+        if not self._result_conn.poll() and self._process.is_alive():
+            return False
+        try:
+            result, error = self._result_conn.recv()
+        except EOFError:
+            result, error = None, f'Process exited with code {self._process.exitcode}.'
+        finally:
+            self.cleanup()
+        if error:
+            logger.error(f'Edge calculation failed. {error}')
+            return False
+        success, cached_pairs = result
+        # Replace (not update) cached pairs, so readers always see a complete result
+        self._cached_pairs = cached_pairs
+        if success:
+            self._last_updated = arrow.utcnow().int_timestamp
+        return success
+
+    def cleanup(self) -> None:
+        """
+        Stop the background calculation process (if any)
+        """
+        if self._process:
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process.join()
+            self._process = None
+        if self._result_conn:
+            self._result_conn.close()
+            self._result_conn = None
+
+    def _calculate(self, pairs: List[str]) -> bool:
         data: Dict[str, Any] = {}
         logger.info('Using stake_currency: %s ...', self.config['stake_currency'])
         logger.info('Using local backtesting data (using whitelist in given config) ...')
@@ -141,6 +217,7 @@ class Edge:
             timerange=self._timerange,
             startup_candles=self.strategy.startup_candle_count,
             data_format=self.config.get('dataformat_ohlcv', 'json'),
+            data_load_workers=self.config.get('data_load_workers', 1),
         )
 
         if not data:
@@ -162,21 +239,22 @@ class Edge:
         #  TODO-lev: Should edge support shorts? needs to be investigated further...
         headers = ['date', 'open', 'high', 'low', 'close', 'enter_long', 'exit_long']
 
-        trades: list = []
-        for pair, pair_data in preprocessed.items():
-            # Sorting dataframe by date and reset index
-            pair_data = pair_data.sort_values(by=['date'])
-            pair_data = pair_data.reset_index(drop=True)
-
-            df_analyzed = self.strategy.advise_exit(
-                dataframe=self.strategy.advise_entry(
-                    dataframe=pair_data,
+        def analyze() -> Iterator[Tuple[str, DataFrame]]:
+            for pair, pair_data in preprocessed.items():
+                # Sorting dataframe by date and reset index
+                pair_data = pair_data.sort_values(by=['date'])
+                pair_data = pair_data.reset_index(drop=True)
+
+                yield pair, self.strategy.advise_exit(
+                    dataframe=self.strategy.advise_entry(
+                        dataframe=pair_data,
+                        metadata={'pair': pair}
+                    ),
                     metadata={'pair': pair}
-                ),
-                metadata={'pair': pair}
-            )[headers].copy()
+                )[headers].copy()
 
-            trades += self._find_trades_for_stoploss_range(df_analyzed, pair, self._stoploss_range)
+        trades = [pair_trades for pair_trades in self._find_trades_for_pairs(analyze())
+                  if len(pair_trades)]
 
         # If no trade found then exit
         if len(trades) == 0:
@@ -184,7 +262,8 @@ class Edge:
             return False
 
         # Fill missing, calculable columns, profit, duration , abs etc.
-        trades_df = self._fill_calculable_fields(DataFrame(trades))
+        trades_df = self._fill_calculable_fields(
+            trades[0] if len(trades) == 1 else concat(trades, ignore_index=True))
         self._cached_pairs = self._process_expectancy(trades_df)
         self._last_updated = arrow.utcnow().int_timestamp
 
@@ -279,10 +358,8 @@ class Edge:
         # All returned values are relative, they are defined as ratios.
         stake = 0.015
 
-        result['trade_duration'] = result['close_date'] - result['open_date']
-
-        result['trade_duration'] = result['trade_duration'].map(
-            lambda x: int(x.total_seconds() / 60))
+        result['trade_duration'] = (
+            (result['close_date'] - result['open_date']).dt.total_seconds() / 60).astype(int)
 
         # Spends, Takes, Profit, Absolute Profit
 
@@ -308,10 +385,21 @@ class Edge:
         """
         This calculates WinRate, Required Risk Reward, Risk Reward and Expectancy of all pairs
         The calculation will be done per pair and per strategy.
+        Aggregates are calculated per (pair, stoploss) group using numpy.
         """
+        if results.empty:
+            return {}
+        pair_codes, pair_names = factorize(results['pair'], sort=True)
+        stoploss_codes, stoplosses = factorize(results['stoploss'], sort=True)
+        num_groups = len(pair_names) * len(stoplosses)
+        group = pair_codes * len(stoplosses) + stoploss_codes
+        profit = results['profit_abs'].to_numpy(dtype=float)
+        duration = results['trade_duration'].to_numpy(dtype=float)
+
         # Removing pairs having less than min_trades_number
         min_trades_number = self.edge_config.get('min_trade_number', 10)
-        results = results.groupby(['pair', 'stoploss']).filter(lambda x: len(x) > min_trades_number)
+        keep = np.bincount(group, minlength=num_groups)[group] > min_trades_number
+        group, profit, duration = group[keep], profit[keep], duration[keep]
         ###################################
 
         # Removing outliers (Only Pumps) from the dataset
@@ -320,172 +408,233 @@ class Edge:
         #
         # Removing Pumps
         if self.edge_config.get('remove_pumps', False):
-            results = results[results['profit_abs'] < 2 * results['profit_abs'].std()
-                              + results['profit_abs'].mean()]
+            std = profit.std(ddof=1) if len(profit) > 1 else np.nan
+            keep = profit < 2 * std + profit.mean() if len(profit) else profit > 0
+            group, profit, duration = group[keep], profit[keep], duration[keep]
         ##########################################################################
 
         # Removing trades having a duration more than X minutes (set in config)
         max_trade_duration = self.edge_config.get('max_trade_duration_minute', 1440)
-        results = results[results.trade_duration < max_trade_duration]
+        keep = duration < max_trade_duration
+        group, profit, duration = group[keep], profit[keep], duration[keep]
         #######################################################################
 
-        if results.empty:
+        if len(group) == 0:
             return {}
 
-        groupby_aggregator = {
-            'profit_abs': [
-                ('nb_trades', 'count'),  # number of all trades
-                ('profit_sum', lambda x: x[x > 0].sum()),  # cumulative profit of all winning trades
-                ('loss_sum', lambda x: abs(x[x < 0].sum())),  # cumulative loss of all losing trades
-                ('nb_win_trades', lambda x: x[x > 0].count())  # number of winning trades
-            ],
-            'trade_duration': [('avg_trade_duration', 'mean')]
-        }
-
-        # Group by (pair and stoploss) by applying above aggregator
-        df = results.groupby(['pair', 'stoploss'])[['profit_abs', 'trade_duration']].agg(
-            groupby_aggregator).reset_index(col_level=1)
-
-        # Dropping level 0 as we don't need it
-        df.columns = df.columns.droplevel(0)
-
-        # Calculating number of losing trades, average win and average loss
-        df['nb_loss_trades'] = df['nb_trades'] - df['nb_win_trades']
-        df['average_win'] = np.where(df['nb_win_trades'] == 0, 0.0,
-                                     df['profit_sum'] / df['nb_win_trades'])
-        df['average_loss'] = np.where(df['nb_loss_trades'] == 0, 0.0,
-                                      df['loss_sum'] / df['nb_loss_trades'])
-
-        # Win rate = number of profitable trades / number of trades
-        df['winrate'] = df['nb_win_trades'] / df['nb_trades']
-
-        # risk_reward_ratio = average win / average loss
-        df['risk_reward_ratio'] = df['average_win'] / df['average_loss']
-
-        # required_risk_reward = (1 / winrate) - 1
-        df['required_risk_reward'] = (1 / df['winrate']) - 1
-
-        # expectancy = (risk_reward_ratio * winrate) - (lossrate)
-        df['expectancy'] = (df['risk_reward_ratio'] * df['winrate']) - (1 - df['winrate'])
-
-        # sort by expectancy and stoploss
-        df = df.sort_values(by=['expectancy', 'stoploss'], ascending=False).groupby(
-            'pair').first().sort_values(by=['expectancy'], ascending=False).reset_index()
+        # Aggregate by (pair and stoploss)
+        nb_trades = np.bincount(group, minlength=num_groups)
+        groups = np.flatnonzero(nb_trades)
+        nb_trades = nb_trades[groups]
+        win = profit > 0
+        # number of winning trades
+        nb_win_trades = np.bincount(group, weights=win, minlength=num_groups)[groups]
+        # cumulative profit of all winning trades
+        profit_sum = np.bincount(group, weights=np.where(win, profit, 0.0),
+                                 minlength=num_groups)[groups]
+        # cumulative loss of all losing trades
+        loss_sum = np.abs(np.bincount(group, weights=np.where(profit < 0, profit, 0.0),
+                                      minlength=num_groups)[groups])
+        avg_trade_duration = np.bincount(group, weights=duration,
+                                         minlength=num_groups)[groups] / nb_trades
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Calculating number of losing trades, average win and average loss
+            nb_loss_trades = nb_trades - nb_win_trades
+            average_win = np.where(nb_win_trades == 0, 0.0, profit_sum / nb_win_trades)
+            average_loss = np.where(nb_loss_trades == 0, 0.0, loss_sum / nb_loss_trades)
+
+            # Win rate = number of profitable trades / number of trades
+            winrate = nb_win_trades / nb_trades
+
+            # risk_reward_ratio = average win / average loss
+            risk_reward_ratio = average_win / average_loss
+
+            # required_risk_reward = (1 / winrate) - 1
+            required_risk_reward = (1 / winrate) - 1
+
+            # expectancy = (risk_reward_ratio * winrate) - (lossrate)
+            expectancy = (risk_reward_ratio * winrate) - (1 - winrate)
+
+        # Best stoploss per pair: highest expectancy (NaN last), then highest stoploss
+        group_pairs = groups // len(stoplosses)
+        group_stoplosses = stoplosses.to_numpy(dtype=float)[groups % len(stoplosses)]
+        no_expectancy = np.isnan(expectancy)
+        neg_expectancy = np.where(no_expectancy, 0, -expectancy)
+        order = np.lexsort((-group_stoplosses, neg_expectancy, no_expectancy, group_pairs))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = group_pairs[order][1:] != group_pairs[order][:-1]
+        best = order[first]
+        # sort pairs by expectancy
+        best = best[np.lexsort((neg_expectancy[best], no_expectancy[best]))]
 
         final = {}
-        for x in df.itertuples():
-            final[x.pair] = PairInfo(
-                x.stoploss,
-                x.winrate,
-                x.risk_reward_ratio,
-                x.required_risk_reward,
-                x.expectancy,
-                x.nb_trades,
-                x.avg_trade_duration
-            )
+        for x in zip(group_pairs[best].tolist(), group_stoplosses[best].tolist(),
+                     winrate[best].tolist(), risk_reward_ratio[best].tolist(),
+                     required_risk_reward[best].tolist(), expectancy[best].tolist(),
+                     nb_trades[best].tolist(), avg_trade_duration[best].tolist()):
+            final[pair_names[x[0]]] = PairInfo(*x[1:])
 
         # Returning a list of pairs in order of "expectancy"
         return final
 
-    def _find_trades_for_stoploss_range(self, df, pair, stoploss_range):
-        buy_column = df['enter_long'].values
-        sell_column = df['exit_long'].values
-        date_column = df['date'].values
-        ohlc_columns = df[['open', 'high', 'low', 'close']].values
-
-        result: list = []
-        for stoploss in stoploss_range:
-            result += self._detect_next_stop_or_sell_point(
-                buy_column, sell_column, date_column, ohlc_columns, round(stoploss, 6), pair
-            )
-
-        return result
-
-    def _detect_next_stop_or_sell_point(self, buy_column, sell_column, date_column,
-                                        ohlc_columns, stoploss, pair):
+    def _find_trades_for_pairs(self, analyzed: Iterator[Tuple[str, DataFrame]]
+                               ) -> List[DataFrame]:
         """
-        Iterate through ohlc_columns in order to find the next trade
-        Next trade opens from the first buy signal noticed to
-        The sell or stoploss signal after it.
-        It then cuts OHLC, buy_column, sell_column and date_column.
-        Cut from (the exit trade index) + 1.
-
-        Author: https://github.com/mishaker
+        Find trades over the stoploss range for all (pair, analyzed dataframe) tuples.
+        With edge.calculation_workers > 1, pairs are processed by a pool of processes,
+        while the next pairs are being analyzed.
         """
+        workers = int(self.edge_config.get('calculation_workers', 1))
+        if workers <= 1:
+            return [self._find_trades_for_stoploss_range(df, pair, self._stoploss_range)
+                    for pair, df in analyzed]
+
+        logger.info(f"Calculating trades using {workers} processes.")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(Edge._find_trades_for_stoploss_range,
+                                       df, pair, self._stoploss_range)
+                       for pair, df in analyzed]
+            return [future.result() for future in futures]
+
+    @staticmethod
+    def _find_trades_for_stoploss_range(df: DataFrame, pair: str,
+                                        stoploss_range: Sequence[float]) -> DataFrame:
+        """
+        Find the trades of one pair for every stoploss of stoploss_range.
+        Trades open on the candle after a buy signal, and close when the stoploss is hit -
+        or on the candle after a sell signal. The next trade can only open once
+        the previous one is closed.
+
+        All possible entries are evaluated for all stoplosses at once - the sequence of
+        trades for each stoploss is then followed using the precomputed exits.
+        :return: DataFrame with one row per trade
+        """
+        stoplosses = np.round(np.asarray(stoploss_range, dtype=float), 6)
+        open_rates = df['open'].to_numpy(dtype=float)
+        length = len(open_rates)
+
+        # Trade entry candles (a buy signal on the last candle can't be followed by a trade)
+        buy_index = np.flatnonzero(df['enter_long'].to_numpy() == 1)
+        buy_index = buy_index[buy_index < length - 1]
+        if len(buy_index) == 0 or len(stoplosses) == 0:
+            return DataFrame()
+        open_index = buy_index + 1
+
+        # Stoploss and sell candles, for every entry and stoploss. length if never hit.
+        stop_prices = open_rates[open_index, None] * (stoplosses[None, :] + 1)
+        stop_index = _find_first_below(
+            df['low'].to_numpy(dtype=float),
+            np.repeat(open_index, len(stoplosses)), stop_prices.ravel()
+        ).reshape(stop_prices.shape)
+        sell_candles = np.append(np.flatnonzero(df['exit_long'].to_numpy() == 1), length)
+        sell_index = sell_candles[np.searchsorted(sell_candles, open_index)][:, None]
+
+        # If exit is SELL then we exit at the next candle
+        is_stop = stop_index <= sell_index
+        exit_index = np.where(is_stop, stop_index, sell_index + 1)
+        # Trades without any stop or sell point (or selling after the last candle) remain open.
+        # They are not interesting for Edge, and no trade can follow.
+        exit_index[((stop_index == length) & (sell_index == length))
+                   | (exit_index > length - 1)] = -1
+
+        # Follow the trades for each stoploss - the next trade is opened by the first buy signal
+        # on (or after) the exit candle.
+        next_entry = np.searchsorted(buy_index, np.arange(length + 1)).tolist()
+        trade_entries: List[int] = []
+        trade_stoplosses: List[int] = []
+        for stoploss_idx, exits in enumerate(exit_index.T.tolist()):
+            entry = next_entry[0]
+            while entry < len(buy_index) and exits[entry] >= 0:
+                trade_entries.append(entry)
+                trade_stoplosses.append(stoploss_idx)
+                entry = next_entry[exits[entry]]
+
+        if not trade_entries:
+            return DataFrame()
+        entries = np.array(trade_entries)
+        sl_idx = np.array(trade_stoplosses)
+        trade_exits = exit_index[entries, sl_idx]
+        trade_is_stop = is_stop[entries, sl_idx]
+        dates = df['date'].values
+        close_rates = np.where(trade_is_stop, stop_prices[entries, sl_idx],
+                               open_rates[trade_exits])
+
+        return DataFrame({
+            'pair': pair,
+            'stoploss': stoplosses[sl_idx],
+            'open_date': dates[open_index[entries]],
+            'close_date': dates[trade_exits],
+            'open_rate': np.round(open_rates[open_index[entries]], 15),
+            'close_rate': np.round(close_rates, 15),
+            'exit_type': np.array([SellType.SELL_SIGNAL, SellType.STOP_LOSS],
+                                  dtype=object)[trade_is_stop.astype(int)],
+        })
+
+
+def _run_in_process(conn: Connection, func: Callable, *args) -> None:
+    """
+    Target of the background calculation process:
+    Send the result of func(*args) - or the error it raised - through conn.
+    """
+    try:
+        conn.send((func(*args), None))
+    except Exception:
+        conn.send((None, traceback.format_exc()))
+    finally:
+        conn.close()
 
-        result: list = []
-        start_point = 0
-
-        while True:
-            open_trade_index = utf1st.find_1st(buy_column, 1, utf1st.cmp_equal)
-
-            # Return empty if we don't find trade entry (i.e. buy==1) or
-            # we find a buy but at the end of array
-            if open_trade_index == -1 or open_trade_index == len(buy_column) - 1:
-                break
-            else:
-                # When a buy signal is seen,
-                # trade opens in reality on the next candle
-                open_trade_index += 1
-
-            open_price = ohlc_columns[open_trade_index, 0]
-            stop_price = (open_price * (stoploss + 1))
-
-            # Searching for the index where stoploss is hit
-            stop_index = utf1st.find_1st(
-                ohlc_columns[open_trade_index:, 2], stop_price, utf1st.cmp_smaller)
-
-            # If we don't find it then we assume stop_index will be far in future (infinite number)
-            if stop_index == -1:
-                stop_index = float('inf')
-
-            # Searching for the index where sell is hit
-            sell_index = utf1st.find_1st(sell_column[open_trade_index:], 1, utf1st.cmp_equal)
-
-            # If we don't find it then we assume sell_index will be far in future (infinite number)
-            if sell_index == -1:
-                sell_index = float('inf')
-
-            # Check if we don't find any stop or sell point (in that case trade remains open)
-            # It is not interesting for Edge to consider it so we simply ignore the trade
-            # And stop iterating there is no more entry
-            if stop_index == sell_index == float('inf'):
-                break
-
-            if stop_index <= sell_index:
-                exit_index = open_trade_index + stop_index
-                exit_type = SellType.STOP_LOSS
-                exit_price = stop_price
-            elif stop_index > sell_index:
-                # If exit is SELL then we exit at the next candle
-                exit_index = open_trade_index + sell_index + 1
-
-                # Check if we have the next candle
-                if len(ohlc_columns) - 1 < exit_index:
-                    break
-
-                exit_type = SellType.SELL_SIGNAL
-                exit_price = ohlc_columns[exit_index, 0]
-
-            trade = {'pair': pair,
-                     'stoploss': stoploss,
-                     'profit_ratio': '',
-                     'profit_abs': '',
-                     'open_date': date_column[open_trade_index],
-                     'close_date': date_column[exit_index],
-                     'trade_duration': '',
-                     'open_rate': round(open_price, 15),
-                     'close_rate': round(exit_price, 15),
-                     'exit_type': exit_type
-                     }
-
-            result.append(trade)
-
-            # Giving a view of exit_index till the end of array
-            buy_column = buy_column[exit_index:]
-            sell_column = sell_column[exit_index:]
-            date_column = date_column[exit_index:]
-            ohlc_columns = ohlc_columns[exit_index:]
-            start_point += exit_index
 
-        return result
+def _calculate_in_process(config: Dict[str, Any], pairs: List[str], fee: Optional[float],
+                          timerange: TimeRange, cached_pairs: Dict[str, Any]
+                          ) -> Tuple[bool, Dict[str, Any]]:
+    """
+    Run Edge.calculate() in a separate process, using its own exchange and strategy instances.
+    :param cached_pairs: Current results - kept if no new results are calculated
+    :return: Tuple of (calculation result, calculated pairs)
+    """
+    from freqtrade.data.dataprovider import DataProvider
+    from freqtrade.loggers import setup_logging_pre
+    from freqtrade.resolvers import ExchangeResolver, StrategyResolver
+
+    setup_logging_pre()
+    exchange = ExchangeResolver.load_exchange(config['exchange']['name'], config, validate=False)
+    try:
+        strategy = StrategyResolver.load_strategy(config)
+        strategy.dp = DataProvider(config, exchange)
+        edge = Edge(config, exchange, strategy)
+        edge.fee = fee
+        edge._timerange = timerange
+        edge._cached_pairs = cached_pairs
+        return edge._calculate(pairs), edge._cached_pairs
+    finally:
+        exchange.close()
+
+
+def _find_first_below(values: np.ndarray, starts: np.ndarray,
+                      thresholds: np.ndarray) -> np.ndarray:
+    """
+    For each start index and threshold, find the first index >= start
+    with a value below threshold.
+    Uses a sparse table of range minimums, so all lookups are done in log2(len(values)) steps.
+    :return: Array of indexes - len(values) where no value is below the threshold.
+    """
+    length = len(values)
+    values = np.where(np.isnan(values), np.inf, values)
+    # levels[k][i] is the minimum of values[i:i + 2**k]
+    levels = [values]
+    while 2 ** len(levels) <= length:
+        half = 2 ** (len(levels) - 1)
+        levels.append(np.minimum(levels[-1][:-half], levels[-1][half:]))
+
+    # Skip ranges without a value below threshold, from the largest range size down
+    pos = starts.astype(np.int64)
+    for size_exp in range(len(levels) - 1, -1, -1):
+        level = levels[size_exp]
+        valid = pos < len(level)
+        skip = valid & (level[np.where(valid, pos, 0)] >= thresholds)
+        pos = pos + skip * 2 ** size_exp
+
+    found = pos < length
+    found[found] = values[pos[found]] < thresholds[found]
+    return np.where(found, pos, length)
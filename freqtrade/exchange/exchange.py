@@ -21,7 +21,8 @@ from pandas import DataFrame
 
 from freqtrade.constants import (DEFAULT_AMOUNT_RESERVE_PERCENT, NON_OPEN_EXCHANGE_STATES,
                                  ListPairsWithTimeframes, PairWithTimeframe)
-from freqtrade.data.converter import ohlcv_to_dataframe, trades_dict_to_list
+from freqtrade.data.converter import (ohlcv_append_to_dataframe, ohlcv_to_dataframe,
+                                      trades_dict_to_list)
 from freqtrade.enums import CandleType, Collateral, TradingMode
 from freqtrade.exceptions import (DDosProtection, ExchangeError, InsufficientFundsError,
                                   InvalidOrderException, OperationalException, PricingError,
@@ -108,6 +109,9 @@ class Exchange:
         # refreshed once every iteration.
         self._sell_rate_cache: TTLCache = TTLCache(maxsize=100, ttl=1800)
         self._buy_rate_cache: TTLCache = TTLCache(maxsize=100, ttl=1800)
+        # Pricing data fetched for all pairs at once (see refresh_rates())
+        self._rate_tickers: Dict[str, Dict] = {}
+        self._rate_order_books: Dict[str, Dict] = {}
 
         # Holds candles
         self._klines: Dict[PairWithTimeframe, DataFrame] = {}
@@ -121,6 +125,7 @@ class Exchange:
         logger.info(f"Using CCXT {ccxt.__version__}")
         exchange_config = config['exchange']
         self.log_responses = exchange_config.get('log_responses', False)
+        self._batch_pricing = exchange_config.get('batch_pricing', False)
 
         # Deep merge ft_has with default ft_has options
         self._ft_has = deep_merge_dicts(self._ft_has, deepcopy(self._ft_has_default))
@@ -279,6 +284,11 @@ class Exchange:
         """exchange ccxt precisionMode"""
         return self._api.precisionMode
 
+    @property
+    def batch_pricing(self) -> bool:
+        """Fetch pricing data for all pairs at once with refresh_rates()"""
+        return self._batch_pricing
+
     def _log_exchange_response(self, endpoint, response) -> None:
         """ Log exchange responses """
         if self.log_responses:
@@ -1192,6 +1202,83 @@ class Exchange:
         except ccxt.BaseError as e:
             raise OperationalException(e) from e
 
+    @retrier_async
+    async def _async_fetch_l2_order_book(self, pair: str, limit: int) -> Tuple[str, dict]:
+        """
+        Asynchronously get L2 order book (limit must be supported by the exchange)
+        returns tuple: (pair, order_book)
+        """
+        try:
+            return pair, await self._api_async.fetch_l2_order_book(pair, limit)
+        except ccxt.NotSupported as e:
+            raise OperationalException(
+                f'Exchange {self._api.name} does not support fetching order book.'
+                f'Message: {e}') from e
+        except ccxt.DDoSProtection as e:
+            raise DDosProtection(e) from e
+        except (ccxt.NetworkError, ccxt.ExchangeError) as e:
+            raise TemporaryError(
+                f'Could not get order book for pair {pair} due to {e.__class__.__name__}. '
+                f'Message: {e}') from e
+        except ccxt.BaseError as e:
+            raise OperationalException(e) from e
+
+    def fetch_l2_order_books(self, pairs: List[str], limit: int = 100) -> Dict[str, dict]:
+        """
+        Get L2 order books of all pairs asynchronously (semi-parallel).
+        Pairs for which fetching the order book failed are missing from the result.
+        :return: Dict of {pair: order_book}, in the format of fetch_l2_order_book()
+        """
+        limit1 = self.get_next_limit_in_list(limit, self._ft_has['l2_limit_range'],
+                                             self._ft_has['l2_limit_range_required'])
+        input_coroutines = [self._async_fetch_l2_order_book(pair, limit1) for pair in pairs]
+        order_books = {}
+        # Chunk requests into batches of 100 to avoid overwelming ccxt Throttling
+        for input_coro in chunks(input_coroutines, 100):
+            async def gather_stuff():
+                return await asyncio.gather(*input_coro, return_exceptions=True)
+
+            results = self.loop.run_until_complete(gather_stuff())
+
+            for res in results:
+                if isinstance(res, Exception):
+                    logger.warning(f"Async code raised an exception: {repr(res)}")
+                    continue
+                pair, order_book = res
+                order_books[pair] = order_book
+        return order_books
+
+    def refresh_rates(self, pairs: List[str]) -> None:
+        """
+        Fetch pricing data for many pairs at once, if `exchange.batch_pricing` is enabled:
+        All tickers with one call (if tickers are used for pricing),
+        and the order books of the given pairs asynchronously (if order books are used).
+        get_rate() uses this data, instead of fetching it per pair, until clear_rates() is called.
+        :param pairs: Pairs to fetch order books for
+        """
+        self.clear_rates()
+        if not self._batch_pricing:
+            return
+        order_book_tops = [
+            conf.get('order_book_top', 1)
+            for conf in (self._config.get('bid_strategy', {}), self._config.get('ask_strategy', {}))
+            if conf.get('use_order_book', False)
+        ]
+        try:
+            if len(order_book_tops) < 2 and self.exchange_has('fetchTickers'):
+                self._rate_tickers = self.get_tickers()
+        except (TemporaryError, OperationalException) as e:
+            logger.warning(f"Could not fetch tickers for pricing, fetching them per pair. {e}")
+        if order_book_tops and pairs:
+            self._rate_order_books = self.fetch_l2_order_books(pairs, max(order_book_tops))
+
+    def clear_rates(self) -> None:
+        """
+        Forget the pricing data fetched by refresh_rates()
+        """
+        self._rate_tickers = {}
+        self._rate_order_books = {}
+
     def get_rate(self, pair: str, refresh: bool, side: str) -> float:
         """
         Calculates bid/ask target
@@ -1200,6 +1287,8 @@ class Exchange:
         or remain static in any other case since it's not updating.
         :param pair: Pair to get rate for
         :param refresh: allow cached data
+            With `exchange.batch_pricing`, refresh=True means "refresh per bot iteration":
+            the tickers / order books fetched by refresh_rates() are used until clear_rates().
         :param side: "buy" or "sell"
         :return: float: Price
         :raises PricingError if orderbook price could not be determined.
@@ -1219,7 +1308,8 @@ class Exchange:
         if conf_strategy.get('use_order_book', False) and ('use_order_book' in conf_strategy):
 
             order_book_top = conf_strategy.get('order_book_top', 1)
-            order_book = self.fetch_l2_order_book(pair, order_book_top)
+            order_book = (self._rate_order_books.get(pair)
+                          or self.fetch_l2_order_book(pair, order_book_top))
             logger.debug('order_book %s', order_book)
             # top 1 = index 0
             try:
@@ -1235,7 +1325,7 @@ class Exchange:
                          f"side - top {order_book_top} order book {side} rate {rate:.8f}")
         else:
             logger.debug(f"Using Last {conf_strategy['price_side'].capitalize()} / Last Price")
-            ticker = self.fetch_ticker(pair)
+            ticker = self._rate_tickers.get(pair) or self.fetch_ticker(pair)
             ticker_rate = ticker[conf_strategy['price_side']]
             if ticker['last'] and ticker_rate:
                 if side == 'buy' and ticker_rate > ticker['last']:
@@ -1515,16 +1605,8 @@ class Exchange:
                     continue
                 # Deconstruct tuple (has 4 elements)
                 pair, timeframe, c_type, ticks = res
-                # keeping last candle time as last refreshed time of the pair
-                if ticks:
-                    self._pairs_last_refresh_time[(pair, timeframe, c_type)] = ticks[-1][0] // 1000
-                # keeping parsed dataframe in cache
-                ohlcv_df = ohlcv_to_dataframe(
-                    ticks, timeframe, pair=pair, fill_missing=True,
-                    drop_incomplete=drop_incomplete)
-                results_df[(pair, timeframe, c_type)] = ohlcv_df
-                if cache:
-                    self._klines[(pair, timeframe, c_type)] = ohlcv_df
+                results_df[(pair, timeframe, c_type)] = self._process_ohlcv_df(
+                    pair, timeframe, c_type, ticks, cache, drop_incomplete)
         # Return cached klines
         for pair, timeframe, c_type in cached_pairs:
             results_df[(pair, timeframe, c_type)] = self.klines(
@@ -1534,6 +1616,26 @@ class Exchange:
 
         return results_df
 
+    def _process_ohlcv_df(self, pair: str, timeframe: str, c_type: CandleType, ticks: List,
+                          cache: bool, drop_incomplete: bool) -> DataFrame:
+        # keeping last candle time as last refreshed time of the pair
+        if ticks:
+            self._pairs_last_refresh_time[(pair, timeframe, c_type)] = ticks[-1][0] // 1000
+        # keeping parsed dataframe in cache
+        ohlcv_df = None
+        if cache and (pair, timeframe, c_type) in self._klines:
+            # Only convert candles newer than the cached ones
+            ohlcv_df = ohlcv_append_to_dataframe(
+                self._klines[(pair, timeframe, c_type)], ticks, timeframe,
+                drop_incomplete=drop_incomplete)
+        if ohlcv_df is None:
+            ohlcv_df = ohlcv_to_dataframe(
+                ticks, timeframe, pair=pair, fill_missing=True,
+                drop_incomplete=drop_incomplete)
+        if cache:
+            self._klines[(pair, timeframe, c_type)] = ohlcv_df
+        return ohlcv_df
+
     def _now_is_time_to_refresh(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
         # Timeframe in seconds
         interval_in_sec = timeframe_to_seconds(timeframe)
@@ -161,6 +161,8 @@ class FreqtradeBot(LoggingMixin):
         self.check_for_open_trades()
 
         self.rpc.cleanup()
+        if self.edge:
+            self.edge.cleanup()
         cleanup_db()
         self.exchange.close()
 
@@ -203,26 +205,49 @@ class FreqtradeBot(LoggingMixin):
 
         self.strategy.analyze(self.active_pair_whitelist)
 
-        with self._exit_lock:
-            # Check and handle any timed out open orders
-            self.check_handle_timedout()
+        self._process_trades()
 
-        # Protect from collisions with forceexit.
-        # Without this, freqtrade my try to recreate stoploss_on_exchange orders
-        # while exiting is in process, since telegram messages arrive in an different thread.
-        with self._exit_lock:
-            trades = Trade.get_open_trades()
-            # First process current opened trades (positions)
-            self.exit_positions(trades)
+    def process_between_candles(self) -> None:
+        """
+        Lighter bot iteration, used between candle closes if `internals.process_on_candle_close`
+        is enabled.
+        Handles open orders, open trades and entries like process() - but doesn't refresh
+        whitelist and candles, and uses the analysis of the last closed candle.
+        """
+        strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)()
 
-        # Check if we need to adjust our current positions before attempting to buy new trades.
-        if self.strategy.position_adjustment_enable:
+        self._process_trades()
+
+    def _process_trades(self) -> None:
+        """
+        Handle open orders and open trades, and look for entries - based on the current analysis.
+        """
+        if self.exchange.batch_pricing:
+            # Fetch prices for all open trades at once
+            self.exchange.refresh_rates([trade.pair for trade in Trade.get_open_trades()])
+        try:
             with self._exit_lock:
-                self.process_open_trade_positions()
+                # Check and handle any timed out open orders
+                self.check_handle_timedout()
 
-        # Then looking for buy opportunities
-        if self.get_free_open_trades():
-            self.enter_positions()
+            # Protect from collisions with forceexit.
+            # Without this, freqtrade my try to recreate stoploss_on_exchange orders
+            # while exiting is in process, since telegram messages arrive in an different thread.
+            with self._exit_lock:
+                trades = Trade.get_open_trades()
+                # First process current opened trades (positions)
+                self.exit_positions(trades)
+
+            # Check if we need to adjust our current positions before attempting to buy new trades.
+            if self.strategy.position_adjustment_enable:
+                with self._exit_lock:
+                    self.process_open_trade_positions()
+
+            # Then looking for buy opportunities
+            if self.get_free_open_trades():
+                self.enter_positions()
+        finally:
+            self.exchange.clear_rates()
         if self.trading_mode == TradingMode.FUTURES:
             self._schedule.run_pending()
         Trade.commit()
@@ -9,8 +9,9 @@ from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 from numpy import nan
-from pandas import DataFrame
+from pandas import DataFrame, Timestamp
 
 from freqtrade import constants
 from freqtrade.configuration import TimeRange, validate_config_consistency
@@ -31,6 +32,7 @@ from freqtrade.persistence import LocalTrade, Order, PairLocks, Trade
 from freqtrade.plugins.pairlistmanager import PairListManager
 from freqtrade.plugins.protectionmanager import ProtectionManager
 from freqtrade.resolvers import ExchangeResolver, StrategyResolver
+from freqtrade.strategy.hyper import indicator_cache
 from freqtrade.strategy.interface import IStrategy, SellCheckTuple
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
 from freqtrade.wallets import Wallets
@@ -51,6 +53,14 @@ ESHORT_IDX = 8  # Exit short
 ENTER_TAG_IDX = 9
 EXIT_TAG_IDX = 10
 
+# Relative tolerance used by the vectorized engine when pre-selecting exit candidates.
+# Candidates are a superset of the real exits - should_exit() still makes the final decision.
+EXIT_CANDIDATE_TOLERANCE = 1e-6
+# Number of rows the search for the next exit candidate starts with.
+# The window doubles until a candidate is found - so the cost depends on the distance
+# to the candidate, not on the number of remaining rows.
+EXIT_CANDIDATE_WINDOW = 64
+
 
 class Backtesting:
     """
@@ -61,8 +71,14 @@ class Backtesting:
     backtesting.start()
     """
 
+    # Token of the most recently created instance - only this one may reset the global
+    # state (PairLocks / Trade.use_db) when garbage-collected.
+    _active_token: Optional[object] = None
+
     def __init__(self, config: Dict[str, Any]) -> None:
 
+        self._token = object()
+        Backtesting._active_token = self._token
         LoggingMixin.show_output = False
         self.config = config
         self.results: Dict[str, Any] = {}
@@ -129,13 +145,17 @@ class Backtesting:
         # TODO-lev: combination of config/strategy "use_shorts"(?) and "can_short" from the exchange
         self.trading_mode = TradingMode(config.get('trading_mode', 'spot'))
         self._can_short = self.trading_mode != TradingMode.SPOT
+        self.backtest_engine = self.config.get('backtest_engine',
+                                               constants.BACKTEST_ENGINE_DEFAULT)
 
         self.progress = BTProgress()
         self.abort = False
         self.init_backtest()
 
     def __del__(self):
-        self.cleanup()
+        # A stale instance must not re-enable the database while another one is backtesting.
+        if Backtesting._active_token is getattr(self, '_token', None):
+            self.cleanup()
 
     def cleanup(self):
         LoggingMixin.show_output = True
@@ -154,6 +174,8 @@ class Backtesting:
         else:
             self.timeframe_detail_min = 0
         self.detail_data: Dict[str, DataFrame] = {}
+        # Per-pair lookup structures for detail_data - see _get_detail_rows()
+        self._detail_index: Dict[str, Tuple[DataFrame, np.ndarray, np.ndarray]] = {}
         self.futures_data: Dict[str, DataFrame] = {}
 
     def init_backtest(self):
@@ -201,7 +223,8 @@ class Backtesting:
             startup_candles=self.required_startup,
             fail_without_data=True,
             data_format=self.config.get('dataformat_ohlcv', 'json'),
-            candle_type=self.config.get('candle_type_def', CandleType.SPOT)
+            candle_type=self.config.get('candle_type_def', CandleType.SPOT),
+            data_load_workers=self.config.get('data_load_workers', 1),
         )
 
         min_date, max_date = history.get_timerange(data)
@@ -230,10 +253,12 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config.get('dataformat_ohlcv', 'json'),
+                data_load_workers=self.config.get('data_load_workers', 1),
                 candle_type=self.config.get('candle_type_def', CandleType.SPOT)
             )
         else:
             self.detail_data = {}
+        self._detail_index = {}
         if self.trading_mode == TradingMode.FUTURES:
             # Load additional futures data.
             funding_rates_dict = history.load_data(
@@ -244,6 +269,7 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config.get('dataformat_ohlcv', 'json'),
+                data_load_workers=self.config.get('data_load_workers', 1),
                 candle_type=CandleType.FUNDING_RATE
             )
 
@@ -256,6 +282,7 @@ class Backtesting:
                 startup_candles=0,
                 fail_without_data=True,
                 data_format=self.config.get('dataformat_ohlcv', 'json'),
+                data_load_workers=self.config.get('data_load_workers', 1),
                 candle_type=CandleType.from_string(self.exchange._ft_has["mark_ohlcv_price"])
             )
             # Combine data to avoid combining the data per trade.
@@ -276,6 +303,12 @@ class Backtesting:
         PairLocks.reset_locks()
         Trade.reset_trades()
         self.rejected_trades = 0
+        self._bt_arrays: Dict[str, Dict[str, np.ndarray]] = {}
+        self._bt_dates: Dict[str, np.ndarray] = {}
+        self._entry_signal_dates = np.array([], dtype=np.int64)
+        self._idle_skip_enabled = False
+        self._exit_checks: Dict[LocalTrade, Tuple[Optional[int], int]] = {}
+        self._exit_candidates_enabled = False
         self.dataprovider.clear_cache()
         if enable_protections:
             self._load_protections(self.strategy)
@@ -303,6 +336,7 @@ class Backtesting:
         headers = ['date', 'open', 'high', 'low', 'close', 'enter_long', 'exit_long',
                    'enter_short', 'exit_short', 'enter_tag', 'exit_tag']
         data: Dict = {}
+        signal_dates: List[np.ndarray] = []
         self.progress.init_step(BacktestState.CONVERT, len(processed))
 
         # Create dict with data
@@ -338,11 +372,174 @@ class Backtesting:
 
             df_analyzed = df_analyzed.drop(df_analyzed.head(1).index)
 
+            # Aligned arrays - row i matches data[pair][i]
+            dates = self._bt_dates[pair] = df_analyzed['date'].values.astype(np.int64)
+            entry = df_analyzed['enter_long'].values == 1
+            if self._can_short:
+                entry |= df_analyzed['enter_short'].values == 1
+            signal_dates.append(dates[entry])
+
+            if self.backtest_engine == 'vectorized':
+                self._bt_arrays[pair] = {
+                    'date': dates,
+                    'high': df_analyzed['high'].values.astype(np.float64),
+                    'low': df_analyzed['low'].values.astype(np.float64),
+                    'exit_long': df_analyzed['exit_long'].values.astype(np.float64),
+                }
+
             # Convert from Pandas to list for performance reasons
             # (Looping Pandas is slow.)
             data[pair] = df_analyzed[headers].values.tolist()
+
+        if signal_dates:
+            self._entry_signal_dates = np.unique(np.concatenate(signal_dates))
         return data
 
+    def _prepare_idle_skip(self, start_date: datetime) -> None:
+        """
+        Skipping idle candles requires every row to be processed on the time-counter step
+        matching its date - so candle dates must be aligned to the backtest timeframe.
+        """
+        start_ts = int(start_date.timestamp()) * 1_000_000_000
+        timeframe_ns = self.timeframe_min * 60_000_000_000
+        self._idle_skip_enabled = all(
+            ((dates - start_ts) % timeframe_ns == 0).all() and (np.diff(dates) > 0).all()
+            for dates in self._bt_dates.values()
+        )
+
+    def _skip_idle_candles(self, tmp: datetime, end_date: datetime, open_trade_count: int,
+                           indexes: Dict[str, int]) -> datetime:
+        """
+        Without open trades, only candles with an entry signal can change the backtest state.
+        Move the time-counter (and the per-pair row indexes) forward to the next candle
+        with an entry signal for any pair - or past end_date if there is none.
+        :return: new time-counter
+        """
+        if open_trade_count > 0 or not self._idle_skip_enabled:
+            return tmp
+        tmp_ts = int(tmp.timestamp()) * 1_000_000_000
+        timeframe_ns = self.timeframe_min * 60_000_000_000
+        pos = np.searchsorted(self._entry_signal_dates, tmp_ts, side='left')
+        if pos < len(self._entry_signal_dates):
+            next_event = int(self._entry_signal_dates[pos])
+        else:
+            next_event = int(end_date.timestamp()) * 1_000_000_000 + timeframe_ns
+        # Round up to the time-counter grid
+        steps = -((tmp_ts - next_event) // timeframe_ns)
+        if steps <= 0:
+            return tmp
+        tmp += timedelta(minutes=self.timeframe_min * steps)
+        self.progress.increment(steps)
+        tmp_ts += steps * timeframe_ns
+        for pair, dates in self._bt_dates.items():
+            # Rows before the new time-counter are considered processed
+            row_index = indexes[pair] = int(np.searchsorted(dates, tmp_ts, side='left'))
+            if row_index > 0 and dates[row_index - 1] == tmp_ts - timeframe_ns:
+                # Row would have been processed in the last skipped step
+                self.dataprovider._set_dataframe_max_index(row_index)
+        return tmp
+
+    def _use_exit_candidates(self) -> bool:
+        """
+        Exit candidates can only be precomputed if should_exit() depends on nothing but
+        the candle data, the (static) stoploss and the ROI table.
+        Strategies using callbacks which may change this on every candle
+        fall back to evaluating every candle.
+        """
+        strategy = self.strategy
+        return (
+            self.backtest_engine == 'vectorized'
+            and self.trading_mode == TradingMode.SPOT
+            and not self.timeframe_detail
+            and not strategy.trailing_stop
+            and not strategy.use_custom_stoploss
+            and not strategy.position_adjustment_enable
+            and (not strategy.use_sell_signal
+                 or type(strategy).custom_sell is IStrategy.custom_sell)
+        )
+
+    def _prepare_exit_candidates(self) -> None:
+        """
+        Called once per backtest() - enables exit candidates if possible and converts the
+        ROI table to sorted arrays (minutes, roi) for vectorized lookups.
+        """
+        self._exit_candidates_enabled = self._use_exit_candidates()
+        roi = sorted(self.strategy.minimal_roi.items())
+        self._roi_minutes = np.array([int(k) for k, _ in roi], dtype=np.int64)
+        self._roi_values = np.array([v for _, v in roi], dtype=np.float64)
+
+    def _next_exit_candidate(self, trade: LocalTrade, start: int) -> int:
+        """
+        Find the first row (starting at `start`) where should_exit() could trigger
+        for this trade - based on stoploss, ROI and exit signals.
+        Rows are checked in growing windows, stopping at the first window with a candidate.
+        :return: row index of the candidate, or the length of the data if there is none.
+        """
+        length = len(self._bt_arrays[trade.pair]['high'])
+        window = EXIT_CANDIDATE_WINDOW
+        while start < length:
+            end = min(start + window, length)
+            hits = np.flatnonzero(self._exit_candidates(trade, start, end))
+            if len(hits):
+                return start + int(hits[0])
+            start = end
+            window *= 2
+        return length
+
+    def _exit_candidates(self, trade: LocalTrade, start: int, end: int) -> np.ndarray:
+        """
+        Boolean mask of the rows [start, end) where should_exit() could trigger for this trade.
+        """
+        arrays = self._bt_arrays[trade.pair]
+        candidate = arrays['low'][start:end] <= trade.stop_loss * (1 + EXIT_CANDIDATE_TOLERANCE)
+        if self.strategy.use_sell_signal:
+            candidate |= arrays['exit_long'][start:end] == 1
+        if len(self._roi_minutes):
+            open_ts = int(trade.open_date_utc.timestamp()) * 1_000_000_000
+            trade_dur = (arrays['date'][start:end] - open_ts) // 60_000_000_000
+            roi_idx = np.searchsorted(self._roi_minutes, trade_dur, side='right') - 1
+            roi = self._roi_values[np.maximum(roi_idx, 0)]
+            # Rate at which calc_profit_ratio() reaches the ROI value
+            roi_rate = ((1 + roi) * trade.open_trade_value
+                        / (trade.amount * (1 - trade.fee_close)))
+            high = arrays['high'][start:end]
+            candidate |= (roi_idx >= 0) & (high >= roi_rate * (1 - EXIT_CANDIDATE_TOLERANCE))
+        return candidate
+
+    def _sync_min_max_rates(self, trade: LocalTrade, start: int, end: int) -> None:
+        """
+        Apply high / low of skipped candles [start, end) to the trade's max_rate / min_rate.
+        """
+        if end > start:
+            arrays = self._bt_arrays[trade.pair]
+            trade.adjust_min_max_rates(float(arrays['high'][start:end].max()),
+                                       float(arrays['low'][start:end].min()))
+
+    def _sync_skipped_candles(self, indexes: Dict[str, int]) -> None:
+        """
+        Apply skipped candles to trades which are still open at the end of the backtest.
+        """
+        for trade, (_, synced) in self._exit_checks.items():
+            self._sync_min_max_rates(trade, synced, indexes[trade.pair])
+
+    def _skip_exit_check(self, trade: LocalTrade, row_index: int) -> bool:
+        """
+        Vectorized engine: Determine if the exit-check for this candle can be skipped,
+        as no exit condition can be reached on this candle.
+        """
+        if not self._exit_candidates_enabled:
+            return False
+        next_check, synced = self._exit_checks.get(trade, (None, row_index))
+        if next_check is None:
+            next_check = self._next_exit_candidate(trade, row_index)
+        if row_index < next_check:
+            self._exit_checks[trade] = (next_check, synced)
+            return True
+        self._sync_min_max_rates(trade, synced, row_index)
+        # Candle is evaluated by should_exit() - search for the next candidate afterwards.
+        self._exit_checks[trade] = (None, row_index + 1)
+        return False
+
     def _get_close_rate(self, sell_row: Tuple, trade: LocalTrade, sell: SellCheckTuple,
                         trade_dur: int) -> float:
         """
@@ -493,6 +690,30 @@ class Backtesting:
 
         return None
 
+    def _get_detail_rows(self, pair: str, candle_time: datetime) -> List[List]:
+        """
+        Get the detail candles (date, open, high, low, close) covering the candle
+        starting at candle_time.
+        Dates (as int64 nanoseconds) and OHLC values (as float64 array of shape (n, 4)) are
+        extracted once per pair (and whenever the dataframe is replaced), so each lookup is
+        a binary search - and only the rows of this candle are converted to lists.
+        """
+        detail_data = self.detail_data[pair]
+        cached = self._detail_index.get(pair)
+        if cached is None or cached[0] is not detail_data:
+            cached = (
+                detail_data,
+                detail_data['date'].values.astype('datetime64[ns]').view('int64'),
+                detail_data[['open', 'high', 'low', 'close']].to_numpy(dtype=np.float64),
+            )
+            self._detail_index[pair] = cached
+        _, dates_ns, ohlc = cached
+        start_ns = Timestamp(candle_time).value
+        end_ns = start_ns + self.timeframe_min * 60 * 1_000_000_000
+        start, end = dates_ns.searchsorted([start_ns, end_ns])
+        return [[Timestamp(date, tz='UTC'), *values] for date, values in zip(
+            dates_ns[start:end].tolist(), ohlc[start:end].tolist())]
+
     def _get_sell_trade_entry(self, trade: LocalTrade, sell_row: Tuple) -> Optional[LocalTrade]:
         sell_candle_time: datetime = sell_row[DATE_IDX].to_pydatetime()
 
@@ -507,26 +728,15 @@ class Backtesting:
             )
 
         if self.timeframe_detail and trade.pair in self.detail_data:
-            sell_candle_end = sell_candle_time + timedelta(minutes=self.timeframe_min)
-
-            detail_data = self.detail_data[trade.pair]
-            detail_data = detail_data.loc[
-                (detail_data['date'] >= sell_candle_time) &
-                (detail_data['date'] < sell_candle_end)
-            ].copy()
-            if len(detail_data) == 0:
+            detail_rows = self._get_detail_rows(trade.pair, sell_candle_time)
+            if not detail_rows:
                 # Fall back to "regular" data if no detail data was found for this candle
                 return self._get_sell_trade_entry_for_candle(trade, sell_row)
-            detail_data.loc[:, 'enter_long'] = sell_row[LONG_IDX]
-            detail_data.loc[:, 'exit_long'] = sell_row[ELONG_IDX]
-            detail_data.loc[:, 'enter_long'] = sell_row[LONG_IDX]
-            detail_data.loc[:, 'exit_long'] = sell_row[ELONG_IDX]
-            detail_data.loc[:, 'enter_tag'] = sell_row[ENTER_TAG_IDX]
-            detail_data.loc[:, 'exit_tag'] = sell_row[EXIT_TAG_IDX]
-            headers = ['date', 'open', 'high', 'low', 'close', 'enter_long', 'exit_long',
-                       'enter_short', 'exit_short', 'enter_tag', 'exit_tag']
-            for det_row in detail_data[headers].values.tolist():
-                res = self._get_sell_trade_entry_for_candle(trade, det_row)
+            signals = [sell_row[LONG_IDX], sell_row[ELONG_IDX],
+                       sell_row[SHORT_IDX], sell_row[ESHORT_IDX],
+                       sell_row[ENTER_TAG_IDX], sell_row[EXIT_TAG_IDX]]
+            for det_row in detail_rows:
+                res = self._get_sell_trade_entry_for_candle(trade, det_row + signals)
                 if res:
                     return res
 
@@ -709,6 +919,8 @@ class Backtesting:
         # Use dict of lists with data for performance
         # (looping lists is a lot faster than pandas DataFrames)
         data: Dict = self._get_ohlcv_as_lists(processed)
+        self._prepare_exit_candidates()
+        self._prepare_idle_skip(start_date)
 
         # Indexes per pair, so some pairs are allowed to have a missing start.
         indexes: Dict = defaultdict(int)
@@ -719,6 +931,7 @@ class Backtesting:
 
         self.progress.init_step(BacktestState.BACKTEST, int(
             (end_date - start_date) / timedelta(minutes=self.timeframe_min)))
+        tmp = self._skip_idle_candles(tmp, end_date, open_trade_count, indexes)
 
         # Loop timerange and get candle for each pair at that point in time
         while tmp <= end_date:
@@ -766,6 +979,8 @@ class Backtesting:
                         LocalTrade.add_bt_trade(trade)
 
                 for trade in list(open_trades[pair]):
+                    if self._skip_exit_check(trade, row_index - 1):
+                        continue
                     # also check the buying candle for sell conditions.
                     trade_entry = self._get_sell_trade_entry(trade, row)
                     # Sell occurred
@@ -773,6 +988,7 @@ class Backtesting:
                         # logger.debug(f"{pair} - Backtesting sell {trade}")
                         open_trade_count -= 1
                         open_trades[pair].remove(trade)
+                        self._exit_checks.pop(trade, None)
 
                         LocalTrade.close_bt_trade(trade)
                         trades.append(trade_entry)
@@ -783,7 +999,9 @@ class Backtesting:
             # Move time one configured time_interval ahead.
             self.progress.increment()
             tmp += timedelta(minutes=self.timeframe_min)
+            tmp = self._skip_idle_candles(tmp, end_date, open_trade_count, indexes)
 
+        self._sync_skipped_candles(indexes)
         trades += self.handle_left_open(open_trades, data=data)
         self.wallets.update()
 
@@ -803,6 +1021,7 @@ class Backtesting:
         logger.info("Running backtesting for Strategy %s", strat.get_strategy_name())
         backtest_start_time = datetime.now(timezone.utc)
         self._set_strategy(strat)
+        indicator_cache.clear()
 
         strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)()
 
@@ -7,16 +7,18 @@ This module contains the hyperopt logic
 import logging
 import random
 import warnings
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
 from datetime import datetime, timezone
 from math import ceil
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import progressbar
-import rapidjson
 from colorama import Fore, Style
 from colorama import init as colorama_init
-from joblib import Parallel, cpu_count, delayed, dump, load, wrap_non_picklable_objects
+from joblib import (Parallel, cpu_count, delayed, dump, effective_n_jobs, load,
+                    wrap_non_picklable_objects)
+from joblib.externals.loky import get_reusable_executor
 from pandas import DataFrame
 
 from freqtrade.constants import DATETIME_PRINT_FORMAT, FTHYPT_FILEVERSION, LAST_BT_RESULT_FN
@@ -29,8 +31,10 @@ from freqtrade.optimize.backtesting import Backtesting
 from freqtrade.optimize.hyperopt_auto import HyperOptAuto
 from freqtrade.optimize.hyperopt_interface import IHyperOpt  # noqa: F401
 from freqtrade.optimize.hyperopt_loss_interface import IHyperOptLoss  # noqa: F401
-from freqtrade.optimize.hyperopt_tools import HyperoptTools, hyperopt_serializer
-from freqtrade.optimize.optimize_reports import generate_strategy_stats
+from freqtrade.optimize.hyperopt_results_store import HyperoptResultsStore, HyperoptResultsWriter
+from freqtrade.optimize.hyperopt_tools import HyperoptTools
+from freqtrade.optimize.optimize_reports import (generate_lean_strategy_stats,
+                                                 generate_strategy_stats, show_backtest_result)
 from freqtrade.resolvers.hyperopt_resolver import HyperOptLossResolver
 
 
@@ -53,6 +57,28 @@ SKOPT_MODEL_QUEUE_SIZE = 10
 
 MAX_LOSS = 100000  # just a big enough number to be bad result in loss optimization
 
+# Optimizer function of a warm worker process - assigned once per worker by _init_worker()
+_worker_optimizer: Optional[Callable[[List[Any], int], Dict]] = None
+
+
+def _init_worker(optimizer: Callable[[List[Any], int], Dict]) -> None:
+    """
+    Initializer of warm worker processes.
+    Keeps the (unpickled) optimizer function - and with it the strategy - for the lifetime
+    of the worker, so only the parameters need to be sent for each epoch.
+    """
+    global _worker_optimizer
+    _worker_optimizer = optimizer
+
+
+def _run_worker_epoch(raw_params: List[Any], iteration: int) -> Dict:
+    """
+    Evaluate one epoch within a warm worker process.
+    """
+    if _worker_optimizer is None:
+        raise OperationalException("Hyperopt worker has not been initialized.")
+    return _worker_optimizer(raw_params, iteration)
+
 
 class Hyperopt:
     """
@@ -103,6 +129,7 @@ class Hyperopt:
         self.clean_hyperopt()
 
         self.num_epochs_saved = 0
+        self.results_writer: Optional[HyperoptResultsWriter] = None
         self.current_best_epoch: Optional[Dict[str, Any]] = None
 
         # Use max_open_trades for hyperopt as well, except --disable-max-market-positions is set
@@ -123,6 +150,7 @@ class Hyperopt:
         self.hyperopt_table_header = 0
         self.print_colorized = self.config.get('print_colorized', False)
         self.print_json = self.config.get('print_json', False)
+        self.lean_metrics = self.config.get('hyperopt_lean_metrics', False)
 
     @staticmethod
     def get_lock_filename(config: Dict[str, Any]) -> str:
@@ -133,7 +161,8 @@ class Hyperopt:
         """
         Remove hyperopt pickle files to restart hyperopt.
         """
-        for f in [self.data_pickle_file, self.results_file]:
+        for f in [self.data_pickle_file, self.results_file,
+                  HyperoptResultsStore(self.results_file).index_file]:
             p = Path(f)
             if p.is_file():
                 logger.info(f"Removing `{p}`.")
@@ -153,23 +182,22 @@ class Hyperopt:
     def _save_result(self, epoch: Dict) -> None:
         """
         Save hyperopt results to file
-        Store one line per epoch.
+        Store one line per epoch, and its metrics in the index file.
         While not a valid json object - this allows appending easily.
+        While hyperopt is running, epochs are written in batches by the results writer.
         :param epoch: result dictionary for this epoch.
         """
         epoch[FTHYPT_FILEVERSION] = 2
-        with self.results_file.open('a') as f:
-            rapidjson.dump(epoch, f, default=hyperopt_serializer,
-                           number_mode=rapidjson.NM_NATIVE | rapidjson.NM_NAN)
-            f.write("\n")
+        if not self.results_writer:
+            self.results_writer = HyperoptResultsWriter(HyperoptResultsStore(self.results_file))
+        self.results_writer.put(epoch)
 
         self.num_epochs_saved += 1
-        logger.debug(f"{self.num_epochs_saved} {plural(self.num_epochs_saved, 'epoch')} "
-                     f"saved to '{self.results_file}'.")
-        # Store hyperopt filename
-        latest_filename = Path.joinpath(self.results_file.parent, LAST_BT_RESULT_FN)
-        file_dump_json(latest_filename, {'latest_hyperopt': str(self.results_file.name)},
-                       log=False)
+        if self.num_epochs_saved == 1:
+            # Store hyperopt filename
+            latest_filename = Path.joinpath(self.results_file.parent, LAST_BT_RESULT_FN)
+            file_dump_json(latest_filename, {'latest_hyperopt': str(self.results_file.name)},
+                           log=False)
 
     def _get_params_details(self, params: Dict) -> Dict:
         """
@@ -272,11 +300,13 @@ class Hyperopt:
                 # noinspection PyProtectedMember
                 attr.value = params_dict[attr_name]
 
-    def generate_optimizer(self, raw_params: List[Any], iteration=None) -> Dict:
+    def generate_optimizer(self, raw_params: List[Any], iteration=None,
+                           full_metrics: bool = False) -> Dict:
         """
         Used Optimize function.
         Called once per epoch to optimize whatever is configured.
         Keep this function as optimized as possible!
+        :param full_metrics: Generate the full backtest report even if lean metrics are used.
         """
         backtest_start_time = datetime.now(timezone.utc)
         params_dict = self._get_params_dict(self.dimensions, raw_params)
@@ -307,8 +337,10 @@ class Hyperopt:
             self.backtesting.strategy.trailing_only_offset_is_reached = \
                 d['trailing_only_offset_is_reached']
 
-        with self.data_pickle_file.open('rb') as f:
-            processed = load(f, mmap_mode='r')
+        # Memory-map the data instead of reading it - all workers share the same (read-only)
+        # pages. Copy-on-write ensures modifications by the strategy stay within this epoch.
+        # Note: mmap_mode is ignored by joblib when passing a file object.
+        processed = load(self.data_pickle_file, mmap_mode='c')
         bt_results = self.backtesting.backtest(
             processed=processed,
             start_date=self.min_date,
@@ -325,17 +357,22 @@ class Hyperopt:
 
         return self._get_results_dict(bt_results, self.min_date, self.max_date,
                                       params_dict,
-                                      processed=processed)
+                                      processed=processed, full_metrics=full_metrics)
 
     def _get_results_dict(self, backtesting_results, min_date, max_date,
-                          params_dict, processed: Dict[str, DataFrame]
+                          params_dict, processed: Dict[str, DataFrame],
+                          full_metrics: bool = False
                           ) -> Dict[str, Any]:
         params_details = self._get_params_details(params_dict)
 
-        strat_stats = generate_strategy_stats(
-            self.pairlist, self.backtesting.strategy.get_strategy_name(),
-            backtesting_results, min_date, max_date, market_change=0
-        )
+        if self.lean_metrics and not full_metrics:
+            strat_stats = generate_lean_strategy_stats(
+                self.pairlist, backtesting_results, min_date, max_date)
+        else:
+            strat_stats = generate_strategy_stats(
+                self.pairlist, self.backtesting.strategy.get_strategy_name(),
+                backtesting_results, min_date, max_date, market_change=0
+            )
         results_explanation = HyperoptTools.format_results_explanation_string(
             strat_stats, self.config['stake_currency'])
 
@@ -366,6 +403,15 @@ class Hyperopt:
             'total_profit': total_profit,
         }
 
+    def regenerate_full_metrics(self, epoch: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Re-run the backtest of an epoch evaluated with lean metrics.
+        :return: Copy of the epoch, with the full backtest report as results_metrics.
+        """
+        raw_params = [epoch['params_dict'][d.name] for d in self.dimensions]
+        val = self.generate_optimizer(raw_params, full_metrics=True)
+        return {**epoch, 'results_metrics': val['results_metrics']}
+
     def get_optimizer(self, dimensions: List[Dimension], cpu_count) -> Optimizer:
         estimator = self.custom_hyperopt.generate_estimator(dimensions=dimensions)
 
@@ -391,6 +437,104 @@ class Hyperopt:
         return parallel(delayed(
                         wrap_non_picklable_objects(self.generate_optimizer))(v, i) for v in asked)
 
+    def run_optimizer_batches(self, parallel: Parallel, jobs: int,
+                              pbar: progressbar.ProgressBar) -> None:
+        """
+        Evaluate epochs in batches of `jobs` epochs.
+        Asks the optimizer for the points of a batch once the previous batch has been completed.
+        """
+        EVALS = ceil(self.total_epochs / jobs)
+        for i in range(EVALS):
+            # Correct the number of epochs to be processed for the last
+            # iteration (should not exceed self.total_epochs in total)
+            n_rest = (i + 1) * jobs - self.total_epochs
+            current_jobs = jobs - n_rest if n_rest > 0 else jobs
+
+            asked = self.opt.ask(n_points=current_jobs)
+            f_val = self.run_optimizer_parallel(parallel, asked, i)
+            self.opt.tell(asked, [v['loss'] for v in f_val])
+
+            # Calculate progressbar outputs
+            for j, val in enumerate(f_val):
+                # Use human-friendly indexes here (starting from 1)
+                current = i * jobs + j + 1
+                self.evaluate_result(val, current)
+                pbar.update(current)
+
+    def run_optimizer_streaming(self, executor: Executor, jobs: int,
+                                pbar: progressbar.ProgressBar) -> None:
+        """
+        Evaluate epochs without batch barrier.
+        As soon as an epoch completes, its result is told to the optimizer and a new point is
+        submitted - while the other workers keep evaluating their epochs.
+        Epochs are numbered in the order of their completion.
+        """
+        pending: Dict[Future, List[Any]] = {}
+        submitted = 0
+        current = 0
+
+        def submit(n_points: int) -> None:
+            nonlocal submitted
+            # Asking for multiple points uses a (costly) copy of the optimizer to avoid duplicates
+            asked = self.opt.ask(n_points=n_points) if n_points > 1 else [self.opt.ask()]
+            for x in asked:
+                pending[executor.submit(_run_worker_epoch, x, submitted)] = x
+                submitted += 1
+
+        submit(min(jobs, self.total_epochs))
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            f_val = [future.result() for future in done]
+            self.opt.tell([pending.pop(future) for future in done], [v['loss'] for v in f_val])
+
+            n_points = min(len(done), self.total_epochs - submitted)
+            if n_points > 0:
+                submit(n_points)
+
+            for val in f_val:
+                current += 1
+                self.evaluate_result(val, current)
+                pbar.update(current)
+
+    def evaluate_result(self, val: Dict[str, Any], current: int) -> None:
+        """
+        Evaluate the result of one epoch: print, keep track of the best epoch and save it.
+        :param val: result dictionary of the epoch
+        :param current: human-friendly epoch number (starting from 1)
+        """
+        val['current_epoch'] = current
+        val['is_initial_point'] = current <= INITIAL_POINTS
+
+        logger.debug(f"Optimizer epoch evaluated: {val}")
+
+        is_best = HyperoptTools.is_best_loss(val, self.current_best_loss)
+        # This value is assigned here and not in the optimization method
+        # to keep proper order in the list of results. That's because
+        # evaluations can take different time. Here they are aligned in the
+        # order they will be shown to the user.
+        val['is_best'] = is_best
+        self.print_results(val)
+
+        if is_best:
+            self.current_best_loss = val['loss']
+            self.current_best_epoch = val
+
+        self._save_result(val)
+
+    def get_parallel(self, config_jobs: int) -> Union[Parallel, Executor]:
+        """
+        Get the parallel backend to evaluate epochs with.
+        Warm workers are started once, and receive the optimizer function only on startup.
+        """
+        jobs = effective_n_jobs(config_jobs)
+        if not self.config.get('hyperopt_warm_workers', False) or jobs == 1:
+            return Parallel(n_jobs=config_jobs)
+
+        logger.info(f'Starting {jobs} warm hyperopt workers.')
+        return get_reusable_executor(
+            max_workers=jobs, initializer=_init_worker,
+            initargs=(wrap_non_picklable_objects(self.generate_optimizer), ))
+
     def _set_random_state(self, random_state: Optional[int]) -> int:
         return random_state or random.randint(1, 2**16 - 1)
 
@@ -437,9 +581,13 @@ class Hyperopt:
         if self.print_colorized:
             colorama_init(autoreset=True)
 
+        self.results_writer = HyperoptResultsWriter(
+            HyperoptResultsStore(self.results_file),
+            crash_safe=self.config.get('hyperopt_crash_safe', False))
+        self.results_writer.start()
         try:
-            with Parallel(n_jobs=config_jobs) as parallel:
-                jobs = parallel._effective_n_jobs()
+            with self.get_parallel(config_jobs) as parallel:
+                jobs = effective_n_jobs(config_jobs)
                 logger.info(f'Effective number of parallel workers used: {jobs}')
 
                 # Define progressbar
@@ -467,49 +615,30 @@ class Hyperopt:
                     max_value=self.total_epochs, redirect_stdout=False, redirect_stderr=False,
                     widgets=widgets
                 ) as pbar:
-                    EVALS = ceil(self.total_epochs / jobs)
-                    for i in range(EVALS):
-                        # Correct the number of epochs to be processed for the last
-                        # iteration (should not exceed self.total_epochs in total)
-                        n_rest = (i + 1) * jobs - self.total_epochs
-                        current_jobs = jobs - n_rest if n_rest > 0 else jobs
-
-                        asked = self.opt.ask(n_points=current_jobs)
-                        f_val = self.run_optimizer_parallel(parallel, asked, i)
-                        self.opt.tell(asked, [v['loss'] for v in f_val])
-
-                        # Calculate progressbar outputs
-                        for j, val in enumerate(f_val):
-                            # Use human-friendly indexes here (starting from 1)
-                            current = i * jobs + j + 1
-                            val['current_epoch'] = current
-                            val['is_initial_point'] = current <= INITIAL_POINTS
-
-                            logger.debug(f"Optimizer epoch evaluated: {val}")
-
-                            is_best = HyperoptTools.is_best_loss(val, self.current_best_loss)
-                            # This value is assigned here and not in the optimization method
-                            # to keep proper order in the list of results. That's because
-                            # evaluations can take different time. Here they are aligned in the
-                            # order they will be shown to the user.
-                            val['is_best'] = is_best
-                            self.print_results(val)
-
-                            if is_best:
-                                self.current_best_loss = val['loss']
-                                self.current_best_epoch = val
-
-                            self._save_result(val)
-
-                            pbar.update(current)
+                    if isinstance(parallel, Executor):
+                        self.run_optimizer_streaming(parallel, jobs, pbar)
+                    else:
+                        self.run_optimizer_batches(parallel, jobs, pbar)
 
         except KeyboardInterrupt:
             print('User interrupted..')
+        finally:
+            # Write remaining epochs
+            self.results_writer.close()
 
         logger.info(f"{self.num_epochs_saved} {plural(self.num_epochs_saved, 'epoch')} "
                     f"saved to '{self.results_file}'.")
 
         if self.current_best_epoch:
+            if self.lean_metrics:
+                logger.info("Generating full backtest report for the best epoch.")
+                self.current_best_epoch = self.regenerate_full_metrics(self.current_best_epoch)
+                if not self.print_json:
+                    show_backtest_result(
+                        self.backtesting.strategy.get_strategy_name(),
+                        self.current_best_epoch['results_metrics'],
+                        self.config['stake_currency'], self.config.get('backtest_breakdown', []))
+
             HyperoptTools.try_export_params(
                 self.config,
                 self.backtesting.strategy.get_strategy_name(),
@@ -1,5 +1,6 @@
 import logging
-from typing import List
+
+import numpy as np
 
 from freqtrade.exceptions import OperationalException
 
@@ -7,15 +8,17 @@ from freqtrade.exceptions import OperationalException
 logger = logging.getLogger(__name__)
 
 
-def hyperopt_filter_epochs(epochs: List, filteroptions: dict, log: bool = True) -> List:
+def hyperopt_filter_epochs(epochs: np.ndarray, filteroptions: dict,
+                           log: bool = True) -> np.ndarray:
     """
-    Filter our items from the list of hyperopt results
+    Filter our items from the hyperopt results index.
+    :param epochs: Index records of the epochs (see HyperoptResultsStore)
+    :return: Index records of the remaining epochs
     """
     if filteroptions['only_best']:
-        epochs = [x for x in epochs if x['is_best']]
+        epochs = epochs[epochs['is_best']]
     if filteroptions['only_profitable']:
-        epochs = [x for x in epochs
-                  if x['results_metrics'].get('profit_total', 0) > 0]
+        epochs = epochs[_metric(epochs, 'profit_total') > 0]
 
     epochs = _hyperopt_filter_epochs_trade_count(epochs, filteroptions)
 
@@ -32,97 +35,80 @@ def hyperopt_filter_epochs(epochs: List, filteroptions: dict, log: bool = True)
     return epochs
 
 
-def _hyperopt_filter_epochs_trade(epochs: List, trade_count: int):
+def _metric(epochs: np.ndarray, metric: str) -> np.ndarray:
+    """
+    Metric column, with missing values replaced by 0
+    """
+    return np.nan_to_num(epochs[metric], nan=0.0)
+
+
+def _hyperopt_filter_epochs_trade(epochs: np.ndarray, trade_count: int) -> np.ndarray:
     """
     Filter epochs with trade-counts > trades
     """
-    return [
-        x for x in epochs if x['results_metrics'].get('total_trades', 0) > trade_count
-    ]
+    return epochs[_metric(epochs, 'total_trades') > trade_count]
 
 
-def _hyperopt_filter_epochs_trade_count(epochs: List, filteroptions: dict) -> List:
+def _hyperopt_filter_epochs_trade_count(epochs: np.ndarray, filteroptions: dict) -> np.ndarray:
 
     if filteroptions['filter_min_trades'] > 0:
         epochs = _hyperopt_filter_epochs_trade(epochs, filteroptions['filter_min_trades'])
 
     if filteroptions['filter_max_trades'] > 0:
-        epochs = [
-            x for x in epochs
-            if x['results_metrics'].get('total_trades') < filteroptions['filter_max_trades']
-        ]
+        epochs = epochs[_metric(epochs, 'total_trades') < filteroptions['filter_max_trades']]
     return epochs
 
 
-def _hyperopt_filter_epochs_duration(epochs: List, filteroptions: dict) -> List:
+def _hyperopt_filter_epochs_duration(epochs: np.ndarray, filteroptions: dict) -> np.ndarray:
 
-    def get_duration_value(x):
+    def get_duration_value(epochs: np.ndarray) -> np.ndarray:
         # Duration in minutes ...
-        if 'holding_avg_s' in x['results_metrics']:
-            avg = x['results_metrics']['holding_avg_s']
-            return avg // 60
-        raise OperationalException(
-            "Holding-average not available. Please omit the filter on average time, "
-            "or rerun hyperopt with this version")
+        if np.isnan(epochs['holding_avg_s']).any():
+            raise OperationalException(
+                "Holding-average not available. Please omit the filter on average time, "
+                "or rerun hyperopt with this version")
+        return epochs['holding_avg_s'] // 60
 
     if filteroptions['filter_min_avg_time'] is not None:
         epochs = _hyperopt_filter_epochs_trade(epochs, 0)
-        epochs = [
-            x for x in epochs
-            if get_duration_value(x) > filteroptions['filter_min_avg_time']
-        ]
+        epochs = epochs[get_duration_value(epochs) > filteroptions['filter_min_avg_time']]
     if filteroptions['filter_max_avg_time'] is not None:
         epochs = _hyperopt_filter_epochs_trade(epochs, 0)
-        epochs = [
-            x for x in epochs
-            if get_duration_value(x) < filteroptions['filter_max_avg_time']
-        ]
+        epochs = epochs[get_duration_value(epochs) < filteroptions['filter_max_avg_time']]
 
     return epochs
 
 
-def _hyperopt_filter_epochs_profit(epochs: List, filteroptions: dict) -> List:
+def _hyperopt_filter_epochs_profit(epochs: np.ndarray, filteroptions: dict) -> np.ndarray:
 
     if filteroptions['filter_min_avg_profit'] is not None:
         epochs = _hyperopt_filter_epochs_trade(epochs, 0)
-        epochs = [
-            x for x in epochs
-            if x['results_metrics'].get('profit_mean', 0) * 100
-            > filteroptions['filter_min_avg_profit']
-        ]
+        epochs = epochs[_metric(epochs, 'profit_mean') * 100
+                        > filteroptions['filter_min_avg_profit']]
     if filteroptions['filter_max_avg_profit'] is not None:
         epochs = _hyperopt_filter_epochs_trade(epochs, 0)
-        epochs = [
-            x for x in epochs
-            if x['results_metrics'].get('profit_mean', 0) * 100
-            < filteroptions['filter_max_avg_profit']
-        ]
+        epochs = epochs[_metric(epochs, 'profit_mean') * 100
+                        < filteroptions['filter_max_avg_profit']]
     if filteroptions['filter_min_total_profit'] is not None:
         epochs = _hyperopt_filter_epochs_trade(epochs, 0)
-        epochs = [
-            x for x in epochs
-            if x['results_metrics'].get('profit_total_abs', 0)
-            > filteroptions['filter_min_total_profit']
-        ]
+        epochs = epochs[_metric(epochs, 'profit_total_abs')
+                        > filteroptions['filter_min_total_profit']]
     if filteroptions['filter_max_total_profit'] is not None:
         epochs = _hyperopt_filter_epochs_trade(epochs, 0)
-        epochs = [
-            x for x in epochs
-            if x['results_metrics'].get('profit_total_abs', 0)
-            < filteroptions['filter_max_total_profit']
-        ]
+        epochs = epochs[_metric(epochs, 'profit_total_abs')
+                        < filteroptions['filter_max_total_profit']]
     return epochs
 
 
-def _hyperopt_filter_epochs_objective(epochs: List, filteroptions: dict) -> List:
+def _hyperopt_filter_epochs_objective(epochs: np.ndarray, filteroptions: dict) -> np.ndarray:
 
     if filteroptions['filter_min_objective'] is not None:
         epochs = _hyperopt_filter_epochs_trade(epochs, 0)
 
-        epochs = [x for x in epochs if x['loss'] < filteroptions['filter_min_objective']]
+        epochs = epochs[epochs['loss'] < filteroptions['filter_min_objective']]
     if filteroptions['filter_max_objective'] is not None:
         epochs = _hyperopt_filter_epochs_trade(epochs, 0)
 
-        epochs = [x for x in epochs if x['loss'] > filteroptions['filter_max_objective']]
+        epochs = epochs[epochs['loss'] > filteroptions['filter_max_objective']]
 
     return epochs
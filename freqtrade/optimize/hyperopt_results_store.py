@@ -0,0 +1,308 @@
+"""
+Storage of hyperopt results (.fthypt files).
+
+The results file contains one json document per epoch.
+Next to it, an index file (.fthypt.idx) contains one fixed-size binary record per epoch,
+holding the scalar metrics of the epoch and the position of its json document.
+Epochs can therefore be filtered and listed without parsing the results file,
+and single epochs can be loaded directly.
+"""
+import logging
+import os
+import time
+from datetime import timedelta
+from pathlib import Path
+from queue import Empty, Queue
+from threading import Semaphore, Thread
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import rapidjson
+
+from freqtrade.exceptions import OperationalException
+from freqtrade.misc import plural
+
+
+logger = logging.getLogger(__name__)
+
+INDEX_MAGIC = b'FTHIDX01'
+
+# Scalar metrics (from results_metrics) available in the index. Missing values are stored as NaN.
+INDEX_METRICS = ['total_trades', 'wins', 'draws', 'losses',
+                 'profit_mean', 'profit_median', 'profit_total', 'profit_total_abs',
+                 'holding_avg_s', 'max_drawdown', 'max_drawdown_account', 'max_drawdown_abs']
+
+INDEX_DTYPE = np.dtype([
+    ('offset', '<i8'),
+    ('length', '<i8'),
+    ('current_epoch', '<i8'),
+    ('is_best', '?'),
+    ('is_initial_point', '?'),
+    ('loss', '<f8'),
+] + [(metric, '<f8') for metric in INDEX_METRICS])
+
+# Background writing of epochs: Number of epochs written at once,
+# and maximum time (in seconds) a queued epoch waits to be written.
+WRITER_BATCH_SIZE = 100
+WRITER_FLUSH_INTERVAL = 5
+
+
+def hyperopt_serializer(x):
+    if isinstance(x, np.integer):
+        return int(x)
+    if isinstance(x, np.bool_):
+        return bool(x)
+
+    return str(x)
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class HyperoptResultsStore:
+
+    def __init__(self, results_file: Path) -> None:
+        self.results_file = Path(results_file)
+        self.index_file = self.results_file.with_name(f"{self.results_file.name}.idx")
+        # Epochs parsed while indexing results without (complete) index, by offset
+        self._parsed: Dict[int, Dict[str, Any]] = {}
+
+    @staticmethod
+    def create_record(epoch: Dict[str, Any], offset: int, length: int) -> Tuple:
+        """
+        Create the index record for one epoch
+        :param epoch: Epoch result dict
+        :param offset: Position of the epoch's json document in the results file
+        :param length: Length of the json document (in bytes)
+        """
+        metrics = epoch.get('results_metrics', {})
+        return (
+            offset, length, epoch.get('current_epoch', 0),
+            bool(epoch.get('is_best', False)), bool(epoch.get('is_initial_point', False)),
+            _to_float(epoch.get('loss')),
+            *(_to_float(metrics.get(m)) for m in INDEX_METRICS)
+        )
+
+    def append(self, epochs: List[Dict[str, Any]], fsync: bool = False) -> None:
+        """
+        Append epochs to the results file, and their records to the index.
+        :param epochs: List of epoch result dicts
+        :param fsync: Make sure the data is written to disk before returning
+        """
+        records = []
+        with self.results_file.open('ab') as f:
+            offset = f.tell()
+            for epoch in epochs:
+                line = rapidjson.dumps(epoch, default=hyperopt_serializer,
+                                       number_mode=rapidjson.NM_NATIVE | rapidjson.NM_NAN
+                                       ).encode() + b'\n'
+                f.write(line)
+                records.append(self.create_record(epoch, offset, len(line)))
+                offset += len(line)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+        with self.index_file.open('ab') as f:
+            if f.tell() == 0:
+                f.write(INDEX_MAGIC)
+            f.write(np.array(records, dtype=INDEX_DTYPE).tobytes())
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _read_index(self) -> np.ndarray:
+        """
+        Read the index file.
+        Incomplete trailing records (interrupted writes) are ignored,
+        as well as records pointing beyond the end of the results file.
+        """
+        if not self.index_file.is_file():
+            return np.empty(0, dtype=INDEX_DTYPE)
+        data = self.index_file.read_bytes()
+        if not data.startswith(INDEX_MAGIC):
+            logger.warning(f"Ignoring index file {self.index_file} with unknown format.")
+            return np.empty(0, dtype=INDEX_DTYPE)
+        data = data[len(INDEX_MAGIC):]
+        count = len(data) // INDEX_DTYPE.itemsize
+        records = np.frombuffer(data[:count * INDEX_DTYPE.itemsize], dtype=INDEX_DTYPE)
+        results_size = self.results_file.stat().st_size
+        return records[records['offset'] + records['length'] <= results_size]
+
+    def _index_results(self, offset: int) -> np.ndarray:
+        """
+        Create index records by parsing the results file, starting at offset.
+        Used for results files written by older versions, or without complete index.
+        """
+        records = []
+        with self.results_file.open('rb') as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    # Incomplete write
+                    break
+                epoch = rapidjson.loads(line)
+                if offset == 0 and epoch.get('is_best') is None:
+                    raise OperationalException(
+                        "The file with HyperoptTools results is incompatible with this version "
+                        "of Freqtrade and cannot be loaded.")
+                self._parsed[offset] = epoch
+                records.append(self.create_record(epoch, offset, len(line)))
+                offset += len(line)
+        return np.array(records, dtype=INDEX_DTYPE)
+
+    def load_index(self) -> np.ndarray:
+        """
+        Load index records for all epochs in the results file.
+        :return: Structured numpy array (dtype INDEX_DTYPE), one record per epoch
+        """
+        logger.info(f"Reading epochs from '{self.results_file}'")
+        records = self._read_index()
+        end = int(records['offset'][-1] + records['length'][-1]) if len(records) else 0
+        if end < self.results_file.stat().st_size:
+            records = np.concatenate([records, self._index_results(end)])
+        return records
+
+    def load_epochs(self, records: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Load the complete epoch results for the given index records.
+        """
+        epochs: List[Dict[str, Any]] = []
+        if len(records) == 0:
+            return epochs
+        with self.results_file.open('rb') as f:
+            for offset, length in zip(records['offset'].tolist(), records['length'].tolist()):
+                if offset in self._parsed:
+                    epochs.append(self._parsed[offset])
+                    continue
+                f.seek(offset)
+                epochs.append(rapidjson.loads(f.read(length)))
+        return epochs
+
+    @staticmethod
+    def summary_epochs(records: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Build epoch result dicts from index records only.
+        These only contain the scalar metrics which are part of the index (no parameters).
+        """
+        epochs = []
+        for record in records.tolist():
+            current_epoch, is_best, is_initial_point, loss = record[2:6]
+            metrics = {m: v for m, v in zip(INDEX_METRICS, record[6:]) if not np.isnan(v)}
+            for m in ('total_trades', 'wins', 'draws', 'losses'):
+                if m in metrics:
+                    metrics[m] = int(metrics[m])
+            if 'holding_avg_s' in metrics:
+                metrics['holding_avg'] = str(timedelta(seconds=metrics['holding_avg_s']))
+            epochs.append({
+                'loss': loss,
+                'current_epoch': current_epoch,
+                'is_best': is_best,
+                'is_initial_point': is_initial_point,
+                'results_metrics': metrics,
+            })
+        return epochs
+
+
+class HyperoptResultsWriter:
+    """
+    Writes epochs to a HyperoptResultsStore in batches, from a background thread.
+    A batch is written once WRITER_BATCH_SIZE epochs are queued, WRITER_FLUSH_INTERVAL seconds
+    after its first epoch was queued, and on close().
+    Until start() is called, epochs are written immediately.
+    """
+
+    _STOP = object()
+
+    def __init__(self, store: HyperoptResultsStore, crash_safe: bool = False,
+                 batch_size: int = WRITER_BATCH_SIZE,
+                 flush_interval: float = WRITER_FLUSH_INTERVAL) -> None:
+        """
+        :param store: Results store to write to
+        :param crash_safe: Sync every batch to disk, and hold at most one batch of epochs
+                           which are not written yet (queued or being written) -
+                           so at most one batch of epochs is lost on a crash.
+        """
+        self.store = store
+        self.crash_safe = crash_safe
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: Queue = Queue()
+        # Number of epochs which may be queued or being written at a time.
+        # put() blocks once these are used up - until a batch is written.
+        self._slots = Semaphore(batch_size if crash_safe else batch_size * 10)
+        self._thread: Optional[Thread] = None
+        self._error: Optional[Exception] = None
+        self.num_saved = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Hyperopt workers receive a copy of this object, but never write results.
+        state = self.__dict__.copy()
+        state.update({'_queue': None, '_thread': None, '_slots': None})
+        return state
+
+    def start(self) -> None:
+        self._thread = Thread(target=self._run, name='hyperopt_results_writer', daemon=True)
+        self._thread.start()
+
+    def put(self, epoch: Dict[str, Any]) -> None:
+        """
+        Queue an epoch for writing.
+        """
+        if self._error:
+            raise OperationalException(
+                f"Writing hyperopt results failed: {self._error}") from self._error
+        if self._thread:
+            self._slots.acquire()
+            self._queue.put(epoch)
+        else:
+            self._write([epoch])
+
+    def close(self) -> None:
+        """
+        Write all queued epochs and stop the background thread.
+        """
+        if self._thread:
+            self._queue.put(self._STOP)
+            self._thread.join()
+            self._thread = None
+        if self._error:
+            raise OperationalException(
+                f"Writing hyperopt results failed: {self._error}") from self._error
+
+    def _write(self, epochs: List[Dict[str, Any]]) -> None:
+        self.store.append(epochs, fsync=self.crash_safe)
+        self.num_saved += len(epochs)
+        logger.debug(f"{self.num_saved} {plural(self.num_saved, 'epoch')} "
+                     f"saved to '{self.store.results_file}'.")
+
+    def _run(self) -> None:
+        batch: List[Dict[str, Any]] = []
+        deadline = 0.0
+        while True:
+            try:
+                item = self._queue.get(timeout=max(deadline - time.monotonic(), 0)
+                                       if batch else None)
+            except Empty:
+                item = None
+            if item is not None and item is not self._STOP:
+                if not batch:
+                    deadline = time.monotonic() + self.flush_interval
+                batch.append(item)
+            if batch and (item is None or item is self._STOP or len(batch) >= self.batch_size
+                          or time.monotonic() >= deadline):
+                try:
+                    if not self._error:
+                        self._write(batch)
+                except Exception as e:
+                    logger.exception("Writing hyperopt results failed.")
+                    self._error = e
+                for _ in batch:
+                    self._slots.release()
+                batch = []
+            if item is self._STOP:
+                return
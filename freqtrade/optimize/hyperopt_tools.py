@@ -3,7 +3,7 @@ import logging
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -16,6 +16,8 @@ from freqtrade.constants import FTHYPT_FILEVERSION, USERPATH_STRATEGIES
 from freqtrade.exceptions import OperationalException
 from freqtrade.misc import deep_merge_dicts, round_coin_value, round_dict, safe_value_fallback2
 from freqtrade.optimize.hyperopt_epoch_filters import hyperopt_filter_epochs
+from freqtrade.optimize.hyperopt_results_store import (INDEX_DTYPE, HyperoptResultsStore,
+                                                       hyperopt_serializer)
 
 
 logger = logging.getLogger(__name__)
@@ -23,15 +25,6 @@ logger = logging.getLogger(__name__)
 NON_OPT_PARAM_APPENDIX = "  # value loaded from strategy"
 
 
-def hyperopt_serializer(x):
-    if isinstance(x, np.integer):
-        return int(x)
-    if isinstance(x, np.bool_):
-        return bool(x)
-
-    return str(x)
-
-
 class HyperoptTools():
 
     @staticmethod
@@ -90,22 +83,6 @@ class HyperoptTools():
         else:
             return any(s in config['spaces'] for s in [space, 'all', 'default'])
 
-    @staticmethod
-    def _read_results(results_file: Path, batch_size: int = 10) -> Iterator[List[Any]]:
-        """
-        Stream hyperopt results from file
-        """
-        import rapidjson
-        logger.info(f"Reading epochs from '{results_file}'")
-        with results_file.open('r') as f:
-            data = []
-            for line in f:
-                data += [rapidjson.loads(line)]
-                if len(data) >= batch_size:
-                    yield data
-                    data = []
-        yield data
-
     @staticmethod
     def _test_hyperopt_results_exist(results_file) -> bool:
         if results_file.is_file() and results_file.stat().st_size > 0:
@@ -120,7 +97,12 @@ class HyperoptTools():
             return False
 
     @staticmethod
-    def load_filtered_results(results_file: Path, config: Dict[str, Any]) -> Tuple[List, int]:
+    def load_filtered_index(results_file: Path, config: Dict[str, Any]
+                            ) -> Tuple[HyperoptResultsStore, np.ndarray, int]:
+        """
+        Load and filter the index of a hyperopt results file.
+        :return: Tuple of (results store, index records of the filtered epochs, total epochs)
+        """
         filteroptions = {
             'only_best': config.get('hyperopt_list_best', False),
             'only_profitable': config.get('hyperopt_list_profitable', False),
@@ -135,27 +117,23 @@ class HyperoptTools():
             'filter_min_objective': config.get('hyperopt_list_min_objective', None),
             'filter_max_objective': config.get('hyperopt_list_max_objective', None),
         }
+        store = HyperoptResultsStore(results_file)
         if not HyperoptTools._test_hyperopt_results_exist(results_file):
             # No file found.
             logger.warning(f"Hyperopt file {results_file} not found.")
-            return [], 0
+            return store, np.empty(0, dtype=INDEX_DTYPE), 0
 
-        epochs = []
-        total_epochs = 0
-        for epochs_tmp in HyperoptTools._read_results(results_file):
-            if total_epochs == 0 and epochs_tmp[0].get('is_best') is None:
-                raise OperationalException(
-                    "The file with HyperoptTools results is incompatible with this version "
-                    "of Freqtrade and cannot be loaded.")
-            total_epochs += len(epochs_tmp)
-            epochs += hyperopt_filter_epochs(epochs_tmp, filteroptions, log=False)
+        index = store.load_index()
+        logger.info(f"Loaded {len(index)} previous evaluations from disk.")
 
-        logger.info(f"Loaded {total_epochs} previous evaluations from disk.")
+        epochs = hyperopt_filter_epochs(index, filteroptions, log=True)
 
-        # Final filter run ...
-        epochs = hyperopt_filter_epochs(epochs, filteroptions, log=True)
+        return store, epochs, len(index)
 
-        return epochs, total_epochs
+    @staticmethod
+    def load_filtered_results(results_file: Path, config: Dict[str, Any]) -> Tuple[List, int]:
+        store, epochs, total_epochs = HyperoptTools.load_filtered_index(results_file, config)
+        return store.load_epochs(epochs), total_epochs
 
     @staticmethod
     def show_epoch_details(results, total_epochs: int, print_json: bool,
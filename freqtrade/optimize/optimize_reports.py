@@ -351,6 +351,46 @@ def generate_daily_stats(results: DataFrame) -> Dict[str, Any]:
     }
 
 
+def generate_drawdown_stats(results: DataFrame, starting_balance: float) -> Dict[str, Any]:
+    """ Generate drawdown and cumulative balance statistics """
+    try:
+        max_drawdown_legacy, _, _, _, _, _ = calculate_max_drawdown(
+            results, value_col='profit_ratio')
+        (drawdown_abs, drawdown_start, drawdown_end, high_val, low_val,
+         max_drawdown) = calculate_max_drawdown(
+             results, value_col='profit_abs', starting_balance=starting_balance)
+        csum_min, csum_max = calculate_csum(results, starting_balance)
+        return {
+            'max_drawdown': max_drawdown_legacy,  # Deprecated - do not use
+            'max_drawdown_account': max_drawdown,
+            'max_drawdown_abs': drawdown_abs,
+            'drawdown_start': drawdown_start.strftime(DATETIME_PRINT_FORMAT),
+            'drawdown_start_ts': drawdown_start.timestamp() * 1000,
+            'drawdown_end': drawdown_end.strftime(DATETIME_PRINT_FORMAT),
+            'drawdown_end_ts': drawdown_end.timestamp() * 1000,
+
+            'max_drawdown_low': low_val,
+            'max_drawdown_high': high_val,
+            'csum_min': csum_min,
+            'csum_max': csum_max
+        }
+
+    except ValueError:
+        return {
+            'max_drawdown': 0.0,
+            'max_drawdown_account': 0.0,
+            'max_drawdown_abs': 0.0,
+            'max_drawdown_low': 0.0,
+            'max_drawdown_high': 0.0,
+            'drawdown_start': datetime(1970, 1, 1, tzinfo=timezone.utc),
+            'drawdown_start_ts': 0,
+            'drawdown_end': datetime(1970, 1, 1, tzinfo=timezone.utc),
+            'drawdown_end_ts': 0,
+            'csum_min': 0,
+            'csum_max': 0
+        }
+
+
 def generate_strategy_stats(pairlist: List[str],
                             strategy: str,
                             content: Dict[str, Any],
@@ -466,46 +506,53 @@ def generate_strategy_stats(pairlist: List[str],
         **trade_stats
     }
 
-    try:
-        max_drawdown_legacy, _, _, _, _, _ = calculate_max_drawdown(
-            results, value_col='profit_ratio')
-        (drawdown_abs, drawdown_start, drawdown_end, high_val, low_val,
-         max_drawdown) = calculate_max_drawdown(
-             results, value_col='profit_abs', starting_balance=start_balance)
-        strat_stats.update({
-            'max_drawdown': max_drawdown_legacy,  # Deprecated - do not use
-            'max_drawdown_account': max_drawdown,
-            'max_drawdown_abs': drawdown_abs,
-            'drawdown_start': drawdown_start.strftime(DATETIME_PRINT_FORMAT),
-            'drawdown_start_ts': drawdown_start.timestamp() * 1000,
-            'drawdown_end': drawdown_end.strftime(DATETIME_PRINT_FORMAT),
-            'drawdown_end_ts': drawdown_end.timestamp() * 1000,
+    strat_stats.update(generate_drawdown_stats(results, start_balance))
 
-            'max_drawdown_low': low_val,
-            'max_drawdown_high': high_val,
-        })
+    return strat_stats
 
-        csum_min, csum_max = calculate_csum(results, start_balance)
-        strat_stats.update({
-            'csum_min': csum_min,
-            'csum_max': csum_max
-        })
 
-    except ValueError:
-        strat_stats.update({
-            'max_drawdown': 0.0,
-            'max_drawdown_account': 0.0,
-            'max_drawdown_abs': 0.0,
-            'max_drawdown_low': 0.0,
-            'max_drawdown_high': 0.0,
-            'drawdown_start': datetime(1970, 1, 1, tzinfo=timezone.utc),
-            'drawdown_start_ts': 0,
-            'drawdown_end': datetime(1970, 1, 1, tzinfo=timezone.utc),
-            'drawdown_end_ts': 0,
-            'csum_min': 0,
-            'csum_max': 0
-        })
+def generate_lean_strategy_stats(pairlist: List[str],
+                                 content: Dict[str, Any],
+                                 min_date: datetime, max_date: datetime
+                                 ) -> Dict[str, Any]:
+    """
+    Reduced variant of generate_strategy_stats(), used by hyperopt for every epoch.
+    Only contains the summary metrics (used by the loss functions, the result table and
+    hyperopt-list filters) - no trades, per-pair, tag, sell-reason or daily tables.
+    :param pairlist: List of pairs to backtest
+    :param content: Backtest result data in the format:
+                    {'results: results, 'config: config}}.
+    :param min_date: Backtest start date
+    :param max_date: Backtest end date
+    :return: Dictionary containing the summary metrics.
+    """
+    results: DataFrame = content['results']
+    if not isinstance(results, DataFrame):
+        return {}
+    config = content['config']
+    start_balance = config['dry_run_wallet']
+    backtest_days = (max_date - min_date).days or 1
+    is_short = results['is_short'].astype(bool)
 
+    strat_stats = {
+        'total_trades': len(results),
+        'trade_count_long': int((~is_short).sum()),
+        'trade_count_short': int(is_short.sum()),
+        'profit_mean': results['profit_ratio'].mean() if len(results) > 0 else 0,
+        'profit_median': results['profit_ratio'].median() if len(results) > 0 else 0,
+        'profit_total': results['profit_abs'].sum() / start_balance,
+        'profit_total_abs': results['profit_abs'].sum(),
+        'backtest_start': min_date.strftime(DATETIME_PRINT_FORMAT),
+        'backtest_end': max_date.strftime(DATETIME_PRINT_FORMAT),
+        'backtest_days': backtest_days,
+        'trades_per_day': round(len(results) / backtest_days, 2),
+        'stake_currency': config['stake_currency'],
+        'starting_balance': start_balance,
+        'final_balance': content['final_balance'],
+        'max_open_trades': min(config['max_open_trades'], len(pairlist)),
+        **generate_trading_stats(results),
+        **generate_drawdown_stats(results, start_balance),
+    }
     return strat_stats
 
 
@@ -19,6 +19,7 @@ from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.leverage import interest
 from freqtrade.misc import safe_value_fallback
 from freqtrade.persistence.migrations import check_migrate
+from freqtrade.persistence.trade_index import ClosedTradeIndex
 
 
 logger = logging.getLogger(__name__)
@@ -883,23 +884,26 @@ class LocalTrade():
         """
 
         # Offline mode - without database
-        if is_open is not None:
-            if is_open:
-                sel_trades = LocalTrade.trades_open
+        sel_trades: List[LocalTrade] = []
+        if not is_open:
+            if pair or close_date:
+                # Closed trades are indexed by pair and close date
+                sel_trades = ClosedTradeIndex.get_trades(LocalTrade.trades, pair, close_date)
             else:
                 sel_trades = LocalTrade.trades
 
-        else:
-            # Not used during backtesting, but might be used by a strategy
-            sel_trades = list(LocalTrade.trades + LocalTrade.trades_open)
+        if is_open is None or is_open:
+            # Not used during backtesting (if is_open is None), but might be used by a strategy
+            open_trades = LocalTrade.trades_open
+            if pair:
+                open_trades = [trade for trade in open_trades if trade.pair == pair]
+            if close_date:
+                open_trades = [trade for trade in open_trades if trade.close_date
+                               and trade.close_date > close_date]
+            sel_trades = open_trades if is_open else sel_trades + open_trades
 
-        if pair:
-            sel_trades = [trade for trade in sel_trades if trade.pair == pair]
         if open_date:
             sel_trades = [trade for trade in sel_trades if trade.open_date > open_date]
-        if close_date:
-            sel_trades = [trade for trade in sel_trades if trade.close_date
-                          and trade.close_date > close_date]
 
         return sel_trades
 
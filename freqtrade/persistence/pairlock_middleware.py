@@ -1,6 +1,7 @@
 import logging
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from freqtrade.exchange import timeframe_to_next_date
 from freqtrade.persistence.models import PairLock
@@ -18,6 +19,9 @@ class PairLocks():
 
     use_db = True
     locks: List[PairLock] = []
+    # Index of the locks above (pair '*' holds global locks), sorted by lock end time.
+    _pair_locks: Dict[str, List[PairLock]] = {}
+    _pair_lock_ends: Dict[str, List[datetime]] = {}
 
     timeframe: str = ''
 
@@ -28,6 +32,8 @@ class PairLocks():
         """
         if not PairLocks.use_db:
             PairLocks.locks = []
+            PairLocks._pair_locks = {}
+            PairLocks._pair_lock_ends = {}
 
     @staticmethod
     def lock_pair(pair: str, until: datetime, reason: str = None, *,
@@ -53,6 +59,10 @@ class PairLocks():
             PairLock.query.session.commit()
         else:
             PairLocks.locks.append(lock)
+            ends = PairLocks._pair_lock_ends.setdefault(pair, [])
+            idx = bisect_right(ends, lock.lock_end_time)
+            ends.insert(idx, lock.lock_end_time)
+            PairLocks._pair_locks.setdefault(pair, []).insert(idx, lock)
         return lock
 
     @staticmethod
@@ -69,11 +79,13 @@ class PairLocks():
         if PairLocks.use_db:
             return PairLock.query_pair_locks(pair, now).all()
         else:
-            locks = [lock for lock in PairLocks.locks if (
-                lock.lock_end_time >= now
-                and lock.active is True
-                and (pair is None or lock.pair == pair)
-            )]
+            pairs = list(PairLocks._pair_locks) if pair is None else [pair]
+            locks = []
+            for p in pairs:
+                # Skip expired locks - only locks ending at or after "now" are relevant.
+                start = bisect_left(PairLocks._pair_lock_ends.get(p, []), now)
+                locks.extend(lock for lock in PairLocks._pair_locks.get(p, [])[start:]
+                             if lock.active is True)
             return locks
 
     @staticmethod
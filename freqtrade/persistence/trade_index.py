@@ -0,0 +1,75 @@
+"""
+Index of closed trades for backtesting
+"""
+from bisect import bisect_right
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, List, Optional
+
+
+class ClosedTradeIndex():
+    """
+    Index of closed backtesting trades (LocalTrade.trades), by pair and sorted by close date.
+    Trades appended to the trade list are indexed on the next query.
+    Pair None holds the trades of all pairs.
+    """
+
+    _source: Optional[List[Any]] = None
+    # Number of trades of _source which are indexed
+    _indexed: int = 0
+
+    _dates: Dict[Optional[str], List[datetime]] = {}
+    _trades: Dict[Optional[str], List[Any]] = {}
+    # Trades without close date
+    _undated: Dict[Optional[str], List[Any]] = {}
+
+    @staticmethod
+    def reset(source: Optional[List[Any]] = None) -> None:
+        """
+        Reset the index, to index the trades of source
+        """
+        ClosedTradeIndex._source = source
+        ClosedTradeIndex._indexed = 0
+        ClosedTradeIndex._dates = {}
+        ClosedTradeIndex._trades = {}
+        ClosedTradeIndex._undated = {}
+
+    @staticmethod
+    def _insert(key: Optional[str], trade: Any) -> None:
+        if trade.close_date is None:
+            ClosedTradeIndex._undated.setdefault(key, []).append(trade)
+            return
+        dates = ClosedTradeIndex._dates.setdefault(key, [])
+        trades = ClosedTradeIndex._trades.setdefault(key, [])
+        # Trades are closed in (almost) chronological order - so this is mostly an append.
+        idx = bisect_right(dates, trade.close_date)
+        dates.insert(idx, trade.close_date)
+        trades.insert(idx, trade)
+
+    @staticmethod
+    def sync(source: List[Any]) -> None:
+        """
+        Index trades added to source since the last call.
+        Rebuilds the index if source is a different list, or was shortened.
+        """
+        if source is not ClosedTradeIndex._source or len(source) < ClosedTradeIndex._indexed:
+            ClosedTradeIndex.reset(source)
+        for trade in islice(source, ClosedTradeIndex._indexed, None):
+            ClosedTradeIndex._insert(None, trade)
+            ClosedTradeIndex._insert(trade.pair, trade)
+        ClosedTradeIndex._indexed = len(source)
+
+    @staticmethod
+    def get_trades(source: List[Any], pair: Optional[str] = None,
+                   close_date: Optional[datetime] = None) -> List[Any]:
+        """
+        Get trades of source for this pair (all pairs if pair is None),
+        closed after close_date (if given).
+        :return: List of trades, sorted by close date if close_date is given.
+        """
+        ClosedTradeIndex.sync(source)
+        dates = ClosedTradeIndex._dates.get(pair, [])
+        trades = ClosedTradeIndex._trades.get(pair, [])
+        if close_date:
+            return trades[bisect_right(dates, close_date):]
+        return trades + ClosedTradeIndex._undated.get(pair, [])
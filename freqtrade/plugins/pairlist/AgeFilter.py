@@ -3,7 +3,7 @@ Minimum age (days listed) pair list filter
 """
 import logging
 from copy import deepcopy
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import arrow
 from pandas import DataFrame
@@ -66,19 +66,15 @@ class AgeFilter(IPairList):
             f"{self._max_days_listed} {plural(self._max_days_listed, 'day')}"
         ) if self._max_days_listed else '')
 
-    def filter_pairlist(self, pairlist: List[str], tickers: Dict) -> List[str]:
+    def ohlcv_needs(self, pairlist: List[str]) -> Tuple[ListPairsWithTimeframes, int]:
         """
-        :param pairlist: pairlist to filter or sort
-        :param tickers: Tickers (from exchange.get_tickers()). May be cached.
-        :return: new allowlist
+        Daily candles of pairs which have not been checked yet.
+        :param pairlist: pairlist to filter
+        :return: Tuple of the list of (pair, timeframe, candle_type) and start of the candles
         """
         needed_pairs: ListPairsWithTimeframes = [
             (p, '1d', self._config['candle_type_def']) for p in pairlist
             if p not in self._symbolsChecked and p not in self._symbolsCheckFailed]
-        if not needed_pairs:
-            # Remove pairs that have been removed before
-            return [p for p in pairlist if p not in self._symbolsCheckFailed]
-
         since_days = -(
             self._max_days_listed if self._max_days_listed else self._min_days_listed
         ) - 1
@@ -86,7 +82,20 @@ class AgeFilter(IPairList):
                        .floor('day')
                        .shift(days=since_days)
                        .float_timestamp) * 1000
-        candles = self._exchange.refresh_latest_ohlcv(needed_pairs, since_ms=since_ms, cache=False)
+        return needed_pairs, since_ms
+
+    def filter_pairlist(self, pairlist: List[str], tickers: Dict) -> List[str]:
+        """
+        :param pairlist: pairlist to filter or sort
+        :param tickers: Tickers (from exchange.get_tickers()). May be cached.
+        :return: new allowlist
+        """
+        needed_pairs, since_ms = self.ohlcv_needs(pairlist)
+        if not needed_pairs:
+            # Remove pairs that have been removed before
+            return [p for p in pairlist if p not in self._symbolsCheckFailed]
+
+        candles = self._pairlistmanager.get_candles(needed_pairs, since_ms)
         if self._enabled:
             for p in deepcopy(pairlist):
                 daily_candles = candles[(p, '1d', self._config['candle_type_def'])] if (
@@ -4,8 +4,11 @@ PairList Handler base class
 import logging
 from abc import ABC, abstractmethod, abstractproperty
 from copy import deepcopy
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from pandas import DataFrame, Series
+
+from freqtrade.constants import ListPairsWithTimeframes
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import Exchange, market_is_active
 from freqtrade.mixins import LoggingMixin
@@ -73,6 +76,38 @@ class IPairList(LoggingMixin, ABC):
         """
         raise NotImplementedError()
 
+    def _validate_pairs(self, pairs: DataFrame, tickers: Dict) -> Optional[Series]:
+        """
+        Check all pairs against Pairlist Handler's specific conditions at once.
+
+        Vectorized alternative to _validate_pair() - used by the generic filter_pairlist()
+        if implemented.
+
+        :param pairs: Rows of the ticker table (see PairListManager.ticker_table())
+                      for the pairs to validate. Pairs without ticker have NaN values.
+        :param tickers: Tickers (from exchange.get_tickers()). May be cached.
+        :return: Boolean Series (True if the pair can stay) - or None if not implemented
+        """
+        return None
+
+    def _apply_checks(self, pairs: DataFrame,
+                      checks: List[Tuple[Series, Callable[[str], str]]]) -> Series:
+        """
+        Combine vectorized checks, logging why pairs are removed.
+        :param pairs: Pairs to validate (see _validate_pairs())
+        :param checks: List of (Series - True if the pair fails this check,
+                       function returning the log message for a removed pair)
+                       Only the message of the first failed check is logged.
+        :return: Boolean Series - True if the pair passed all checks
+        """
+        keep = Series(True, index=pairs.index)
+        for failed, message in checks:
+            failed = failed & keep
+            for pair in pairs.index[failed.to_numpy()]:
+                self.log_once(message(pair), logger.info)
+            keep &= ~failed
+        return keep
+
     def gen_pairlist(self, tickers: Dict) -> List[str]:
         """
         Generate the pairlist.
@@ -90,13 +125,27 @@ class IPairList(LoggingMixin, ABC):
         raise OperationalException("This Pairlist Handler should not be used "
                                    "at the first position in the list of Pairlist Handlers.")
 
+    def ohlcv_needs(self, pairlist: List[str]) -> Tuple[ListPairsWithTimeframes, int]:
+        """
+        Candles this Pairlist Handler needs to filter pairlist.
+
+        Called by the pairlistmanager before running the Pairlist Filters, to fetch the candles
+        of all Pairlist Filters at once. Pairlist Handlers using candles shall override this,
+        and get their candles using self._pairlistmanager.get_candles().
+
+        :param pairlist: pairlist after the first Pairlist Handler in the chain
+        :return: Tuple of the list of (pair, timeframe, candle_type) and
+                 the start of the candles (in milliseconds)
+        """
+        return [], 0
+
     def filter_pairlist(self, pairlist: List[str], tickers: Dict) -> List[str]:
         """
         Filters and sorts pairlist and returns the whitelist again.
 
         Called on each bot iteration - please use internal caching if necessary
-        This generic implementation calls self._validate_pair() for each pair
-        in the pairlist.
+        This generic implementation calls self._validate_pairs() for all pairs at once -
+        or self._validate_pair() for each pair in the pairlist if not implemented.
 
         Some Pairlist Handlers override this generic implementation and employ
         own filtration.
@@ -106,6 +155,11 @@ class IPairList(LoggingMixin, ABC):
         :return: new whitelist
         """
         if self._enabled:
+            if type(self)._validate_pairs is not IPairList._validate_pairs:
+                keep = self._validate_pairs(
+                    self._pairlistmanager.ticker_table(tickers).reindex(pairlist), tickers)
+                if keep is not None:
+                    return [p for p, k in zip(pairlist, keep.tolist()) if k]
             # Copy list since we're modifying this list
             for p in deepcopy(pairlist):
                 # Filter out assets
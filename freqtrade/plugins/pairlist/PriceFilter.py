@@ -4,6 +4,9 @@ Price pair list filter
 import logging
 from typing import Any, Dict
 
+import numpy as np
+from pandas import DataFrame, Series
+
 from freqtrade.exceptions import OperationalException
 from freqtrade.plugins.pairlist.IPairList import IPairList
 
@@ -63,65 +66,56 @@ class PriceFilter(IPairList):
 
         return f"{self.name} - No price filters configured."
 
-    def _validate_pair(self, pair: str, ticker: Dict[str, Any]) -> bool:
+    def _validate_pairs(self, pairs: DataFrame, tickers: Dict) -> Series:
         """
-        Check if if one price-step (pip) is > than a certain barrier.
-        :param pair: Pair that's currently validated
-        :param ticker: ticker dict as returned from ccxt.fetch_tickers()
-        :return: True if the pair can stay, false if it should be removed
+        Check if one price-step (pip) is > than a certain barrier, and check price limits.
+        :param pairs: Ticker table rows of the pairs to validate
+        :param tickers: Tickers (from exchange.get_tickers()). May be cached.
+        :return: Boolean Series - True if the pair can stay, false if it should be removed
         """
-        if ticker.get('last', None) is None or ticker.get('last') == 0:
-            self.log_once(f"Removed {pair} from whitelist, because "
-                          "ticker['last'] is empty (Usually no trade in the last 24h).",
-                          logger.info)
-            return False
+        last = pairs['last']
+        checks = [(last.isna() | (last == 0), lambda pair: (
+            f"Removed {pair} from whitelist, because "
+            "ticker['last'] is empty (Usually no trade in the last 24h)."))]
 
         # Perform low_price_ratio check.
         if self._low_price_ratio != 0:
-            compare = self._exchange.price_get_one_pip(pair, ticker['last'])
-            changeperc = compare / ticker['last']
-            if changeperc > self._low_price_ratio:
-                self.log_once(f"Removed {pair} from whitelist, "
-                              f"because 1 unit is {changeperc:.3%}", logger.info)
-                return False
+            if self._exchange.precisionMode == 4:
+                # tick size
+                one_pip = pairs['price_precision']
+            else:
+                # Decimal places
+                one_pip = 1 / np.power(10.0, pairs['price_precision'])
+            changeperc = one_pip / last
+            checks.append((changeperc > self._low_price_ratio, lambda pair: (
+                f"Removed {pair} from whitelist, "
+                f"because 1 unit is {changeperc[pair]:.3%}")))
 
         # Perform low_amount check
         if self._max_value != 0:
-            price = ticker['last']
-            market = self._exchange.markets[pair]
-            limits = market['limits']
-            if (limits['amount']['min'] is not None):
-                min_amount = limits['amount']['min']
-                min_precision = market['precision']['amount']
-
-                min_value = min_amount * price
-                if self._exchange.precisionMode == 4:
-                    # tick size
-                    next_value = (min_amount + min_precision) * price
-                else:
-                    # Decimal places
-                    min_precision = pow(0.1, min_precision)
-                    next_value = (min_amount + min_precision) * price
-                diff = next_value - min_value
-
-                if diff > self._max_value:
-                    self.log_once(f"Removed {pair} from whitelist, "
-                                  f"because min value change of {diff} > {self._max_value}.",
-                                  logger.info)
-                    return False
+            min_amount = pairs['amount_min']
+            if self._exchange.precisionMode == 4:
+                # tick size
+                min_precision = pairs['amount_precision']
+            else:
+                # Decimal places
+                min_precision = np.power(0.1, pairs['amount_precision'])
+            # Pairs without minimum amount have a NaN diff - and are not removed.
+            diff = (min_amount + min_precision) * last - min_amount * last
+            checks.append((diff > self._max_value, lambda pair: (
+                f"Removed {pair} from whitelist, "
+                f"because min value change of {float(diff[pair])} > {self._max_value}.")))
 
         # Perform min_price check.
         if self._min_price != 0:
-            if ticker['last'] < self._min_price:
-                self.log_once(f"Removed {pair} from whitelist, "
-                              f"because last price < {self._min_price:.8f}", logger.info)
-                return False
+            checks.append((last < self._min_price, lambda pair: (
+                f"Removed {pair} from whitelist, "
+                f"because last price < {self._min_price:.8f}")))
 
         # Perform max_price check.
         if self._max_price != 0:
-            if ticker['last'] > self._max_price:
-                self.log_once(f"Removed {pair} from whitelist, "
-                              f"because last price > {self._max_price:.8f}", logger.info)
-                return False
+            checks.append((last > self._max_price, lambda pair: (
+                f"Removed {pair} from whitelist, "
+                f"because last price > {self._max_price:.8f}")))
 
-        return True
+        return self._apply_checks(pairs, checks)
@@ -4,6 +4,8 @@ Spread pair list filter
 import logging
 from typing import Any, Dict
 
+from pandas import DataFrame, Series
+
 from freqtrade.plugins.pairlist.IPairList import IPairList
 
 
@@ -36,22 +38,21 @@ class SpreadFilter(IPairList):
         return (f"{self.name} - Filtering pairs with ask/bid diff above "
                 f"{self._max_spread_ratio:.2%}.")
 
-    def _validate_pair(self, pair: str, ticker: Dict[str, Any]) -> bool:
+    def _validate_pairs(self, pairs: DataFrame, tickers: Dict) -> Series:
         """
-        Validate spread for the ticker
-        :param pair: Pair that's currently validated
-        :param ticker: ticker dict as returned from ccxt.fetch_tickers()
-        :return: True if the pair can stay, false if it should be removed
+        Validate spread for the tickers
+        :param pairs: Ticker table rows of the pairs to validate
+        :param tickers: Tickers (from exchange.get_tickers()). May be cached.
+        :return: Boolean Series - True if the pair can stay, false if it should be removed
         """
-        if 'bid' in ticker and 'ask' in ticker and ticker['ask']:
-            spread = 1 - ticker['bid'] / ticker['ask']
-            if spread > self._max_spread_ratio:
-                self.log_once(f"Removed {pair} from whitelist, because spread "
-                              f"{spread:.3%} > {self._max_spread_ratio:.3%}",
-                              logger.info)
-                return False
-            else:
-                return True
-        self.log_once(f"Removed {pair} from whitelist due to invalid ticker data: {ticker}",
-                      logger.info)
-        return False
+        bid = pairs['bid']
+        ask = pairs['ask']
+        spread = 1 - bid / ask
+        return self._apply_checks(pairs, [
+            (bid.isna() | ask.isna() | (ask == 0), lambda pair: (
+                f"Removed {pair} from whitelist due to invalid ticker data: "
+                f"{tickers.get(pair, {})}")),
+            (spread > self._max_spread_ratio, lambda pair: (
+                f"Removed {pair} from whitelist, because spread "
+                f"{spread[pair]:.3%} > {self._max_spread_ratio:.3%}")),
+        ])
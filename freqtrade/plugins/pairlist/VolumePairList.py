@@ -4,10 +4,11 @@ Volume PairList provider
 Provides dynamic pair list based on trade volumes
 """
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 import arrow
 from cachetools import TTLCache
+from pandas import DataFrame, Series
 
 from freqtrade.constants import ListPairsWithTimeframes
 from freqtrade.exceptions import OperationalException
@@ -121,24 +122,66 @@ class VolumePairList(IPairList):
         else:
             # Use fresh pairlist
             # Check if pair quote currency equals to the stake currency.
-            _pairlist = [k for k in self._exchange.get_markets(
-                quote_currencies=[self._stake_currency],
-                tradable_only=True, active_only=True).keys()]
+            table = self._pairlistmanager.ticker_table(tickers)
+            candidates = ((table['quote'] == self._stake_currency)
+                          & table['tradable'] & table['active'])
+            if not self._use_range:
+                candidates &= table[self._sort_key].notna()
             # No point in testing for blacklisted pairs...
-            _pairlist = self.verify_blacklist(_pairlist, logger.info)
-
-            filtered_tickers = [
-                v for k, v in tickers.items()
-                if (self._exchange.get_pair_quote_currency(k) == self._stake_currency
-                    and (self._use_range or v[self._sort_key] is not None)
-                    and v['symbol'] in _pairlist)]
-            pairlist = [s['symbol'] for s in filtered_tickers]
+            pairlist = self.verify_blacklist(table.index[candidates.to_numpy()].tolist(),
+                                             logger.info)
 
             pairlist = self.filter_pairlist(pairlist, tickers)
             self._pair_cache['pairlist'] = pairlist.copy()
 
         return pairlist
 
+    def _since_ms(self) -> int:
+        """
+        Start of the candles used for the volume range (in milliseconds)
+        """
+        return int(arrow.utcnow()
+                   .floor('minute')
+                   .shift(minutes=-(self._lookback_period * self._tf_in_min)
+                          - self._tf_in_min)
+                   .int_timestamp) * 1000
+
+    def ohlcv_needs(self, pairlist: List[str]) -> Tuple[ListPairsWithTimeframes, int]:
+        """
+        Candles for the volume range (only if a lookback range is used).
+        :param pairlist: pairlist to filter
+        :return: Tuple of the list of (pair, timeframe, candle_type) and start of the candles
+        """
+        if not self._use_range:
+            return [], 0
+        needed_pairs: ListPairsWithTimeframes = [
+            (p, self._lookback_timeframe, self._def_candletype) for p in pairlist
+            if p not in self._pair_cache
+        ]
+        return needed_pairs, self._since_ms()
+
+    def _range_volume(self, pair_candles: Optional[DataFrame]) -> float:
+        """
+        Quote volume over the lookback range
+        :param pair_candles: Candles of the lookback range - may be None
+        :return: Sum of the quote volume of the last lookback_period candles, 0 without candles
+        """
+        # in case of candle data calculate typical price and quoteVolume for candle
+        if pair_candles is None or pair_candles.empty:
+            return 0
+        # Candles are shared with other Pairlist Handlers - don't add columns.
+        if self._exchange._ft_has["ohlcv_volume_currency"] == "base":
+            typical_price = (pair_candles['high'] + pair_candles['low']
+                             + pair_candles['close']) / 3
+
+            quote_volume = pair_candles['volume'] * typical_price
+        else:
+            # Exchange ohlcv data is in quote volume already.
+            quote_volume = pair_candles['volume']
+        # ensure that a rolling sum over the lookback_period is built
+        # if pair_candles contains more candles than lookback_period
+        return quote_volume.rolling(self._lookback_period).sum().iloc[-1]
+
     def filter_pairlist(self, pairlist: List[str], tickers: Dict) -> List[str]:
         """
         Filters and sorts pairlist and returns the whitelist again.
@@ -148,15 +191,12 @@ class VolumePairList(IPairList):
         :return: new whitelist
         """
         # Use the incoming pairlist.
-        filtered_tickers = [v for k, v in tickers.items() if k in pairlist]
+        table = self._pairlistmanager.ticker_table(tickers)
+        volumes = table.loc[table.index.isin(pairlist), self._sort_key]
 
         # get lookback period in ms, for exchange ohlcv fetch
         if self._use_range:
-            since_ms = int(arrow.utcnow()
-                           .floor('minute')
-                           .shift(minutes=-(self._lookback_period * self._tf_in_min)
-                                  - self._tf_in_min)
-                           .int_timestamp) * 1000
+            since_ms = self._since_ms()
 
             to_ms = int(arrow.utcnow()
                         .floor('minute')
@@ -168,55 +208,26 @@ class VolumePairList(IPairList):
                           f"{self._lookback_timeframe}, starting from {format_ms_time(since_ms)} "
                           f"till {format_ms_time(to_ms)}", logger.info)
             needed_pairs: ListPairsWithTimeframes = [
-                (p, self._lookback_timeframe, self._def_candletype) for p in
-                [s['symbol'] for s in filtered_tickers]
+                (p, self._lookback_timeframe, self._def_candletype) for p in volumes.index
                 if p not in self._pair_cache
             ]
 
             # Get all candles
             candles = {}
             if needed_pairs:
-                candles = self._exchange.refresh_latest_ohlcv(
-                    needed_pairs, since_ms=since_ms, cache=False
-                )
-            for i, p in enumerate(filtered_tickers):
-                pair_candles = candles[
-                    (p['symbol'], self._lookback_timeframe, self._def_candletype)
-                ] if (
-                    p['symbol'], self._lookback_timeframe, self._def_candletype
-                    ) in candles else None
-                # in case of candle data calculate typical price and quoteVolume for candle
-                if pair_candles is not None and not pair_candles.empty:
-                    if self._exchange._ft_has["ohlcv_volume_currency"] == "base":
-                        pair_candles['typical_price'] = (pair_candles['high'] + pair_candles['low']
-                                                         + pair_candles['close']) / 3
-
-                        pair_candles['quoteVolume'] = (
-                            pair_candles['volume'] * pair_candles['typical_price']
-                        )
-                    else:
-                        # Exchange ohlcv data is in quote volume already.
-                        pair_candles['quoteVolume'] = pair_candles['volume']
-                    # ensure that a rolling sum over the lookback_period is built
-                    # if pair_candles contains more candles than lookback_period
-                    quoteVolume = (pair_candles['quoteVolume']
-                                   .rolling(self._lookback_period)
-                                   .sum()
-                                   .iloc[-1])
-
-                    # replace quoteVolume with range quoteVolume sum calculated above
-                    filtered_tickers[i]['quoteVolume'] = quoteVolume
-                else:
-                    filtered_tickers[i]['quoteVolume'] = 0
+                candles = self._pairlistmanager.get_candles(needed_pairs, since_ms)
+            # replace quoteVolume with range quoteVolume sum
+            volumes = Series([
+                self._range_volume(candles.get((p, self._lookback_timeframe, self._def_candletype)))
+                for p in volumes.index], index=volumes.index, dtype=float)
 
         if self._min_value > 0:
-            filtered_tickers = [
-                v for v in filtered_tickers if v[self._sort_key] > self._min_value]
+            volumes = volumes[volumes > self._min_value]
 
-        sorted_tickers = sorted(filtered_tickers, reverse=True, key=lambda t: t[self._sort_key])
+        volumes = volumes.sort_values(ascending=False, kind='stable')
 
         # Validate whitelist to only have active market pairs
-        pairs = self._whitelist_for_active_markets([s['symbol'] for s in sorted_tickers])
+        pairs = self._whitelist_for_active_markets(volumes.index.tolist())
         pairs = self.verify_blacklist(pairs, logmethod=logger.info)
         # Limit pairlist to the requested number of pairs
         pairs = pairs[:self._number_pairs]
@@ -3,7 +3,7 @@ Rate of change pairlist filter
 """
 import logging
 from copy import deepcopy
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import arrow
 from cachetools import TTLCache
@@ -60,12 +60,11 @@ class RangeStabilityFilter(IPairList):
                 f"{self._min_rate_of_change}{max_rate_desc} over the "
                 f"last {plural(self._days, 'day')}.")
 
-    def filter_pairlist(self, pairlist: List[str], tickers: Dict) -> List[str]:
+    def ohlcv_needs(self, pairlist: List[str]) -> Tuple[ListPairsWithTimeframes, int]:
         """
-        Validate trading range
-        :param pairlist: pairlist to filter or sort
-        :param tickers: Tickers (from exchange.get_tickers()). May be cached.
-        :return: new allowlist
+        Daily candles of pairs without cached result.
+        :param pairlist: pairlist to filter
+        :return: Tuple of the list of (pair, timeframe, candle_type) and start of the candles
         """
         needed_pairs: ListPairsWithTimeframes = [
             (p, '1d', self._def_candletype) for p in pairlist if p not in self._pair_cache]
@@ -74,11 +73,20 @@ class RangeStabilityFilter(IPairList):
                          .floor('day')
                          .shift(days=-self._days - 1)
                          .int_timestamp) * 1000
+        return needed_pairs, since_ms
+
+    def filter_pairlist(self, pairlist: List[str], tickers: Dict) -> List[str]:
+        """
+        Validate trading range
+        :param pairlist: pairlist to filter or sort
+        :param tickers: Tickers (from exchange.get_tickers()). May be cached.
+        :return: new allowlist
+        """
+        needed_pairs, since_ms = self.ohlcv_needs(pairlist)
         # Get all candles
         candles = {}
         if needed_pairs:
-            candles = self._exchange.refresh_latest_ohlcv(needed_pairs, since_ms=since_ms,
-                                                          cache=False)
+            candles = self._pairlistmanager.get_candles(needed_pairs, since_ms)
 
         if self._enabled:
             for p in deepcopy(pairlist):
@@ -3,13 +3,16 @@ PairList manager class
 """
 import logging
 from functools import partial
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 from cachetools import TTLCache, cached
+from pandas import DataFrame, to_datetime
 
-from freqtrade.constants import ListPairsWithTimeframes
+from freqtrade.constants import ListPairsWithTimeframes, PairWithTimeframe
 from freqtrade.enums import CandleType
 from freqtrade.exceptions import OperationalException
+from freqtrade.exchange import market_is_active
 from freqtrade.mixins import LoggingMixin
 from freqtrade.plugins.pairlist.IPairList import IPairList
 from freqtrade.plugins.pairlist.pairlist_helpers import expand_pairlist
@@ -19,6 +22,13 @@ from freqtrade.resolvers import PairListResolver
 logger = logging.getLogger(__name__)
 
 
+def _market_value(market: Optional[Dict[str, Any]], group: str, key: str) -> Any:
+    """
+    Get market[group][key] - or None if not available
+    """
+    return ((market or {}).get(group) or {}).get(key)
+
+
 class PairListManager(LoggingMixin):
 
     def __init__(self, exchange, config: dict) -> None:
@@ -28,6 +38,15 @@ class PairListManager(LoggingMixin):
         self._blacklist = self._config['exchange'].get('pair_blacklist', [])
         self._pairlist_handlers: List[IPairList] = []
         self._tickers_needed = False
+        # Candles fetched during the current refresh_pairlist() call -
+        # (pair, timeframe, candle_type) => (since_ms, DataFrame or None if the fetch failed)
+        self._candles: Dict[PairWithTimeframe, Tuple[int, Optional[DataFrame]]] = {}
+        # Ticker table of the current refresh_pairlist() call, and the tickers it was built from
+        self._ticker_table: Optional[DataFrame] = None
+        self._ticker_table_source: Optional[Dict] = None
+        # Expanded blacklist, and the markets and blacklist it was built from
+        self._expanded_blacklist: List[str] = []
+        self._expanded_blacklist_source: Tuple = (None, None)
         for pairlist_handler_config in self._config.get('pairlists', None):
             pairlist_handler = PairListResolver.load_pairlist(
                 pairlist_handler_config['method'],
@@ -62,7 +81,15 @@ class PairListManager(LoggingMixin):
     @property
     def expanded_blacklist(self) -> List[str]:
         """The expanded blacklist (including wildcard expansion)"""
-        return expand_pairlist(self._blacklist, self._exchange.get_markets().keys())
+        # Expanding wildcards requires matching every market - so only do this
+        # when blacklist or markets changed.
+        markets = self._exchange.markets
+        source = self._expanded_blacklist_source
+        if source[0] is not markets or source[1] != self._blacklist:
+            self._expanded_blacklist = expand_pairlist(self._blacklist,
+                                                       self._exchange.get_markets().keys())
+            self._expanded_blacklist_source = (markets, self._blacklist.copy())
+        return self._expanded_blacklist.copy()
 
     @property
     def name_list(self) -> List[str]:
@@ -77,6 +104,42 @@ class PairListManager(LoggingMixin):
     def _get_cached_tickers(self):
         return self._exchange.get_tickers()
 
+    def ticker_table(self, tickers: Dict) -> DataFrame:
+        """
+        Tickers and market information of all pairs as one table, indexed by pair.
+        Allows Pairlist Handlers to filter and sort all pairs at once, instead of looping
+        over the ticker dicts.
+        Built once per refresh_pairlist() call.
+        Columns: last, bid, ask, quoteVolume, quote, tradable, active,
+        price_precision, amount_precision, amount_min.
+        Values missing in ticker or market are NaN.
+        :param tickers: Tickers (from exchange.get_tickers())
+        :return: DataFrame with one row per ticker
+        """
+        if self._ticker_table is not None and self._ticker_table_source is tickers:
+            return self._ticker_table
+
+        markets = self._exchange.markets or {}
+        pairs = list(tickers.keys())
+        pair_markets = [markets.get(pair) for pair in pairs]
+        table = DataFrame({
+            key: np.array([tickers[pair].get(key) for pair in pairs], dtype=float)
+            for key in ('last', 'bid', 'ask', 'quoteVolume')
+        }, index=pairs)
+        table['quote'] = [(market or {}).get('quote', '') for market in pair_markets]
+        table['tradable'] = np.array([bool(market and self._exchange.market_is_tradable(market))
+                                      for market in pair_markets], dtype=bool)
+        table['active'] = np.array([bool(market and market_is_active(market))
+                                    for market in pair_markets], dtype=bool)
+        table['price_precision'] = np.array(
+            [_market_value(market, 'precision', 'price') for market in pair_markets], dtype=float)
+        table['amount_precision'] = np.array(
+            [_market_value(market, 'precision', 'amount') for market in pair_markets], dtype=float)
+        amount_limits = [_market_value(market, 'limits', 'amount') for market in pair_markets]
+        table['amount_min'] = np.array([(limit or {}).get('min') for limit in amount_limits],
+                                       dtype=float)
+        return table
+
     def refresh_pairlist(self) -> None:
         """Run pairlist through all configured Pairlist Handlers."""
         # Tickers should be cached to avoid calling the exchange on each call.
@@ -84,13 +147,25 @@ class PairListManager(LoggingMixin):
         if self._tickers_needed:
             tickers = self._get_cached_tickers()
 
-        # Generate the pairlist with first Pairlist Handler in the chain
-        pairlist = self._pairlist_handlers[0].gen_pairlist(tickers)
+        self._candles = {}
+        if tickers:
+            self._ticker_table = self.ticker_table(tickers)
+            self._ticker_table_source = tickers
+        try:
+            # Generate the pairlist with first Pairlist Handler in the chain
+            pairlist = self._pairlist_handlers[0].gen_pairlist(tickers)
+
+            # Fetch the candles all Pairlist Handlers need at once.
+            self._prefetch_candles(pairlist)
 
-        # Process all Pairlist Handlers in the chain
-        # except for the first one, which is the generator.
-        for pairlist_handler in self._pairlist_handlers[1:]:
-            pairlist = pairlist_handler.filter_pairlist(pairlist, tickers)
+            # Process all Pairlist Handlers in the chain
+            # except for the first one, which is the generator.
+            for pairlist_handler in self._pairlist_handlers[1:]:
+                pairlist = pairlist_handler.filter_pairlist(pairlist, tickers)
+        finally:
+            self._candles = {}
+            self._ticker_table = None
+            self._ticker_table_source = None
 
         # Validation against blacklist happens after the chain of Pairlist Handlers
         # to ensure blacklist is respected.
@@ -98,6 +173,55 @@ class PairListManager(LoggingMixin):
 
         self._whitelist = pairlist
 
+    def _prefetch_candles(self, pairlist: List[str]) -> None:
+        """
+        Collect the candles needed by the Pairlist Filters to filter pairlist,
+        and fetch them with one call per timeframe - starting at the earliest date needed.
+        Pairs removed by an earlier Pairlist Filter are fetched nevertheless - but each
+        pair is only fetched once, instead of once per Pairlist Filter.
+        """
+        needs: Dict[PairWithTimeframe, int] = {}
+        for pairlist_handler in self._pairlist_handlers[1:]:
+            pairs, since_ms = pairlist_handler.ohlcv_needs(pairlist.copy())
+            for pair in pairs:
+                needs[pair] = min(needs.get(pair, since_ms), since_ms)
+
+        since_per_timeframe: Dict[str, int] = {}
+        for (_, timeframe, _), since_ms in needs.items():
+            since_per_timeframe[timeframe] = min(
+                since_per_timeframe.get(timeframe, since_ms), since_ms)
+        for timeframe, since_ms in since_per_timeframe.items():
+            self.get_candles([p for p in needs if p[1] == timeframe], since_ms)
+
+    def get_candles(self, pairs: ListPairsWithTimeframes,
+                    since_ms: int) -> Dict[PairWithTimeframe, DataFrame]:
+        """
+        Get candles for Pairlist Handlers.
+        During refresh_pairlist(), candles are fetched once and shared between all
+        Pairlist Handlers - candles not yet fetched (or not far enough back) are fetched now.
+        The returned DataFrames may be shared, and must not be modified.
+        :param pairs: List of (pair, timeframe, candle_type) to get candles for
+        :param since_ms: Start of the candles (in milliseconds)
+        :return: Dict of {(pair, timeframe, candle_type): DataFrame}. Pairs without candles
+                 (failed fetch) are missing.
+        """
+        missing = [p for p in pairs if p not in self._candles or self._candles[p][0] > since_ms]
+        if missing:
+            candles = self._exchange.refresh_latest_ohlcv(missing, since_ms=since_ms, cache=False)
+            for pair in missing:
+                self._candles[pair] = (since_ms, candles[pair] if pair in candles else None)
+
+        result = {}
+        for pair in pairs:
+            fetched_since, df = self._candles.get(pair, (since_ms, None))
+            if df is None:
+                continue
+            if fetched_since < since_ms:
+                # Fetched further back for another Pairlist Handler
+                df = df.loc[df['date'] >= to_datetime(since_ms, unit='ms', utc=True)]
+            result[pair] = df
+        return result
+
     def verify_blacklist(self, pairlist: List[str], logmethod) -> List[str]:
         """
         Verify and remove items from pairlist - returning a filtered pairlist.
@@ -114,8 +238,9 @@ class PairListManager(LoggingMixin):
             logger.error(f"Pair blacklist contains an invalid Wildcard: {err}")
             return []
         log_once = partial(self.log_once, logmethod=logmethod)
+        blacklist_set = set(blacklist)
         for pair in pairlist.copy():
-            if pair in blacklist:
+            if pair in blacklist_set:
                 log_once(f"Pair {pair} in your blacklist. Removing it from whitelist...")
                 pairlist.remove(pair)
         return pairlist
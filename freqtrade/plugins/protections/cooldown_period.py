@@ -2,7 +2,6 @@
 import logging
 from datetime import datetime, timedelta
 
-from freqtrade.persistence import Trade
 from freqtrade.plugins.protections import IProtection, ProtectionReturn
 
 
@@ -37,13 +36,12 @@ class CooldownPeriod(IProtection):
         #     Trade.pair == pair,
         # ]
         # trade = Trade.get_trades(filters).first()
-        trades = Trade.get_trades_proxy(pair=pair, is_open=False, close_date=look_back_until)
-        if trades:
+        trades = self.get_trade_window(look_back_until, pair)
+        if trades.count(pair):
             # Get latest trade
-            # Ignore type error as we know we only get closed trades.
-            trade = sorted(trades, key=lambda t: t.close_date)[-1]  # type: ignore
             self.log_once(f"Cooldown for {pair} for {self.stop_duration_str}.", logger.info)
-            until = self.calculate_lock_end([trade], self._stop_duration)
+            until = self.calculate_lock_end_from_date(
+                trades.last_close_date(pair), self._stop_duration)  # type: ignore
 
             return True, until, self._reason()
 
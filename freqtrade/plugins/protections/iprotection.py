@@ -7,7 +7,8 @@ from typing import Any, Dict, List, Optional, Tuple
 from freqtrade.exchange import timeframe_to_minutes
 from freqtrade.misc import plural
 from freqtrade.mixins import LoggingMixin
-from freqtrade.persistence import LocalTrade
+from freqtrade.persistence import LocalTrade, Trade
+from freqtrade.plugins.protections.trade_window import TradeWindow
 
 
 logger = logging.getLogger(__name__)
@@ -42,6 +43,9 @@ class IProtection(LoggingMixin, ABC):
             self._lookback_period_candles = None
             self._lookback_period = int(protection_config.get('lookback_period', 60))
 
+        # Closed trades within the lookback period - updated incrementally in backtesting.
+        self._trade_window = TradeWindow(self._include_trade)
+
         LoggingMixin.__init__(self, logger)
 
     @property
@@ -95,12 +99,40 @@ class IProtection(LoggingMixin, ABC):
             If true, this pair will be locked with <reason> until <until>
         """
 
+    def _include_trade(self, trade: LocalTrade) -> bool:
+        """
+        Filter for closed trades relevant to this protection.
+        -> Overwrite in subclasses to only consider some trades
+        """
+        return True
+
+    def get_trade_window(self, look_back_until: datetime,
+                         pair: Optional[str] = None) -> TradeWindow:
+        """
+        Get closed trades (passing _include_trade()) with a close date after look_back_until.
+        In backtesting, the trade window of this protection is updated incrementally.
+        :param pair: Pair to query trades for. The returned window may contain other pairs,
+                     so use the pair when querying the window as well.
+        """
+        if Trade.use_db:
+            trades = Trade.get_trades_proxy(pair=pair, is_open=False, close_date=look_back_until)
+            return TradeWindow.from_trades(trades, self._include_trade)
+        self._trade_window.update(look_back_until)
+        return self._trade_window
+
     @staticmethod
     def calculate_lock_end(trades: List[LocalTrade], stop_minutes: int) -> datetime:
         """
         Get lock end time
         """
         max_date: datetime = max([trade.close_date for trade in trades if trade.close_date])
+        return IProtection.calculate_lock_end_from_date(max_date, stop_minutes)
+
+    @staticmethod
+    def calculate_lock_end_from_date(max_date: datetime, stop_minutes: int) -> datetime:
+        """
+        Get lock end time, based on the close date of the latest trade
+        """
         # comming from Database, tzinfo is not set.
         if max_date.tzinfo is None:
             max_date = max_date.replace(tzinfo=timezone.utc)
@@ -3,7 +3,6 @@ import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict
 
-from freqtrade.persistence import Trade
 from freqtrade.plugins.protections import IProtection, ProtectionReturn
 
 
@@ -47,18 +46,19 @@ class LowProfitPairs(IProtection):
         # if pair:
         #     filters.append(Trade.pair == pair)
 
-        trades = Trade.get_trades_proxy(pair=pair, is_open=False, close_date=look_back_until)
         # trades = Trade.get_trades(filters).all()
-        if len(trades) < self._trade_limit:
+        trades = self.get_trade_window(look_back_until, pair)
+        if trades.count(pair) < self._trade_limit:
             # Not enough trades in the relevant period
             return False, None, None
 
-        profit = sum(trade.close_profit for trade in trades if trade.close_profit)
+        profit = trades.profit(pair)
         if profit < self._required_profit:
             self.log_once(
                 f"Trading for {pair} stopped due to {profit:.2f} < {self._required_profit} "
                 f"within {self._lookback_period} minutes.", logger.info)
-            until = self.calculate_lock_end(trades, self._stop_duration)
+            until = self.calculate_lock_end_from_date(
+                trades.last_close_date(pair), self._stop_duration)  # type: ignore
 
             return True, until, self._reason(profit)
 
@@ -3,10 +3,6 @@ import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict
 
-import pandas as pd
-
-from freqtrade.data.btanalysis import calculate_max_drawdown
-from freqtrade.persistence import Trade
 from freqtrade.plugins.protections import IProtection, ProtectionReturn
 
 
@@ -45,26 +41,22 @@ class MaxDrawdown(IProtection):
         """
         look_back_until = date_now - timedelta(minutes=self._lookback_period)
 
-        trades = Trade.get_trades_proxy(is_open=False, close_date=look_back_until)
-
-        trades_df = pd.DataFrame([trade.to_json() for trade in trades])
+        trades = self.get_trade_window(look_back_until)
 
-        if len(trades) < self._trade_limit:
+        if trades.count() < self._trade_limit:
             # Not enough trades in the relevant period
             return False, None, None
 
         # Drawdown is always positive
-        try:
-            # TODO: This should use absolute profit calculation, considering account balance.
-            drawdown, _, _, _, _, _ = calculate_max_drawdown(trades_df, value_col='close_profit')
-        except ValueError:
-            return False, None, None
+        # TODO: This should use absolute profit calculation, considering account balance.
+        drawdown = trades.max_drawdown()
 
-        if drawdown > self._max_allowed_drawdown:
+        if drawdown > 0 and drawdown > self._max_allowed_drawdown:
             self.log_once(
                 f"Trading stopped due to Max Drawdown {drawdown:.2f} > {self._max_allowed_drawdown}"
                 f" within {self.lookback_period_str}.", logger.info)
-            until = self.calculate_lock_end(trades, self._stop_duration)
+            until = self.calculate_lock_end_from_date(
+                trades.last_close_date(), self._stop_duration)  # type: ignore
 
             return True, until, self._reason(drawdown)
 
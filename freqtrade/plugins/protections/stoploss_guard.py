@@ -4,7 +4,7 @@ from datetime import datetime, timedelta
 from typing import Any, Dict
 
 from freqtrade.enums import SellType
-from freqtrade.persistence import Trade
+from freqtrade.persistence import LocalTrade
 from freqtrade.plugins.protections import IProtection, ProtectionReturn
 
 
@@ -36,6 +36,15 @@ class StoplossGuard(IProtection):
         return (f'{self._trade_limit} stoplosses in {self._lookback_period} min, '
                 f'locking for {self._stop_duration} min.')
 
+    def _include_trade(self, trade: LocalTrade) -> bool:
+        """
+        Only losing trades closed by a stoploss count towards the trade limit
+        """
+        return bool(str(trade.sell_reason) in (
+            SellType.TRAILING_STOP_LOSS.value, SellType.STOP_LOSS.value,
+            SellType.STOPLOSS_ON_EXCHANGE.value)
+            and trade.close_profit and trade.close_profit < 0)
+
     def _stoploss_guard(self, date_now: datetime, pair: str = None) -> ProtectionReturn:
         """
         Evaluate recent trades
@@ -53,18 +62,15 @@ class StoplossGuard(IProtection):
         # trades = Trade.get_trades(filters).all()
         # TODO-lev: Liquidation price?
 
-        trades1 = Trade.get_trades_proxy(pair=pair, is_open=False, close_date=look_back_until)
-        trades = [trade for trade in trades1 if (str(trade.sell_reason) in (
-            SellType.TRAILING_STOP_LOSS.value, SellType.STOP_LOSS.value,
-            SellType.STOPLOSS_ON_EXCHANGE.value)
-            and trade.close_profit and trade.close_profit < 0)]
+        trades = self.get_trade_window(look_back_until, pair)
 
-        if len(trades) < self._trade_limit:
+        if trades.count(pair) < self._trade_limit:
             return False, None, None
 
         self.log_once(f"Trading stopped due to {self._trade_limit} "
                       f"stoplosses within {self._lookback_period} minutes.", logger.info)
-        until = self.calculate_lock_end(trades, self._stop_duration)
+        until = self.calculate_lock_end_from_date(
+            trades.last_close_date(pair), self._stop_duration)  # type: ignore
         return True, until, self._reason()
 
     def global_stop(self, date_now: datetime) -> ProtectionReturn:
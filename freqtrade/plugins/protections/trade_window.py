@@ -0,0 +1,161 @@
+"""
+Sliding window over closed trades, used by protections.
+"""
+from bisect import bisect_right
+from datetime import datetime
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from freqtrade.persistence import LocalTrade
+
+
+# Expired trades are dropped from the window once there are at least this many of them
+# (and they make up more than half of the window).
+COMPACT_MIN_EXPIRED = 1000
+
+
+class TradeWindow:
+    """
+    Closed trades with a close date after a lookback date, sorted by close date.
+    Number of trades and latest close date - per pair and for all pairs - are updated
+    as trades are added and expire, so evaluating a protection doesn't require
+    looking at every trade in the window.
+    """
+
+    def __init__(self, trade_filter: Optional[Callable[[LocalTrade], bool]] = None) -> None:
+        """
+        :param trade_filter: Only trades for which this returns True are added to the window.
+        """
+        self._trade_filter = trade_filter
+        self._reset()
+
+    def _reset(self) -> None:
+        self._trades: List[LocalTrade] = []
+        self._dates: List[datetime] = []
+        self._profits: List[float] = []
+        # Order in which trades were added
+        self._sequence: List[int] = []
+        self._added = 0
+        # Trades before this position have expired
+        self._start = 0
+        self._look_back_until: Optional[datetime] = None
+        # pair (None for all pairs) -> [trade count, latest close date]
+        self._stats: Dict[Optional[str], list] = {}
+        # Backtesting: trade list this window is synced with, and number of trades synced
+        self._source: Optional[List[LocalTrade]] = None
+        self._synced = 0
+
+    @classmethod
+    def from_trades(cls, trades: Iterable[LocalTrade],
+                    trade_filter: Optional[Callable[[LocalTrade], bool]] = None
+                    ) -> 'TradeWindow':
+        """
+        Create a window containing the given (already filtered by date) trades.
+        """
+        window = cls(trade_filter)
+        for trade in trades:
+            window.add(trade)
+        return window
+
+    def add(self, trade: LocalTrade) -> None:
+        """
+        Add a closed trade to the window.
+        Trades not passing the trade filter, or closed before the lookback date are ignored.
+        """
+        close_date = trade.close_date
+        if (close_date is None
+                or (self._look_back_until is not None and close_date <= self._look_back_until)
+                or (self._trade_filter and not self._trade_filter(trade))):
+            return
+        profit = trade.close_profit or 0.0
+        idx = bisect_right(self._dates, close_date, self._start)
+        self._trades.insert(idx, trade)
+        self._dates.insert(idx, close_date)
+        self._profits.insert(idx, profit)
+        self._sequence.insert(idx, self._added)
+        self._added += 1
+
+        for key in (None, trade.pair):
+            stats = self._stats.get(key)
+            if not stats or stats[0] == 0:
+                self._stats[key] = [1, close_date]
+            else:
+                stats[0] += 1
+                stats[1] = max(stats[1], close_date)
+
+    def expire(self, look_back_until: datetime) -> None:
+        """
+        Remove all trades closed at or before look_back_until from the window.
+        """
+        end = bisect_right(self._dates, look_back_until, self._start)
+        for trade in islice(self._trades, self._start, end):
+            self._stats[None][0] -= 1
+            self._stats[trade.pair][0] -= 1
+        self._start = end
+        self._look_back_until = look_back_until
+
+        if self._start >= COMPACT_MIN_EXPIRED and self._start * 2 > len(self._trades):
+            del self._trades[:self._start]
+            del self._dates[:self._start]
+            del self._profits[:self._start]
+            del self._sequence[:self._start]
+            self._start = 0
+
+    def update(self, look_back_until: datetime) -> None:
+        """
+        Backtesting: Add trades closed since the last update (from LocalTrade.trades)
+        and expire trades closed at or before look_back_until.
+        """
+        trades = LocalTrade.trades
+        if (trades is not self._source or len(trades) < self._synced
+                or (self._look_back_until is not None
+                    and look_back_until < self._look_back_until)):
+            # New backtest run (or evaluation of an earlier date) - rebuild the window
+            self._reset()
+            self._source = trades
+        self.expire(look_back_until)
+        for trade in islice(trades, self._synced, None):
+            self.add(trade)
+        self._synced = len(trades)
+
+    def count(self, pair: Optional[str] = None) -> int:
+        """
+        Number of trades in the window (for this pair, or for all pairs).
+        """
+        stats = self._stats.get(pair)
+        return stats[0] if stats else 0
+
+    def profit(self, pair: Optional[str] = None) -> float:
+        """
+        Sum of close_profit of the trades in the window (for this pair, or for all pairs).
+        Summed in the order the trades were added (not kept as running total) - so the result
+        is exactly the same as summing the profits of the trade list the window was built from.
+        """
+        if not self.count(pair):
+            return 0.0
+        profits = sorted(
+            (sequence, profit) for trade, sequence, profit in zip(
+                islice(self._trades, self._start, None),
+                islice(self._sequence, self._start, None),
+                islice(self._profits, self._start, None))
+            if pair is None or trade.pair == pair)
+        return sum(profit for _, profit in profits if profit)
+
+    def last_close_date(self, pair: Optional[str] = None) -> Optional[datetime]:
+        """
+        Latest close date of the trades in the window (for this pair, or for all pairs).
+        """
+        stats = self._stats.get(pair)
+        return stats[1] if stats and stats[0] else None
+
+    def max_drawdown(self) -> float:
+        """
+        Max drawdown of the cumulated close_profit of all trades in the window,
+        in close date order. Returns 0 if there is no drawdown.
+        """
+        if self._start >= len(self._profits):
+            return 0.0
+        cumulative = np.cumsum(self._profits[self._start:])
+        return float(np.max(np.maximum.accumulate(cumulative) - cumulative))
@@ -84,6 +84,7 @@ class StrategyResolver(IResolver):
                       ("trailing_only_offset_is_reached", None),
                       ("use_custom_stoploss",             None),
                       ("process_only_new_candles",        None),
+                      ("incremental_candle_count",        None),
                       ("order_types",                     None),
                       ("order_time_in_force",             None),
                       ("stake_currency",                  None),
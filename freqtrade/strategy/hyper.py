@@ -4,9 +4,13 @@ This module defines a base class for auto-hyperoptable strategies.
 """
 import logging
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from contextlib import suppress
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from pandas import DataFrame, Series
 
 from freqtrade.misc import deep_merge_dicts, json_load
 from freqtrade.optimize.hyperopt_tools import HyperoptTools
@@ -22,6 +26,80 @@ from freqtrade.exceptions import OperationalException
 
 logger = logging.getLogger(__name__)
 
+# Memory limit (in bytes) for cached indicator results of one process
+INDICATOR_CACHE_MAX_MEMORY = 256 * 1024 * 1024
+
+
+class IndicatorCache:
+    """
+    Least-recently-used cache for indicator results, limited by the memory of the results.
+    Used by BaseParameter.cached_indicator() to avoid recalculating the same indicator
+    for the same parameter value over and over again (e.g. in every hyperopt epoch).
+    Thread-safe - pairs may be analyzed concurrently (internals.analysis_workers).
+    """
+
+    def __init__(self, max_memory: int = INDICATOR_CACHE_MAX_MEMORY) -> None:
+        self.max_memory = max_memory
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self._results: 'OrderedDict[Hashable, Tuple[Union[Series, DataFrame], int]]' = \
+            OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+            self.memory = 0
+
+    def get(self, key: Hashable, dataframe: DataFrame,
+            func: Callable[[], Any]) -> Union[Series, DataFrame]:
+        """
+        Get the cached result for `key` - or calculate (and cache) it using `func`.
+        :param key: Key identifying the result
+        :param dataframe: Dataframe the result belongs to. Used for the index of the result.
+        :param func: Function calculating the result if it's not cached yet.
+        :return: Copy of the result, indexed like `dataframe`.
+        """
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                self.hits += 1
+                self._results.move_to_end(key)
+                result = cached[0]
+            else:
+                self.misses += 1
+        if cached is None:
+            # Calculated without holding the lock - so other threads are not blocked
+            result = func()
+            if not isinstance(result, (Series, DataFrame)):
+                result = Series(result, index=dataframe.index)
+            self._store(key, result.copy())
+        # Return a copy - so modifications by the caller can't alter the cache.
+        result = result.copy()
+        result.index = dataframe.index
+        return result
+
+    def _store(self, key: Hashable, result: Union[Series, DataFrame]) -> None:
+        size = int(Series(result.memory_usage(index=False)).sum())
+        if size > self.max_memory:
+            return
+        with self._lock:
+            if key in self._results:
+                # Calculated by another thread in the meantime
+                return
+            self._results[key] = (result, size)
+            self.memory += size
+            while self.memory > self.max_memory:
+                _, (_, evicted_size) = self._results.popitem(last=False)
+                self.memory -= evicted_size
+
+
+indicator_cache = IndicatorCache()
+
 
 class BaseParameter(ABC):
     """
@@ -32,6 +110,9 @@ class BaseParameter(ABC):
     value: Any
     in_space: bool = False
     name: str
+    # Set when the strategy loads its parameters - see cached_indicator()
+    _strategy_name: Optional[str] = None
+    _cache_indicators: bool = False
 
     def __init__(self, *, default: Any, space: Optional[str] = None,
                  optimize: bool = True, load: bool = True, **kwargs):
@@ -62,6 +143,39 @@ class BaseParameter(ABC):
         Get-space - will be used by Hyperopt to get the hyperopt Space
         """
 
+    def cached_indicator(self, dataframe: DataFrame, metadata: dict, indicator: str,
+                         func: Callable[[DataFrame, Any], Any]) -> Union[Series, DataFrame]:
+        """
+        Calculate an indicator depending on the current value of this parameter.
+        In backtesting and hyperopt, results are cached per strategy, pair, indicator and
+        parameter value - so during hyperopt, each value is only calculated once, instead of
+        once per epoch. In other modes (where candles change), the indicator is always calculated.
+        The result may only depend on the OHLCV columns of `dataframe` and the parameter value -
+        not on other (computed) columns, as these are not part of the cache key.
+        `indicator` identifies the calculation - `func` is not part of the cache key.
+        Calculations which differ in anything but the parameter value (e.g. the source column)
+        must therefore use different indicator names.
+        Usage: `self.buy_ema.cached_indicator(dataframe, metadata, 'ema',
+                                              lambda df, value: ta.EMA(df, timeperiod=value))`
+        :param dataframe: Dataframe to calculate the indicator on.
+        :param metadata: Additional information, like the currently traded pair.
+        :param indicator: Name uniquely identifying the calculation done by `func`
+                          (for this parameter).
+        :param func: Function calculating the indicator as `func(dataframe, value)`.
+        :return: Indicator values, indexed like `dataframe`.
+        """
+        value = self.value
+        if not self._cache_indicators:
+            result = func(dataframe, value)
+            if not isinstance(result, (Series, DataFrame)):
+                result = Series(result, index=dataframe.index)
+            return result
+        data_range = ((dataframe['date'].iloc[0], dataframe['date'].iloc[-1])
+                      if len(dataframe) > 0 else None)
+        key = (self._strategy_name, metadata.get('pair'), indicator, getattr(self, 'name', None),
+               value, len(dataframe), data_range)
+        return indicator_cache.get(key, dataframe, lambda: func(dataframe, value))
+
 
 class NumericParameter(BaseParameter):
     """ Internal parameter used for Numeric purposes """
@@ -307,6 +421,8 @@ class HyperStrategyMixin:
         self.ft_sell_params: List[BaseParameter] = []
         self.ft_protection_params: List[BaseParameter] = []
 
+        # Cached indicators of previously loaded strategies are of no use
+        indicator_cache.clear()
         self._load_hyper_params(config.get('runmode') == RunMode.HYPEROPT)
 
     def enumerate_parameters(self, category: str = None) -> Iterator[Tuple[str, BaseParameter]]:
@@ -405,6 +521,10 @@ class HyperStrategyMixin:
         for attr_name, attr in self.detect_parameters(space):
             attr.name = attr_name
             attr.in_space = hyperopt and HyperoptTools.has_space(self.config, space)
+            attr._strategy_name = self.__class__.__name__
+            # Candles don't change while backtesting - but do in dry-run / live
+            attr._cache_indicators = self.config.get('runmode') in (RunMode.BACKTEST,
+                                                                    RunMode.HYPEROPT)
             if not attr.category:
                 attr.category = space
 
@@ -5,15 +5,17 @@ This module defines the interface to apply for strategies
 import logging
 import warnings
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple, Union
 
 import arrow
-from pandas import DataFrame
+from pandas import DataFrame, concat
 
 from freqtrade.constants import ListPairsWithTimeframes
 from freqtrade.data.dataprovider import DataProvider
-from freqtrade.enums import CandleType, SellType, SignalDirection, SignalTagType, SignalType
+from freqtrade.enums import (CandleType, RunMode, SellType, SignalDirection, SignalTagType,
+                             SignalType)
 from freqtrade.exceptions import OperationalException, StrategyError
 from freqtrade.exchange import timeframe_to_minutes, timeframe_to_seconds
 from freqtrade.exchange.exchange import timeframe_to_next_date
@@ -101,6 +103,10 @@ class IStrategy(ABC, HyperStrategyMixin):
     # run "populate_indicators" only for new candle
     process_only_new_candles: bool = False
 
+    # Analyze only new (or changed) candles, plus this number of candles before them -
+    # and reuse the previous analysis for older candles (dry/live only). 0 to disable.
+    incremental_candle_count: int = 0
+
     use_sell_signal: bool
     sell_profit_only: bool
     sell_profit_offset: float
@@ -574,7 +580,9 @@ class IStrategy(ABC, HyperStrategyMixin):
         if (not self.process_only_new_candles or
                 self._last_candle_seen_per_pair.get(pair, None) != dataframe.iloc[-1]['date']):
             # Defs that only make change on new candle data.
-            dataframe = self.analyze_ticker(dataframe, metadata)
+            analyzed = self._analyze_ticker_incremental(dataframe, metadata)
+            dataframe = (analyzed if analyzed is not None
+                         else self.analyze_ticker(dataframe, metadata))
             self._last_candle_seen_per_pair[pair] = dataframe.iloc[-1]['date']
             if self.dp:
                 self.dp._set_cached_df(
@@ -595,6 +603,55 @@ class IStrategy(ABC, HyperStrategyMixin):
 
         return dataframe
 
+    def _analyze_ticker_incremental(self, dataframe: DataFrame,
+                                    metadata: dict) -> Optional[DataFrame]:
+        """
+        Analyze only candles which are new or changed since the last analysis of this pair,
+        using `incremental_candle_count` candles before them for indicator warm-up.
+        Results are spliced into the previously analyzed dataframe (from the dataprovider).
+        :param dataframe: Dataframe containing data from exchange
+        :param metadata: Metadata dictionary with additional data (e.g. 'pair')
+        :return: Analyzed dataframe - or None if the full dataframe must be analyzed.
+        """
+        if (not self.incremental_candle_count or not self.dp
+                or self.dp.runmode not in (RunMode.DRY_RUN, RunMode.LIVE)):
+            return None
+        previous, _ = self.dp.get_analyzed_dataframe(str(metadata.get('pair')), self.timeframe)
+        if previous.empty or 'date' not in previous:
+            return None
+
+        # Number of candles which were part of the previous analysis
+        overlap = int(dataframe['date'].searchsorted(previous['date'].iloc[-1], side='right'))
+        offset = len(previous) - overlap
+        if overlap == 0 or offset < 0:
+            return None
+        candles = dataframe.iloc[:overlap]
+        if not (previous['date'].iloc[offset:].values == candles['date'].values).all():
+            return None
+        # Candles may change after being analyzed (e.g. the incomplete last candle)
+        ohlcv = ['open', 'high', 'low', 'close', 'volume']
+        unchanged = (previous[ohlcv].iloc[offset:].to_numpy() == candles[ohlcv].to_numpy()
+                     ).all(axis=1)
+        first_changed = overlap if unchanged.all() else int(unchanged.argmin())
+        # Always analyze at least the last candle
+        analyze_count = max(len(dataframe) - first_changed, 1)
+        start = len(dataframe) - analyze_count - self.incremental_candle_count
+        if start <= 0:
+            return None
+
+        logger.debug(f"Incremental TA Analysis of {analyze_count} candles")
+        window = self.analyze_ticker(dataframe.iloc[start:].copy(), metadata)
+        if (len(window) != len(dataframe) - start
+                or set(window.columns) != set(previous.columns)):
+            # Strategy added columns (or changed the length) - analyze the full dataframe
+            return None
+
+        keep = len(dataframe) - analyze_count
+        result = concat([previous.iloc[offset:offset + keep],
+                         window.iloc[-analyze_count:][previous.columns]])
+        result.index = dataframe.index
+        return result
+
     def analyze_pair(self, pair: str) -> None:
         """
         Fetch data for this pair from dataprovider and analyze.
@@ -630,10 +687,22 @@ class IStrategy(ABC, HyperStrategyMixin):
     def analyze(self, pairs: List[str]) -> None:
         """
         Analyze all pairs using analyze_pair().
+        Pairs are analyzed concurrently if `internals.analysis_workers` is > 1.
         :param pairs: List of pairs to analyze
         """
-        for pair in pairs:
-            self.analyze_pair(pair)
+        workers = self.config.get('internals', {}).get('analysis_workers', 1)
+        if workers <= 1 or len(pairs) <= 1:
+            for pair in pairs:
+                self.analyze_pair(pair)
+            return
+
+        # Indicator calculations (numpy / TA-Lib) mostly release the GIL.
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='analyze') as executor:
+            futures = [executor.submit(self.analyze_pair, pair) for pair in pairs]
+        # Strategy errors are handled per pair in analyze_pair(). Other exceptions are
+        # raised in pair order - after all pairs have been analyzed.
+        for future in futures:
+            future.result()
 
     @staticmethod
     def preserve_df(dataframe: DataFrame) -> Tuple[int, float, datetime]:
@@ -4,8 +4,9 @@ Main Freqtrade worker class.
 import logging
 import time
 import traceback
+from datetime import datetime, timezone
 from os import getpid
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import sdnotify
 
@@ -13,6 +14,7 @@ from freqtrade import __version__, constants
 from freqtrade.configuration import Configuration
 from freqtrade.enums import State
 from freqtrade.exceptions import OperationalException, TemporaryError
+from freqtrade.exchange import timeframe_to_next_date
 from freqtrade.freqtradebot import FreqtradeBot
 
 
@@ -36,6 +38,8 @@ class Worker:
 
         self.last_throttle_start_time: float = 0
         self._heartbeat_msg: float = 0
+        # Time of the next full iteration - if process_on_candle_close is enabled
+        self._next_candle_run: float = 0
 
         # Tell systemd that we completed initialization phase
         self._notify("READY=1")
@@ -55,6 +59,10 @@ class Worker:
         self._throttle_secs = internals_config.get('process_throttle_secs',
                                                    constants.PROCESS_THROTTLE_SECS)
         self._heartbeat_interval = internals_config.get('heartbeat_interval', 60)
+        self._process_on_candle_close = internals_config.get('process_on_candle_close', False)
+        self._candle_close_offset = internals_config.get('candle_close_offset_secs',
+                                                         constants.CANDLE_CLOSE_OFFSET_SECS)
+        self._next_candle_run = 0
 
         self._sd_notify = sdnotify.SystemdNotifier() if \
             self._config.get('internals', {}).get('sd_notify', False) else None
@@ -100,6 +108,8 @@ class Worker:
             # Reset heartbeat timestamp to log the heartbeat message at
             # first throttling iteration when the state changes
             self._heartbeat_msg = 0
+            # Run a full iteration first
+            self._next_candle_run = 0
 
         if state == State.STOPPED:
             # Ping systemd watchdog before sleeping in the stopped state
@@ -111,7 +121,12 @@ class Worker:
             # Ping systemd watchdog before throttling
             self._notify("WATCHDOG=1\nSTATUS=State: RUNNING.")
 
-            self._throttle(func=self._process_running, throttle_secs=self._throttle_secs)
+            if self._process_on_candle_close:
+                self._throttle(func=self._process_running, throttle_secs=self._throttle_secs,
+                               timeframes=self._candle_timeframes(),
+                               timeframe_offset=self._candle_close_offset)
+            else:
+                self._throttle(func=self._process_running, throttle_secs=self._throttle_secs)
 
         if self._heartbeat_interval:
             now = time.time()
@@ -126,12 +141,17 @@ class Worker:
 
         return state
 
-    def _throttle(self, func: Callable[..., Any], throttle_secs: float, *args, **kwargs) -> Any:
+    def _throttle(self, func: Callable[..., Any], throttle_secs: float, *args,
+                  timeframes: Optional[List[str]] = None, timeframe_offset: float = 1.0,
+                  **kwargs) -> Any:
         """
         Throttles the given callable that it
         takes at least `min_secs` to finish execution.
         :param func: Any callable
         :param throttle_secs: throttling interation execution time limit in seconds
+        :param timeframes: Wake up right after the next candle close of these timeframes,
+                           even if throttle_secs have not passed yet.
+        :param timeframe_offset: Seconds to wait after the candle close
         :return: Any (result of execution of func)
         """
         self.last_throttle_start_time = time.time()
@@ -139,17 +159,45 @@ class Worker:
         result = func(*args, **kwargs)
         time_passed = time.time() - self.last_throttle_start_time
         sleep_duration = max(throttle_secs - time_passed, 0.0)
+        if timeframes:
+            next_close = self._next_candle_close(timeframes, timeframe_offset,
+                                                 self.last_throttle_start_time)
+            sleep_duration = max(min(sleep_duration, next_close - time.time()), 0.0)
         logger.debug(f"Throttling with '{func.__name__}()': sleep for {sleep_duration:.2f} s, "
                      f"last iteration took {time_passed:.2f} s.")
         time.sleep(sleep_duration)
         return result
 
+    @staticmethod
+    def _next_candle_close(timeframes: List[str], offset: float, after: float) -> float:
+        """
+        First candle close (plus offset) of any of the timeframes after the given time.
+        :param timeframes: List of timeframes
+        :param offset: Seconds to add to the candle close
+        :param after: Timestamp (in seconds)
+        :return: Timestamp (in seconds)
+        """
+        date = datetime.fromtimestamp(after - offset, tz=timezone.utc)
+        return min(timeframe_to_next_date(timeframe, date).timestamp()
+                   for timeframe in timeframes) + offset
+
+    def _candle_timeframes(self) -> List[str]:
+        """
+        Strategy timeframe and informative timeframes
+        """
+        strategy = self.freqtrade.strategy
+        return list({strategy.timeframe} | {
+            timeframe for _, timeframe, _ in strategy.gather_informative_pairs()})
+
     def _process_stopped(self) -> None:
         self.freqtrade.process_stopped()
 
     def _process_running(self) -> None:
         try:
-            self.freqtrade.process()
+            if self._process_on_candle_close:
+                self._process_on_candle()
+            else:
+                self.freqtrade.process()
         except TemporaryError as error:
             logger.warning(f"Error: {error}, retrying in {constants.RETRY_TIMEOUT} seconds...")
             time.sleep(constants.RETRY_TIMEOUT)
@@ -162,6 +210,21 @@ class Worker:
             logger.exception('OperationalException. Stopping trader ...')
             self.freqtrade.state = State.STOPPED
 
+    def _process_on_candle(self) -> None:
+        """
+        Run a full iteration once a candle closed since the last full iteration -
+        and a lighter iteration (handling open orders and trades) otherwise.
+        """
+        now = time.time()
+        if now >= self._next_candle_run:
+            next_run = self._next_candle_close(self._candle_timeframes(),
+                                               self._candle_close_offset, now)
+            self.freqtrade.process()
+            # Failed iterations are repeated
+            self._next_candle_run = next_run
+        else:
+            self.freqtrade.process_between_candles()
+
     def _reconfigure(self) -> None:
         """
         Cleans up current freqtradebot instance, reloads the configuration and
@@ -55,7 +55,6 @@ setup(
         'technical',
         'tabulate',
         'pycoingecko',
-        'py_find_1st',
         'python-rapidjson',
         'sdnotify',
         'colorama',
@@ -66,6 +65,7 @@ setup(
         'pandas',
         'tables',
         'blosc',
+        'pyarrow',
         'fastapi',
         'uvicorn',
         'psutil',
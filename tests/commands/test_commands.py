@@ -1,7 +1,9 @@
 import json
 import re
+from copy import deepcopy
 from io import BytesIO
 from pathlib import Path
+from typing import Dict, List
 from unittest.mock import MagicMock, PropertyMock
 from zipfile import ZipFile
 
@@ -19,6 +21,7 @@ from freqtrade.commands.deploy_commands import (clean_ui_subdir, download_and_in
 from freqtrade.configuration import setup_utils_configuration
 from freqtrade.enums import RunMode
 from freqtrade.exceptions import OperationalException
+from freqtrade.optimize.hyperopt_results_store import HyperoptResultsStore
 from tests.conftest import (CURRENT_TEST_STRATEGY, create_mock_trades, get_args, log_has,
                             log_has_re, patch_exchange, patched_configuration_load_config_file)
 from tests.conftest_trades import MOCK_TRADE_COUNT
@@ -952,20 +955,21 @@ def test_start_test_pairlist(mocker, caplog, tickers, default_conf, capsys):
         pytest.fail(f'Expected well formed JSON, but failed to parse: {captured.out}')
 
 
-def test_hyperopt_list(mocker, capsys, caplog, saved_hyperopt_results, tmpdir):
-    csv_file = Path(tmpdir) / "test.csv"
-    mocker.patch(
-        'freqtrade.optimize.hyperopt_tools.HyperoptTools._test_hyperopt_results_exist',
-        return_value=True
-    )
+def write_hyperopt_results(results_file: Path, epochs: List[Dict]) -> None:
+    epochs = deepcopy(epochs)
+    for epoch in epochs:
+        # Hyperopt stores the roi table with string keys
+        epoch['params_details']['roi'] = {str(k): v
+                                          for k, v in epoch['params_details']['roi'].items()}
+    HyperoptResultsStore(results_file).append(epochs)
 
-    def fake_iterator(*args, **kwargs):
-        yield from [saved_hyperopt_results]
 
-    mocker.patch(
-        'freqtrade.optimize.hyperopt_tools.HyperoptTools._read_results',
-        side_effect=fake_iterator
-    )
+def test_hyperopt_list(mocker, capsys, caplog, saved_hyperopt_results, tmpdir):
+    csv_file = Path(tmpdir) / "test.csv"
+    results_file = Path(tmpdir) / "hyperopt_results.fthypt"
+    write_hyperopt_results(results_file, saved_hyperopt_results)
+    mocker.patch('freqtrade.commands.hyperopt_commands.get_latest_hyperopt_file',
+                 return_value=results_file)
 
     args = [
         "hyperopt-list",
@@ -1190,24 +1194,15 @@ def test_hyperopt_list(mocker, capsys, caplog, saved_hyperopt_results, tmpdir):
     log_has("CSV file created: test_file.csv", caplog)
     assert csv_file.is_file()
     line = csv_file.read_text()
-    assert ('Best,1,2,-1.25%,-1.2222,-0.00125625,,-2.51,"3,930.0 m",0.43662' in line
-            or "Best,1,2,-1.25%,-1.2222,-0.00125625,,-2.51,2 days 17:30:00,0.43662" in line)
+    assert 'Best,1,2,-1.25%,-1.2222,-0.00125625,,-2.51,"2 days, 17:30:00",0.43662' in line
     csv_file.unlink()
 
 
-def test_hyperopt_show(mocker, capsys, saved_hyperopt_results):
-    mocker.patch(
-        'freqtrade.optimize.hyperopt_tools.HyperoptTools._test_hyperopt_results_exist',
-        return_value=True
-    )
-
-    def fake_iterator(*args, **kwargs):
-        yield from [saved_hyperopt_results]
-
-    mocker.patch(
-        'freqtrade.optimize.hyperopt_tools.HyperoptTools._read_results',
-        side_effect=fake_iterator
-    )
+def test_hyperopt_show(mocker, capsys, saved_hyperopt_results, tmpdir):
+    results_file = Path(tmpdir) / "hyperopt_results.fthypt"
+    write_hyperopt_results(results_file, saved_hyperopt_results)
+    mocker.patch('freqtrade.commands.hyperopt_commands.get_latest_hyperopt_file',
+                 return_value=results_file)
     mocker.patch('freqtrade.commands.hyperopt_commands.show_backtest_result')
 
     args = [
@@ -4,12 +4,13 @@ from pathlib import Path
 from shutil import copyfile
 
 import pytest
+from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration.timerange import TimeRange
 from freqtrade.data.converter import (convert_ohlcv_format, convert_trades_format,
-                                      ohlcv_fill_up_missing_data, ohlcv_to_dataframe,
-                                      trades_dict_to_list, trades_remove_duplicates,
-                                      trades_to_ohlcv, trim_dataframe)
+                                      ohlcv_append_to_dataframe, ohlcv_fill_up_missing_data,
+                                      ohlcv_to_dataframe, trades_dict_to_list,
+                                      trades_remove_duplicates, trades_to_ohlcv, trim_dataframe)
 from freqtrade.data.history import (get_timerange, load_data, load_pair_history,
                                     validate_backtest_data)
 from freqtrade.data.history.idatahandler import IDataHandler
@@ -184,6 +185,44 @@ def test_ohlcv_drop_incomplete(caplog):
     assert log_has("Dropping last candle", caplog)
 
 
+@pytest.mark.parametrize('drop_incomplete', [True, False])
+def test_ohlcv_append_to_dataframe(drop_incomplete):
+    timeframe = '1h'
+    start = 1559750400000
+    ticks = [[start + i * 3600000, 1.0 + i, 2.0 + i, 0.5 + i, 1.5 + i, 100 + i]
+             for i in range(30)]
+    cached = ohlcv_to_dataframe(ticks[:20], timeframe, pair="UNITTEST/BTC",
+                                drop_incomplete=drop_incomplete)
+
+    # Latest candles, overlapping the cached ones - last candle updated
+    latest = [list(t) for t in ticks[5:]]
+    latest[-1][4] = 42.0
+    res = ohlcv_append_to_dataframe(cached, latest, timeframe,
+                                    drop_incomplete=drop_incomplete)
+    expected = ohlcv_to_dataframe(latest, timeframe, pair="UNITTEST/BTC",
+                                  drop_incomplete=drop_incomplete)
+    assert_frame_equal(res, expected)
+    # Cached dataframe is not modified
+    assert len(cached) == (19 if drop_incomplete else 20)
+
+    # No new candle
+    res = ohlcv_append_to_dataframe(cached, ticks[5:20], timeframe,
+                                    drop_incomplete=drop_incomplete)
+    assert_frame_equal(res, ohlcv_to_dataframe(ticks[5:20], timeframe, pair="UNITTEST/BTC",
+                                               drop_incomplete=drop_incomplete))
+
+    # Gap to the cached candles
+    assert ohlcv_append_to_dataframe(cached, ticks[22:], timeframe) is None
+    # Older candles than the cached ones
+    assert ohlcv_append_to_dataframe(cached[5:], ticks, timeframe) is None
+    # Gap, duplicate candle, missing value
+    assert ohlcv_append_to_dataframe(cached, ticks[5:15] + ticks[16:], timeframe) is None
+    assert ohlcv_append_to_dataframe(cached, ticks[5:] + ticks[-1:], timeframe) is None
+    assert ohlcv_append_to_dataframe(cached, ticks[5:-1] + [ticks[-1][:4] + [None, 5]],
+                                     timeframe) is None
+    assert ohlcv_append_to_dataframe(cached, [], timeframe) is None
+
+
 def test_trim_dataframe(testdatadir) -> None:
     data = load_data(
         datadir=testdatadir,
@@ -15,6 +15,7 @@ from pandas.testing import assert_frame_equal
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import AVAILABLE_DATAHANDLERS
 from freqtrade.data.converter import ohlcv_to_dataframe
+from freqtrade.data.history.featherdatahandler import FeatherDataHandler
 from freqtrade.data.history.hdf5datahandler import HDF5DataHandler
 from freqtrade.data.history.history_utils import (_download_pair_history, _download_trades_history,
                                                   _load_cached_data_for_updating,
@@ -108,6 +109,25 @@ def test_load_data_mark(ohlcv_history, mocker, caplog, testdatadir) -> None:
     )
 
 
+def test_load_data_concurrently(caplog, testdatadir) -> None:
+    pairs = ['UNITTEST/BTC', 'XLM/BTC', 'NONEXIST/BTC', 'ETH/BTC', 'ADA/BTC']
+    timerange = TimeRange.parse_timerange('20180115-20180119')
+    data = load_data(datadir=testdatadir, timeframe='5m', pairs=pairs, timerange=timerange)
+    data_concurrent = load_data(datadir=testdatadir, timeframe='5m', pairs=pairs,
+                                timerange=timerange, data_load_workers=2)
+
+    assert log_has('Loading data for 5 pairs using 2 processes.', caplog)
+    # Pairs without data are skipped, order of pairs is kept
+    assert list(data_concurrent) == list(data) == ['UNITTEST/BTC', 'XLM/BTC', 'ETH/BTC',
+                                                   'ADA/BTC']
+    for pair in data:
+        assert data_concurrent[pair].equals(data[pair])
+
+    caplog.clear()
+    load_data(datadir=testdatadir, timeframe='5m', pairs=['UNITTEST/BTC'], data_load_workers=2)
+    assert not log_has_re(r'Loading data for .* processes\.', caplog)
+
+
 def test_load_data_startup_candles(mocker, caplog, default_conf, testdatadir) -> None:
     ltfmock = mocker.patch(
         'freqtrade.data.history.jsondatahandler.JsonDataHandler._ohlcv_load',
@@ -319,6 +339,9 @@ def test_download_pair_history2(mocker, default_conf, testdatadir) -> None:
     json_dump_mock = mocker.patch(
         'freqtrade.data.history.jsondatahandler.JsonDataHandler.ohlcv_store',
         return_value=None)
+    json_append_mock = mocker.patch(
+        'freqtrade.data.history.jsondatahandler.JsonDataHandler.ohlcv_append',
+        return_value=None)
     mocker.patch('freqtrade.exchange.Exchange.get_historic_ohlcv', return_value=tick)
     exchange = get_patched_exchange(mocker, default_conf)
     _download_pair_history(datadir=testdatadir, exchange=exchange, pair="UNITTEST/BTC",
@@ -327,7 +350,9 @@ def test_download_pair_history2(mocker, default_conf, testdatadir) -> None:
                            timeframe='3m')
     _download_pair_history(datadir=testdatadir, exchange=exchange, pair="UNITTEST/USDT",
                            timeframe='1h', candle_type='mark')
-    assert json_dump_mock.call_count == 3
+    # Existing data is appended to, new data is stored
+    assert json_dump_mock.call_count == 1
+    assert json_append_mock.call_count == 2
 
 
 def test_download_backtesting_data_exception(mocker, caplog, default_conf, tmpdir) -> None:
@@ -771,7 +796,8 @@ def test_jsondatahandler_ohlcv_purge(mocker, testdatadir):
     mocker.patch.object(Path, "exists", MagicMock(return_value=True))
     assert dh.ohlcv_purge('UNITTEST/NONEXIST', '5m', '')
     assert dh.ohlcv_purge('UNITTEST/NONEXIST', '5m', candle_type='mark')
-    assert unlinkmock.call_count == 2
+    # Data file and tail file
+    assert unlinkmock.call_count == 4
 
 
 def test_jsondatahandler_ohlcv_load(testdatadir, caplog):
@@ -815,13 +841,53 @@ def test_jsondatahandler_trades_purge(mocker, testdatadir):
     assert unlinkmock.call_count == 1
 
 
-@pytest.mark.parametrize('datahandler', AVAILABLE_DATAHANDLERS)
-def test_datahandler_ohlcv_append(datahandler, testdatadir, ):
-    dh = get_datahandler(testdatadir, datahandler)
+@pytest.mark.parametrize('datahandler', ['json', 'jsongz', 'hdf5'])
+@pytest.mark.parametrize('candle_type,subdir', [('spot', ''), ('mark', 'futures')])
+def test_datahandler_ohlcv_append(mocker, datahandler, candle_type, subdir, testdatadir, tmpdir):
+    tmpdir1 = Path(tmpdir)
+    (tmpdir1 / subdir).mkdir(exist_ok=True)
+    ohlcv = JsonDataHandler(testdatadir).ohlcv_load('UNITTEST/BTC', '5m', CandleType.SPOT)
+    dh = get_datahandler(tmpdir1, datahandler)
+    file = dh._pair_data_filename(tmpdir1, 'UNITTEST/NEW', '5m', candle_type)
+
+    # Appending without existing data stores the data
+    dh.ohlcv_append('UNITTEST/NEW', '5m', ohlcv.iloc[:100], candle_type)
+    assert file.is_file()
+    assert dh._ohlcv_load('UNITTEST/NEW', '5m', None, candle_type).equals(ohlcv.iloc[:100])
+
+    mtime = file.stat().st_mtime_ns
+    # Overlapping candles replace stored candles
+    new_candles = ohlcv.iloc[95:200].copy()
+    new_candles.loc[new_candles.index[0], 'close'] = 42
+    dh.ohlcv_append('UNITTEST/NEW', '5m', new_candles, candle_type)
+    dh.ohlcv_append('UNITTEST/NEW', '5m', ohlcv.iloc[200:250], candle_type)
+    dh.ohlcv_append('UNITTEST/NEW', '5m', ohlcv.iloc[:0], candle_type)
+
+    expected = ohlcv.iloc[:250].copy()
+    expected.loc[95, 'close'] = 42
+    assert dh._ohlcv_load('UNITTEST/NEW', '5m', None, candle_type).equals(expected)
+    assert dh.ohlcv_load('UNITTEST/NEW', '5m', candle_type, drop_incomplete=False).equals(expected)
+    if datahandler != 'hdf5':
+        # Main json file is not rewritten - candles are appended to the tail.
+        assert file.stat().st_mtime_ns == mtime
+        tail_file = dh._pair_data_tail_filename(file)
+        assert tail_file.is_file()
+
+        # Tail is merged into the data file once it becomes too long
+        mocker.patch('freqtrade.data.history.jsondatahandler.OHLCV_TAIL_MAX_CANDLES', 200)
+        dh.ohlcv_append('UNITTEST/NEW', '5m', ohlcv.iloc[250:], candle_type)
+        assert not tail_file.is_file()
+        assert dh._ohlcv_load('UNITTEST/NEW', '5m', None, candle_type).iloc[250:].equals(
+            ohlcv.iloc[250:])
+
+        assert dh.ohlcv_purge('UNITTEST/NEW', '5m', candle_type)
+        assert not file.is_file()
+
+
+def test_featherdatahandler_ohlcv_append(testdatadir):
+    dh = get_datahandler(testdatadir, 'feather')
     with pytest.raises(NotImplementedError):
         dh.ohlcv_append('UNITTEST/ETH', '5m', DataFrame(), CandleType.SPOT)
-    with pytest.raises(NotImplementedError):
-        dh.ohlcv_append('UNITTEST/ETH', '5m', DataFrame(), CandleType.MARK)
 
 
 @pytest.mark.parametrize('datahandler', AVAILABLE_DATAHANDLERS)
@@ -966,6 +1032,97 @@ def test_hdf5datahandler_ohlcv_purge(mocker, testdatadir):
     assert unlinkmock.call_count == 2
 
 
+@pytest.mark.parametrize('pair,timeframe,candle_type,candle_append,startdt,enddt', [
+    # Data goes from 2018-01-10 - 2018-01-30
+    ('UNITTEST/BTC', '5m', 'spot',  '', '2018-01-15', '2018-01-19'),
+    # Mark data goes from to 2021-11-15 2021-11-19
+    ('UNITTEST/USDT', '1h', 'mark', '-mark', '2021-11-16', '2021-11-18'),
+])
+def test_featherdatahandler_ohlcv_load_and_resave(
+    mocker,
+    testdatadir,
+    tmpdir,
+    pair,
+    timeframe,
+    candle_type,
+    candle_append,
+    startdt, enddt
+):
+    tmpdir1 = Path(tmpdir)
+    tmpdir2 = tmpdir1
+    if candle_type not in ('', 'spot'):
+        tmpdir2 = tmpdir1 / 'futures'
+        tmpdir2.mkdir()
+    # Store in multiple batches to verify loading of partial timeranges
+    mocker.patch('freqtrade.data.history.featherdatahandler.OHLCV_BATCH_SIZE', 20)
+    dh = JsonDataHandler(testdatadir)
+    ohlcv = dh._ohlcv_load(pair, timeframe, None, candle_type=candle_type)
+    assert len(ohlcv) > 0
+
+    file = tmpdir2 / f"UNITTEST_NEW-{timeframe}{candle_append}.feather"
+    assert not file.is_file()
+
+    dh1 = FeatherDataHandler(tmpdir1)
+    dh1.ohlcv_store('UNITTEST/NEW', timeframe, ohlcv, candle_type=candle_type)
+    assert file.is_file()
+    assert dh1.ohlcv_get_pairs(tmpdir1, timeframe, candle_type) == ['UNITTEST/NEW']
+
+    ohlcv1 = dh1._ohlcv_load('UNITTEST/NEW', timeframe, None, candle_type=candle_type)
+    assert ohlcv1.equals(ohlcv)
+
+    timerange = TimeRange.parse_timerange(f"{startdt.replace('-', '')}-{enddt.replace('-', '')}")
+
+    # Call private function to ensure timerange is filtered while loading
+    ohlcv1 = dh1._ohlcv_load('UNITTEST/NEW', timeframe, timerange, candle_type=candle_type)
+    ohlcv = ohlcv[(ohlcv['date'] >= startdt) & (ohlcv['date'] <= enddt)].reset_index(drop=True)
+    assert len(ohlcv1) > 0
+    assert ohlcv1.equals(ohlcv)
+
+    # Open ended timeranges
+    timerange = TimeRange.parse_timerange(f"{startdt.replace('-', '')}-")
+    ohlcv1 = dh1._ohlcv_load('UNITTEST/NEW', timeframe, timerange, candle_type=candle_type)
+    assert ohlcv1.iloc[0]['date'] == ohlcv.iloc[0]['date']
+    assert ohlcv1[ohlcv1['date'] < startdt].empty
+    timerange = TimeRange.parse_timerange(f"-{enddt.replace('-', '')}")
+    ohlcv1 = dh1._ohlcv_load('UNITTEST/NEW', timeframe, timerange, candle_type=candle_type)
+    assert ohlcv1.iloc[-1]['date'] == ohlcv.iloc[-1]['date']
+    assert ohlcv1[ohlcv1['date'] > enddt].empty
+
+    # Timerange after available data
+    timerange = TimeRange.parse_timerange("20300101-")
+    ohlcv1 = dh1._ohlcv_load('UNITTEST/NEW', timeframe, timerange, candle_type=candle_type)
+    assert ohlcv1.empty
+    assert list(ohlcv1.columns) == list(ohlcv.columns)
+
+    # Try loading inexisting file
+    ohlcv = dh1.ohlcv_load('UNITTEST/NONEXIST', timeframe, candle_type=candle_type)
+    assert ohlcv.empty
+
+
+def test_featherdatahandler_trades_load_and_store(testdatadir, tmpdir):
+    tmpdir1 = Path(tmpdir)
+    trades = JsonGzDataHandler(testdatadir).trades_load('XRP/ETH')
+
+    dh = FeatherDataHandler(tmpdir1)
+    dh.trades_store('XRP/NEW', trades)
+    assert (tmpdir1 / 'XRP_NEW-trades.feather').is_file()
+    assert dh.trades_get_pairs(tmpdir1) == ['XRP/NEW']
+
+    trades_new = dh.trades_load('XRP/NEW')
+    assert trades_new == trades
+    assert dh.trades_load('UNITTEST/NONEXIST') == []
+
+    # data goes from 2019-10-11 - 2019-10-13
+    timerange = TimeRange.parse_timerange('20191011-20191012')
+    trades2 = dh._trades_load('XRP/NEW', timerange)
+    assert 0 < len(trades2) < len(trades)
+    assert len([t for t in trades2 if t[0] < timerange.startts * 1000]) == 0
+    assert len([t for t in trades2 if t[0] >= timerange.stopts * 1000]) == 0
+
+    with pytest.raises(NotImplementedError):
+        dh.trades_append('XRP/NEW', [])
+
+
 def test_gethandlerclass():
     cl = get_datahandlerclass('json')
     assert cl == JsonDataHandler
@@ -977,6 +1134,9 @@ def test_gethandlerclass():
     cl = get_datahandlerclass('hdf5')
     assert cl == HDF5DataHandler
     assert issubclass(cl, IDataHandler)
+    cl = get_datahandlerclass('feather')
+    assert cl == FeatherDataHandler
+    assert issubclass(cl, IDataHandler)
     with pytest.raises(ValueError, match=r"No datahandler for .*"):
         get_datahandlerclass('DeadBeef')
 
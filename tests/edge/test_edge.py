@@ -3,6 +3,9 @@
 
 import logging
 import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import arrow
@@ -14,7 +17,7 @@ from freqtrade.data.converter import ohlcv_to_dataframe
 from freqtrade.edge import Edge, PairInfo
 from freqtrade.enums import SellType
 from freqtrade.exceptions import OperationalException
-from tests.conftest import get_patched_freqtradebot, log_has
+from tests.conftest import get_patched_freqtradebot, log_has, log_has_re
 from tests.optimize import (BTContainer, BTrade, _build_backtest_dataframe,
                             _get_frame_time_from_offset)
 
@@ -153,7 +156,7 @@ def test_edge_results(edge_conf, mocker, caplog, data) -> None:
     edge.fee = 0
 
     trades = edge._find_trades_for_stoploss_range(frame, 'TEST/BTC', [data.stop_loss])
-    results = edge._fill_calculable_fields(DataFrame(trades)) if trades else DataFrame()
+    results = edge._fill_calculable_fields(trades) if len(trades) else DataFrame()
 
     assert len(trades) == len(data.trades)
 
@@ -268,6 +271,77 @@ def test_edge_heartbeat_calculate(mocker, edge_conf):
     assert edge.calculate(edge_conf['exchange']['pair_whitelist']) is False
 
 
+def _edge_calculation(config, pairs, fee, timerange, cached_pairs):
+    # Runs in the (spawned) calculation process - waits until the test creates wait_file
+    wait_file = Path(config['edge']['wait_file'])
+    while not wait_file.exists():
+        time.sleep(0.05)
+    if 'fail' in pairs:
+        raise ValueError('Something went wrong')
+    return True, {'E/F': PairInfo(-0.02, 0.66, 3.71, 0.50, 1.71, 10, 60)}
+
+
+def test_edge_background_calculation(mocker, edge_conf, caplog, tmpdir):
+    wait_file = Path(tmpdir) / 'finish'
+    edge_conf['edge']['background_calculation'] = True
+    edge_conf['edge']['wait_file'] = str(wait_file)
+    freqtrade = get_patched_freqtradebot(mocker, edge_conf)
+    mocker.patch('freqtrade.edge.edge_positioning._calculate_in_process', _edge_calculation)
+    pair_info = PairInfo(-0.02, 0.66, 3.71, 0.50, 1.71, 10, 60)
+    edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
+    edge.fee = 0.001
+    edge._cached_pairs = {'C/D': pair_info}
+    pairs = edge_conf['exchange']['pair_whitelist']
+
+    assert edge.calculate(pairs) is False
+    assert log_has('Starting Edge calculation in background ...', caplog)
+    process = edge._process
+    assert process.is_alive()
+    # Previous results are used until the calculation finished
+    assert edge.calculate(pairs) is False
+    assert edge._cached_pairs == {'C/D': pair_info}
+    assert edge.stoploss('C/D') == -0.02
+
+    wait_file.touch()
+    process.join(30)
+    assert edge.calculate(pairs) is True
+    assert edge._process is None
+    assert edge._cached_pairs == {'E/F': pair_info}
+    assert edge._last_updated > 0
+    # Heartbeat not reached
+    assert edge.calculate(pairs) is False
+    assert edge._process is None
+
+    # Failing calculation keeps the results
+    edge._last_updated = 0
+    assert edge.calculate(['fail']) is False
+    edge._process.join(30)
+    assert edge.calculate(['fail']) is False
+    assert log_has_re(r'(?s)Edge calculation failed\. .*ValueError: Something went wrong.*', caplog)
+    assert edge._cached_pairs == {'E/F': pair_info}
+    assert edge._process is None
+
+
+def test_edge_background_calculation_cleanup(mocker, edge_conf, tmpdir):
+    edge_conf['edge']['background_calculation'] = True
+    # Never created - the calculation doesn't finish
+    edge_conf['edge']['wait_file'] = str(Path(tmpdir) / 'finish')
+    freqtrade = get_patched_freqtradebot(mocker, edge_conf)
+    mocker.patch('freqtrade.edge.edge_positioning._calculate_in_process', _edge_calculation)
+    edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
+    edge.fee = 0.001
+
+    assert edge.calculate(edge_conf['exchange']['pair_whitelist']) is False
+    process = edge._process
+    assert process.is_alive()
+
+    edge.cleanup()
+    assert not process.is_alive()
+    assert process.exitcode is not None
+    assert edge._process is None
+    assert edge._result_conn is None
+
+
 def mocked_load_data(datadir, pairs=[], timeframe='0m',
                      timerange=None, *args, **kwargs):
     hz = 0.1
@@ -314,6 +388,56 @@ def test_edge_process_downloaded_data(mocker, edge_conf):
     assert edge._last_updated <= arrow.utcnow().int_timestamp + 2
 
 
+def test_edge_process_calculation_workers(mocker, edge_conf, caplog):
+    edge_conf['edge']['calculation_workers'] = 2
+    freqtrade = get_patched_freqtradebot(mocker, edge_conf)
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', MagicMock(return_value=0.001))
+    mocker.patch('freqtrade.edge.edge_positioning.refresh_data', MagicMock())
+    mocker.patch('freqtrade.edge.edge_positioning.load_data', mocked_load_data)
+    pool_mock = mocker.patch('freqtrade.edge.edge_positioning.ProcessPoolExecutor',
+                             side_effect=ThreadPoolExecutor)
+    edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
+
+    assert edge.calculate(edge_conf['exchange']['pair_whitelist'])
+    assert pool_mock.call_args[1] == {'max_workers': 2}
+    assert log_has("Calculating trades using 2 processes.", caplog)
+    cached_pairs = edge._cached_pairs
+
+    edge_conf['edge']['calculation_workers'] = 1
+    edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
+    assert edge.calculate(edge_conf['exchange']['pair_whitelist'])
+    assert edge._cached_pairs == cached_pairs
+    assert pool_mock.call_count == 1
+
+
+def test_find_trades_for_stoploss_range(edge_conf, mocker):
+    freqtrade = get_patched_freqtradebot(mocker, edge_conf)
+    edge = Edge(edge_conf, freqtrade.exchange, freqtrade.strategy)
+    frame = _build_backtest_dataframe([
+        # D  O     H     L     C     V    B  S
+        [0, 5000, 5025, 4975, 4987, 6172, 1, 0],
+        [1, 5000, 5025, 4900, 4987, 6172, 0, 0],  # enter trade, 1% stoploss hit
+        [2, 5000, 5025, 4975, 4987, 6172, 1, 0],  # 1%: next entry signal
+        [3, 5000, 5025, 4840, 4987, 6172, 0, 1],  # 1%, 3% stoploss hit (before sell signal)
+        [4, 5000, 5025, 4975, 4987, 6172, 0, 0],  # 5%: exit at open
+        [5, 5000, 5025, 4975, 4987, 6172, 0, 0],
+    ])
+
+    trades = edge._find_trades_for_stoploss_range(frame, 'TEST/BTC', [-0.01, -0.03, -0.05])
+    assert trades['pair'].unique().tolist() == ['TEST/BTC']
+    assert trades['stoploss'].tolist() == [-0.01, -0.01, -0.03, -0.05]
+    assert trades['exit_type'].tolist() == [SellType.STOP_LOSS, SellType.STOP_LOSS,
+                                            SellType.STOP_LOSS, SellType.SELL_SIGNAL]
+    assert trades['open_rate'].tolist() == [5000, 5000, 5000, 5000]
+    assert trades['close_rate'].tolist() == [4950, 4950, 4850, 5000]
+    assert trades['open_date'].tolist() == [_time_on_candle(1), _time_on_candle(3),
+                                            _time_on_candle(1), _time_on_candle(1)]
+    assert trades['close_date'].tolist() == [_time_on_candle(1), _time_on_candle(3),
+                                             _time_on_candle(3), _time_on_candle(4)]
+
+    assert edge._find_trades_for_stoploss_range(frame.iloc[:1], 'TEST/BTC', [-0.01]).empty
+
+
 def test_edge_process_no_data(mocker, edge_conf, caplog):
     freqtrade = get_patched_freqtradebot(mocker, edge_conf)
     mocker.patch('freqtrade.exchange.Exchange.get_fee', MagicMock(return_value=0.001))
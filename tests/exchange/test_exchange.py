@@ -2176,6 +2176,75 @@ def test_get_sell_rate_orderbook_exception(default_conf, mocker, caplog):
                       caplog)
 
 
+def test_refresh_rates_tickers(default_conf, mocker):
+    default_conf['ask_strategy']['price_side'] = 'bid'
+    ticker_mock = mocker.patch('freqtrade.exchange.Exchange.fetch_ticker',
+                               return_value={'ask': 0.13, 'bid': 0.12, 'last': 0.125})
+    tickers_mock = mocker.patch('freqtrade.exchange.Exchange.get_tickers', return_value={
+        'ETH/BTC': {'ask': 0.23, 'bid': 0.22, 'last': 0.225},
+    })
+    mocker.patch('freqtrade.exchange.Exchange.exchange_has', return_value=True)
+    exchange = get_patched_exchange(mocker, default_conf)
+
+    # Disabled by default
+    exchange.refresh_rates(['ETH/BTC'])
+    assert tickers_mock.call_count == 0
+    assert exchange.get_rate('ETH/BTC', refresh=True, side='sell') == 0.12
+    assert ticker_mock.call_count == 1
+
+    exchange._batch_pricing = True
+    exchange.refresh_rates(['ETH/BTC'])
+    assert tickers_mock.call_count == 1
+    assert exchange.get_rate('ETH/BTC', refresh=True, side='sell') == 0.22
+    # Pair missing from tickers
+    assert exchange.get_rate('XRP/BTC', refresh=True, side='sell') == 0.12
+    assert ticker_mock.call_count == 2
+
+    exchange.clear_rates()
+    assert exchange.get_rate('ETH/BTC', refresh=True, side='sell') == 0.12
+    assert ticker_mock.call_count == 3
+
+    # Failing to fetch tickers falls back to fetching them per pair
+    tickers_mock.side_effect = OperationalException("Not supported")
+    exchange.refresh_rates(['ETH/BTC'])
+    assert exchange.get_rate('ETH/BTC', refresh=True, side='sell') == 0.12
+
+
+def test_refresh_rates_order_books(default_conf, mocker, order_book_l2):
+    default_conf['exchange']['batch_pricing'] = True
+    default_conf['bid_strategy']['price_side'] = 'ask'
+    default_conf['bid_strategy']['use_order_book'] = True
+    default_conf['bid_strategy']['order_book_top'] = 2
+    default_conf['ask_strategy']['price_side'] = 'bid'
+    default_conf['ask_strategy']['use_order_book'] = True
+    default_conf['ask_strategy']['order_book_top'] = 1
+    order_book_mock = mocker.patch('freqtrade.exchange.Exchange.fetch_l2_order_book',
+                                   order_book_l2)
+    tickers_mock = mocker.patch('freqtrade.exchange.Exchange.get_tickers')
+    api_mock = MagicMock()
+    exchange = get_patched_exchange(mocker, default_conf, api_mock)
+    exchange._api_async.fetch_l2_order_book = get_mock_coro(order_book_l2.return_value)
+
+    exchange.refresh_rates(['ETH/BTC', 'XRP/BTC'])
+    # Tickers are not used for pricing
+    assert tickers_mock.call_count == 0
+    assert exchange._api_async.fetch_l2_order_book.call_count == 2
+    assert exchange._api_async.fetch_l2_order_book.call_args_list[0][0][1] == 5
+
+    assert exchange.get_rate('ETH/BTC', refresh=True, side='sell') == 0.043936
+    assert exchange.get_rate('XRP/BTC', refresh=True, side='buy') == 0.04395
+    assert order_book_mock.call_count == 0
+    # Pair without prefetched order book
+    exchange.get_rate('LTC/BTC', refresh=True, side='sell')
+    assert order_book_mock.call_count == 1
+
+    # Failed order books are fetched per pair
+    exchange._api_async.fetch_l2_order_book = MagicMock(
+        side_effect=ccxt.BadSymbol("Bad symbol"))
+    exchange.refresh_rates(['ETH/BTC'])
+    assert exchange._rate_order_books == {}
+
+
 def test_get_sell_rate_exception(default_conf, mocker, caplog):
     # Ticker on one side can be empty in certain circumstances.
     default_conf['ask_strategy']['price_side'] = 'ask'
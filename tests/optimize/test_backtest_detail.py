@@ -3,6 +3,7 @@ import logging
 
 import pytest
 
+from freqtrade.constants import BACKTEST_ENGINES
 from freqtrade.data.history import get_timerange
 from freqtrade.enums import SellType
 from freqtrade.optimize.backtesting import Backtesting
@@ -591,11 +592,13 @@ TESTS = [
 ]
 
 
+@pytest.mark.parametrize("engine", BACKTEST_ENGINES)
 @pytest.mark.parametrize("data", TESTS)
-def test_backtest_results(default_conf, fee, mocker, caplog, data) -> None:
+def test_backtest_results(default_conf, fee, mocker, caplog, data, engine) -> None:
     """
     run functional tests
     """
+    default_conf["backtest_engine"] = engine
     default_conf["stoploss"] = data.stop_loss
     default_conf["minimal_roi"] = data.roi
     default_conf["timeframe"] = tests_timeframe
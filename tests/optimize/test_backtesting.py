@@ -22,8 +22,8 @@ from freqtrade.data.history import get_timerange
 from freqtrade.enums import RunMode, SellType
 from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.misc import get_strategy_run_id
-from freqtrade.optimize.backtesting import Backtesting
-from freqtrade.persistence import LocalTrade
+from freqtrade.optimize.backtesting import EXIT_CANDIDATE_WINDOW, Backtesting
+from freqtrade.persistence import LocalTrade, PairLocks, Trade
 from freqtrade.resolvers import StrategyResolver
 from tests.conftest import (CURRENT_TEST_STRATEGY, get_args, log_has, log_has_re, patch_exchange,
                             patched_configuration_load_config_file)
@@ -655,6 +655,42 @@ def test_backtest__get_sell_trade_entry(default_conf, fee, mocker) -> None:
     assert round(res.close_rate, 3) == round(209.0225, 3)
 
 
+def test_backtest__get_detail_rows(default_conf, mocker) -> None:
+    patch_exchange(mocker)
+    default_conf['timeframe_detail'] = '1m'
+    backtesting = Backtesting(default_conf)
+    pair = 'UNITTEST/BTC'
+    dates = pd.date_range('2020-01-01 04:55', periods=15, freq='1min', tz='UTC')
+    backtesting.detail_data[pair] = pd.DataFrame({
+        'date': dates, 'open': range(15), 'high': range(15), 'low': range(15),
+        'close': range(15), 'volume': range(15)})
+
+    rows = backtesting._get_detail_rows(pair, datetime(2020, 1, 1, 5, 0, tzinfo=timezone.utc))
+    assert len(rows) == 5
+    assert rows[0] == [dates[5], 5, 5, 5, 5]
+    assert rows[-1][0] == dates[9]
+    cached = backtesting._detail_index[pair]
+    # Detail data is kept as numpy arrays - not as python objects per row
+    _, dates_ns, ohlc = cached
+    assert isinstance(dates_ns, np.ndarray) and dates_ns.dtype == np.int64
+    assert isinstance(ohlc, np.ndarray) and ohlc.dtype == np.float64
+    assert ohlc.shape == (15, 4)
+
+    # Partial candle at the end of the data
+    rows = backtesting._get_detail_rows(pair, datetime(2020, 1, 1, 5, 5, tzinfo=timezone.utc))
+    assert [r[0] for r in rows] == list(dates[10:])
+    assert backtesting._detail_index[pair] is cached
+    # No detail data for this candle
+    assert backtesting._get_detail_rows(
+        pair, datetime(2020, 1, 1, 5, 10, tzinfo=timezone.utc)) == []
+
+    # Replacing the dataframe rebuilds the index
+    backtesting.detail_data[pair] = backtesting.detail_data[pair].iloc[:7]
+    rows = backtesting._get_detail_rows(pair, datetime(2020, 1, 1, 5, 0, tzinfo=timezone.utc))
+    assert len(rows) == 2
+    assert backtesting._detail_index[pair] is not cached
+
+
 def test_backtest_one(default_conf, fee, mocker, testdatadir) -> None:
     default_conf['use_sell_signal'] = False
     mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
@@ -946,6 +982,193 @@ def test_backtest_multi_pair(default_conf, fee, mocker, tres, pair, testdatadir)
     assert len(evaluate_result_multi(results['results'], '5m', 1)) == 0
 
 
+@pytest.mark.parametrize('use_sell_signal', [True, False])
+def test_backtest_vectorized_engine(default_conf, fee, mocker, testdatadir, use_sell_signal):
+    mocker.patch("freqtrade.exchange.Exchange.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    patch_exchange(mocker)
+
+    pairs = ['ADA/BTC', 'DASH/BTC', 'ETH/BTC', 'LTC/BTC', 'NXT/BTC']
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=pairs)
+    data = trim_dictlist(data, -500)
+    default_conf['timeframe'] = '5m'
+    default_conf['use_sell_signal'] = use_sell_signal
+    default_conf['minimal_roi'] = {"0": 0.03, "60": 0.01, "120": 0.0}
+    default_conf['stoploss'] = -0.02
+
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+    exit_check = mocker.spy(backtesting, '_get_sell_trade_entry')
+
+    results = {}
+    for engine in constants.BACKTEST_ENGINES:
+        backtesting.backtest_engine = engine
+        exit_check.reset_mock()
+        results[engine] = backtesting.backtest(
+            processed=deepcopy(processed),
+            start_date=min_date,
+            end_date=max_date,
+            max_open_trades=3,
+        )['results']
+        results[engine + '_calls'] = exit_check.call_count
+        assert backtesting._use_exit_candidates() == (engine == 'vectorized')
+
+    assert len(results['loop']) > 0
+    pd.testing.assert_frame_equal(results['loop'], results['vectorized'])
+    assert results['vectorized_calls'] < results['loop_calls']
+
+
+def test_backtest_vectorized_engine_exit_signals(default_conf, fee, mocker, testdatadir):
+    # Exit signals on every other candle which never trigger (sell_profit_only) must not
+    # re-scan the remaining candles on every check.
+    def _frequent_exit(dataframe=None, metadata=None):
+        dataframe['exit_long'] = np.where(dataframe.index % 2 == 1, 1, 0)
+        dataframe['exit_short'] = 0
+        return dataframe
+
+    mocker.patch("freqtrade.exchange.Exchange.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    patch_exchange(mocker)
+
+    pairs = ['ADA/BTC', 'DASH/BTC', 'ETH/BTC', 'LTC/BTC', 'NXT/BTC']
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=pairs)
+    data = trim_dictlist(data, -2000)
+    default_conf['timeframe'] = '5m'
+    default_conf['use_sell_signal'] = True
+    default_conf['sell_profit_only'] = True
+    default_conf['sell_profit_offset'] = 0.5
+    default_conf['minimal_roi'] = {"0": 10}
+    default_conf['stoploss'] = -0.5
+
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    backtesting.strategy.advise_exit = _frequent_exit
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+    scanned = mocker.spy(backtesting, '_exit_candidates')
+
+    results = {}
+    for engine in constants.BACKTEST_ENGINES:
+        backtesting.backtest_engine = engine
+        scanned.reset_mock()
+        results[engine] = backtesting.backtest(
+            processed=deepcopy(processed),
+            start_date=min_date,
+            end_date=max_date,
+            max_open_trades=3,
+        )['results']
+        results[engine + '_windows'] = [call.args[2] - call.args[1]
+                                        for call in scanned.call_args_list]
+
+    assert len(results['vectorized']) > 0
+    pd.testing.assert_frame_equal(results['loop'], results['vectorized'])
+    assert results['loop_windows'] == []
+    assert len(results['vectorized_windows']) > 1000
+    assert max(results['vectorized_windows']) <= EXIT_CANDIDATE_WINDOW
+    backtesting.cleanup()
+
+
+def test_backtest_vectorized_engine_fallback(default_conf, mocker) -> None:
+    patch_exchange(mocker)
+    default_conf['backtest_engine'] = 'vectorized'
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    assert backtesting._use_exit_candidates()
+
+    backtesting.strategy.trailing_stop = True
+    assert not backtesting._use_exit_candidates()
+    backtesting.strategy.trailing_stop = False
+
+    backtesting.strategy.use_custom_stoploss = True
+    assert not backtesting._use_exit_candidates()
+    backtesting.strategy.use_custom_stoploss = False
+
+    backtesting.strategy.position_adjustment_enable = True
+    assert not backtesting._use_exit_candidates()
+    backtesting.strategy.position_adjustment_enable = False
+
+    # Instance-level overrides don't disable candidates - class-level overrides do.
+    backtesting.strategy.use_sell_signal = True
+    mocker.patch.object(type(backtesting.strategy), 'custom_sell', MagicMock(return_value=None))
+    assert not backtesting._use_exit_candidates()
+    backtesting.strategy.use_sell_signal = False
+    assert backtesting._use_exit_candidates()
+
+
+@pytest.mark.parametrize('protections', [False, True])
+def test_backtest_skip_idle_candles(default_conf, fee, mocker, testdatadir, protections):
+
+    def _sparse_signals(dataframe=None, metadata=None):
+        dataframe['enter_long'] = np.where(dataframe.index % 97 == 0, 1, 0)
+        dataframe['exit_long'] = np.where(dataframe.index % 97 == 5, 1, 0)
+        dataframe['enter_short'] = 0
+        dataframe['exit_short'] = 0
+        return dataframe
+
+    mocker.patch("freqtrade.exchange.Exchange.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    patch_exchange(mocker)
+
+    pairs = ['ADA/BTC', 'DASH/BTC', 'ETH/BTC', 'LTC/BTC', 'NXT/BTC']
+    data = history.load_data(datadir=testdatadir, timeframe='5m', pairs=pairs)
+    data = trim_dictlist(data, -500)
+    data['ETH/BTC'] = data['ETH/BTC'][40:].reset_index()
+    default_conf['timeframe'] = '5m'
+    default_conf['use_sell_signal'] = True
+    default_conf['enable_protections'] = protections
+    default_conf['protections'] = [{"method": "CooldownPeriod", "stop_duration_candles": 30}]
+
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    backtesting.strategy.advise_entry = _sparse_signals
+    backtesting.strategy.advise_exit = _sparse_signals
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+    backtest_conf = {
+        'start_date': min_date,
+        'end_date': max_date,
+        'max_open_trades': 2,
+        'enable_protections': protections,
+    }
+    abort_check = mocker.spy(backtesting, 'check_abort')
+    results = backtesting.backtest(processed=deepcopy(processed), **backtest_conf)
+    assert backtesting._idle_skip_enabled
+    assert backtesting.progress.progress == 1
+    steps_skipped = abort_check.call_count
+
+    abort_check.reset_mock()
+    mocker.patch('freqtrade.optimize.backtesting.Backtesting._prepare_idle_skip')
+    results_all = backtesting.backtest(processed=deepcopy(processed), **backtest_conf)
+    assert not backtesting._idle_skip_enabled
+
+    assert len(results['results']) > 0
+    pd.testing.assert_frame_equal(results['results'], results_all['results'])
+    assert results['rejected_signals'] == results_all['rejected_signals']
+    assert steps_skipped < abort_check.call_count / 2
+    backtesting.cleanup()
+
+
+def test_backtest_stale_instance_keeps_db_disabled(default_conf, mocker) -> None:
+    patch_exchange(mocker)
+    stale = Backtesting(default_conf)
+    backtesting = Backtesting(default_conf)
+    backtesting.prepare_backtest(False)
+    assert not PairLocks.use_db
+    assert not Trade.use_db
+
+    # Garbage-collecting an older instance must not re-enable the database.
+    stale.__del__()
+    del stale
+    assert not PairLocks.use_db
+    assert not Trade.use_db
+
+    backtesting.__del__()
+    assert PairLocks.use_db
+    assert Trade.use_db
+
+
 def test_backtest_start_timerange(default_conf, mocker, caplog, testdatadir):
 
     patch_exchange(mocker)
@@ -1,4 +1,5 @@
 # pragma pylint: disable=missing-docstring,W0212,C0103
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import ANY, MagicMock
@@ -12,6 +13,7 @@ from freqtrade.commands.optimize_commands import setup_optimize_configuration, s
 from freqtrade.data.history import load_data
 from freqtrade.enums import RunMode, SellType
 from freqtrade.exceptions import OperationalException
+from freqtrade.optimize import hyperopt as hyperopt_module
 from freqtrade.optimize.hyperopt import Hyperopt
 from freqtrade.optimize.hyperopt_auto import HyperOptAuto
 from freqtrade.optimize.hyperopt_tools import HyperoptTools
@@ -442,7 +444,7 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     patch_exchange(mocker)
     mocker.patch.object(Path, 'open')
     mocker.patch('freqtrade.configuration.config_validation.validate_config_schema')
-    mocker.patch('freqtrade.optimize.hyperopt.load', return_value={'XRP/BTC': None})
+    load_mock = mocker.patch('freqtrade.optimize.hyperopt.load', return_value={'XRP/BTC': None})
 
     optimizer_param = {
         'buy_plusdi': 0.02,
@@ -501,6 +503,7 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     hyperopt.dimensions = hyperopt.dimensions
     generate_optimizer_value = hyperopt.generate_optimizer(list(optimizer_param.values()))
     assert generate_optimizer_value == response_expected
+    load_mock.assert_called_once_with(hyperopt.data_pickle_file, mmap_mode='c')
 
 
 def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
@@ -512,7 +515,8 @@ def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
     unlinkmock = mocker.patch("freqtrade.optimize.hyperopt.Path.unlink", MagicMock())
     h = Hyperopt(hyperopt_conf)
 
-    assert unlinkmock.call_count == 2
+    # Data pickle, results file and results index
+    assert unlinkmock.call_count == 3
     assert log_has(f"Removing `{h.data_pickle_file}`.", caplog)
 
 
@@ -871,6 +875,84 @@ def test_in_strategy_auto_hyperopt(mocker, hyperopt_conf, tmpdir, fee) -> None:
         hyperopt.get_optimizer([], 2)
 
 
+def test_hyperopt_warm_workers(mocker, hyperopt_conf, tmpdir, fee) -> None:
+    patch_exchange(mocker)
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    # Use a thread instead of processes - mocks don't survive pickling to other processes.
+    # A single thread, as all "workers" share the same hyperopt object.
+    executor_mock = mocker.patch(
+        'freqtrade.optimize.hyperopt.get_reusable_executor',
+        side_effect=lambda **kwargs: ThreadPoolExecutor(**{**kwargs, 'max_workers': 1}))
+    generate_optimizer_mock = mocker.spy(Hyperopt, 'generate_optimizer')
+    batches_mock = mocker.spy(Hyperopt, 'run_optimizer_batches')
+    save_mock = mocker.spy(Hyperopt, '_save_result')
+    (Path(tmpdir) / 'hyperopt_results').mkdir(parents=True)
+    hyperopt_conf.update({
+        'strategy': 'HyperoptableStrategy',
+        'user_data_dir': Path(tmpdir),
+        'hyperopt_random_state': 42,
+        'spaces': ['all'],
+        'hyperopt_jobs': 2,
+        'epochs': 4,
+        'hyperopt_warm_workers': True,
+    })
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.start()
+
+    # Workers are started once, receiving the optimizer function on startup
+    assert executor_mock.call_count == 1
+    assert executor_mock.call_args[1]['max_workers'] == 2
+    assert executor_mock.call_args[1]['initializer'] == hyperopt_module._init_worker
+    assert generate_optimizer_mock.call_count == 4
+    assert batches_mock.call_count == 0
+    assert hyperopt.num_epochs_saved == 4
+    # Epochs are numbered in order of completion
+    assert [c[0][1]['current_epoch'] for c in save_mock.call_args_list] == [1, 2, 3, 4]
+    assert len(hyperopt.opt.yi) == 4
+    assert hyperopt.current_best_epoch is not None
+
+    # Warm workers are not used when running without parallelism
+    executor_mock.reset_mock()
+    assert not isinstance(hyperopt.get_parallel(1), ThreadPoolExecutor)
+    assert executor_mock.call_count == 0
+
+
+def test_hyperopt_lean_metrics(mocker, hyperopt_conf, tmpdir, fee) -> None:
+    patch_exchange(mocker)
+    mocker.patch('freqtrade.exchange.Exchange.get_fee', fee)
+    show_mock = mocker.patch('freqtrade.optimize.hyperopt.show_backtest_result')
+    save_mock = mocker.spy(Hyperopt, '_save_result')
+    (Path(tmpdir) / 'hyperopt_results').mkdir(parents=True)
+    hyperopt_conf.update({
+        'strategy': 'HyperoptableStrategy',
+        'user_data_dir': Path(tmpdir),
+        'hyperopt_random_state': 42,
+        'spaces': ['all'],
+        'hyperopt_jobs': 1,
+        'epochs': 3,
+        'hyperopt_lean_metrics': True,
+    })
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.start()
+
+    assert save_mock.call_count == 3
+    for call in save_mock.call_args_list:
+        metrics = call[0][1]['results_metrics']
+        assert 'trades' not in metrics
+        assert 'total_trades' in metrics
+
+    # The best epoch is regenerated with the full report
+    assert 'trades' in hyperopt.current_best_epoch['results_metrics']
+    assert 'results_per_pair' in hyperopt.current_best_epoch['results_metrics']
+    assert show_mock.call_count == 1
+
+
+def test_run_worker_epoch_not_initialized(mocker) -> None:
+    mocker.patch('freqtrade.optimize.hyperopt._worker_optimizer', None)
+    with pytest.raises(OperationalException, match=r"Hyperopt worker has not been initialized."):
+        hyperopt_module._run_worker_epoch([1, 2], 0)
+
+
 def test_SKDecimal():
     space = SKDecimal(1, 2, decimals=2)
     assert 1.5 in space
@@ -1,6 +1,8 @@
 import logging
 import re
+import time
 from pathlib import Path
+from threading import Event, Thread
 from typing import Dict, List
 
 import numpy as np
@@ -9,6 +11,9 @@ import rapidjson
 
 from freqtrade.constants import FTHYPT_FILEVERSION
 from freqtrade.exceptions import OperationalException
+from freqtrade.optimize import hyperopt as hyperopt_module
+from freqtrade.optimize import hyperopt_results_store
+from freqtrade.optimize.hyperopt_results_store import HyperoptResultsStore, HyperoptResultsWriter
 from freqtrade.optimize.hyperopt_tools import HyperoptTools, hyperopt_serializer
 from tests.conftest import CURRENT_TEST_STRATEGY, log_has, log_has_re
 
@@ -19,7 +24,8 @@ def create_results() -> List[Dict]:
     return [{'loss': 1, 'result': 'foo', 'params': {}, 'is_best': True}]
 
 
-def test_save_results_saves_epochs(hyperopt, tmpdir, caplog) -> None:
+def test_save_results_saves_epochs(mocker, hyperopt, tmpdir, caplog) -> None:
+    dump_mock = mocker.spy(hyperopt_module, 'file_dump_json')
 
     hyperopt.results_file = Path(tmpdir / 'ut_results.fthypt')
 
@@ -38,22 +44,139 @@ def test_save_results_saves_epochs(hyperopt, tmpdir, caplog) -> None:
 
     hyperopt._save_result(epochs[0])
     assert log_has(f"2 epochs saved to '{hyperopt.results_file}'.", caplog)
+    # Latest result pointer is only written once
+    assert dump_mock.call_count == 1
 
     hyperopt_epochs = HyperoptTools.load_filtered_results(hyperopt.results_file, {})
     assert len(hyperopt_epochs) == 2
     assert hyperopt_epochs[1] == 2
     assert len(hyperopt_epochs[0]) == 2
 
-    result_gen = HyperoptTools._read_results(hyperopt.results_file, 1)
-    epoch = next(result_gen)
-    assert len(epoch) == 1
-    assert epoch[0] == epochs[0]
-    epoch = next(result_gen)
-    assert len(epoch) == 1
-    epoch = next(result_gen)
-    assert len(epoch) == 0
-    with pytest.raises(StopIteration):
-        next(result_gen)
+    store = HyperoptResultsStore(hyperopt.results_file)
+    assert store.index_file.is_file()
+    index = store.load_index()
+    assert len(index) == 2
+    assert store.load_epochs(index[[1]]) == [epochs[0]]
+
+
+def test_hyperopt_results_store(tmpdir, caplog) -> None:
+    results_file = Path(tmpdir / 'ut_results.fthypt')
+    store = HyperoptResultsStore(results_file)
+    epochs = [{'loss': 10 - i, 'current_epoch': i, 'is_best': i % 2 == 0,
+               'is_initial_point': i < 3, 'params_dict': {'buy_rsi': i},
+               'results_metrics': {'total_trades': i * 10, 'profit_total': i - 5,
+                                   'holding_avg_s': 3600 + i}}
+              for i in range(1, 11)]
+    store.append(epochs[:5])
+    store.append(epochs[5:])
+
+    index = store.load_index()
+    assert len(index) == 10
+    assert index['current_epoch'].tolist() == list(range(1, 11))
+    assert index['total_trades'].tolist() == [i * 10 for i in range(1, 11)]
+    assert np.isnan(index['max_drawdown']).all()
+    # Single epochs are loaded from their position
+    assert store.load_epochs(index[[6, 2]]) == [epochs[6], epochs[2]]
+
+    summary = HyperoptResultsStore.summary_epochs(index[[0]])[0]
+    assert summary['loss'] == 9
+    assert summary['is_best'] is False
+    assert summary['results_metrics'] == {'total_trades': 10, 'profit_total': -4,
+                                          'holding_avg_s': 3601, 'holding_avg': '1:00:01'}
+
+    filtered, total = HyperoptTools.load_filtered_results(results_file, {
+        'hyperopt_list_best': True,
+        'hyperopt_list_profitable': True,
+        'hyperopt_list_min_trades': 60,
+    })
+    assert total == 10
+    assert [e['current_epoch'] for e in filtered] == [8, 10]
+
+    # Interrupted writes: partial index record and epoch without index record
+    with store.index_file.open('ab') as f:
+        f.write(b'\x01\x02')
+    with results_file.open('ab') as f:
+        f.write(b'{"loss": 1, "is_best": false, "current_epoch": 11}\n{"loss"')
+    index = HyperoptResultsStore(results_file).load_index()
+    assert len(index) == 11
+    assert index['current_epoch'][-1] == 11
+
+    # Results written by older versions (no index file)
+    store.index_file.unlink()
+    store = HyperoptResultsStore(results_file)
+    index = store.load_index()
+    assert len(index) == 11
+    assert store.load_epochs(index[[3]]) == [epochs[3]]
+
+
+def test_hyperopt_results_writer(mocker, tmpdir) -> None:
+    results_file = Path(tmpdir / 'ut_results.fthypt')
+    store = HyperoptResultsStore(results_file)
+    append_mock = mocker.spy(store, 'append')
+    writer = HyperoptResultsWriter(store, batch_size=3, flush_interval=60)
+    writer.start()
+    for i in range(4):
+        writer.put({'loss': i, 'is_best': False, 'current_epoch': i + 1})
+    writer.close()
+
+    assert writer.num_saved == 4
+    assert append_mock.call_count == 2
+    assert [len(c[0][0]) for c in append_mock.call_args_list] == [3, 1]
+    assert len(store.load_index()) == 4
+
+    # Queued epochs are written after flush_interval
+    writer = HyperoptResultsWriter(store, crash_safe=True, flush_interval=0.01)
+    fsync_mock = mocker.spy(hyperopt_results_store.os, 'fsync')
+    writer.start()
+    writer.put({'loss': 5, 'is_best': False, 'current_epoch': 5})
+    for _ in range(100):
+        if writer.num_saved:
+            break
+        time.sleep(0.01)
+    assert writer.num_saved == 1
+    # Results file and index
+    assert fsync_mock.call_count == 2
+    writer.close()
+
+    # Write errors are raised to the caller
+    writer = HyperoptResultsWriter(store, batch_size=1)
+    mocker.patch.object(store, 'append', side_effect=OSError("Disk full"))
+    writer.start()
+    writer.put({'loss': 6})
+    with pytest.raises(OperationalException, match=r"Writing hyperopt results failed: Disk full"):
+        writer.close()
+    with pytest.raises(OperationalException, match=r"Writing hyperopt results failed: Disk full"):
+        writer.put({'loss': 7})
+
+
+def test_hyperopt_results_writer_crash_safe_bound(mocker, tmpdir) -> None:
+    store = HyperoptResultsStore(Path(tmpdir / 'ut_results.fthypt'))
+    writing = Event()
+    finish_write = Event()
+
+    def slow_append(epochs, fsync=False):
+        writing.set()
+        finish_write.wait(10)
+
+    append_mock = mocker.patch.object(store, 'append', side_effect=slow_append)
+    writer = HyperoptResultsWriter(store, crash_safe=True, batch_size=2, flush_interval=60)
+    writer.start()
+    writer.put({'loss': 1})
+    writer.put({'loss': 2})
+    assert writing.wait(10)
+
+    # The batch being written counts against the limit - so the next epoch has to wait.
+    put_thread = Thread(target=writer.put, args=({'loss': 3}, ))
+    put_thread.start()
+    put_thread.join(0.2)
+    assert put_thread.is_alive()
+
+    finish_write.set()
+    put_thread.join(10)
+    assert not put_thread.is_alive()
+    writer.close()
+    assert writer.num_saved == 3
+    assert [len(c[0][0]) for c in append_mock.call_args_list] == [2, 1]
 
 
 def test_load_previous_results2(mocker, testdatadir, caplog) -> None:
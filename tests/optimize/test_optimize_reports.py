@@ -15,13 +15,15 @@ from freqtrade.edge import PairInfo
 from freqtrade.enums import SellType
 from freqtrade.optimize.optimize_reports import (_get_resample_from_period, generate_backtest_stats,
                                                  generate_daily_stats, generate_edge_table,
+                                                 generate_lean_strategy_stats,
                                                  generate_pair_metrics,
                                                  generate_periodic_breakdown_stats,
                                                  generate_sell_reason_stats,
                                                  generate_strategy_comparison,
-                                                 generate_trading_stats, show_sorted_pairlist,
-                                                 store_backtest_stats, text_table_bt_results,
-                                                 text_table_sell_reason, text_table_strategy)
+                                                 generate_strategy_stats, generate_trading_stats,
+                                                 show_sorted_pairlist, store_backtest_stats,
+                                                 text_table_bt_results, text_table_sell_reason,
+                                                 text_table_strategy)
 from freqtrade.resolvers.strategy_resolver import StrategyResolver
 from tests.conftest import CURRENT_TEST_STRATEGY
 from tests.data.test_history import _backup_file, _clean_test_file
@@ -198,6 +200,54 @@ def test_store_backtest_stats(testdatadir, mocker):
     assert str(dump_mock.call_args_list[0][0][0]).startswith(str(testdatadir / 'testresult'))
 
 
+def test_generate_lean_strategy_stats(default_conf):
+    default_conf.update({'strategy': CURRENT_TEST_STRATEGY})
+    StrategyResolver.load_strategy(default_conf)
+    results = pd.DataFrame(
+        {"pair": ["UNITTEST/BTC", "UNITTEST/BTC", "UNITTEST/BTC", "UNITTEST/BTC"],
+         "profit_ratio": [0.003312, 0.010801, -0.013803, 0.002780],
+         "profit_abs": [0.000003, 0.000011, -0.000014, 0.000003],
+         "open_date": [Arrow(2017, 11, 14, 19, 32, 00).datetime,
+                       Arrow(2017, 11, 14, 21, 36, 00).datetime,
+                       Arrow(2017, 11, 14, 22, 12, 00).datetime,
+                       Arrow(2017, 11, 14, 22, 44, 00).datetime],
+         "close_date": [Arrow(2017, 11, 14, 21, 35, 00).datetime,
+                        Arrow(2017, 11, 14, 22, 10, 00).datetime,
+                        Arrow(2017, 11, 14, 22, 43, 00).datetime,
+                        Arrow(2017, 11, 14, 22, 58, 00).datetime],
+         "trade_duration": [123, 34, 31, 14],
+         "is_open": [False, False, False, True],
+         "is_short": [False, False, True, False],
+         "stake_amount": [0.01, 0.01, 0.01, 0.01],
+         "sell_reason": [SellType.ROI, SellType.STOP_LOSS, SellType.ROI, SellType.FORCE_SELL]
+         })
+    content = {
+        'results': results,
+        'config': default_conf,
+        'locks': [],
+        'final_balance': 1000.02,
+        'rejected_signals': 20,
+        'backtest_start_time': Arrow.utcnow().int_timestamp,
+        'backtest_end_time': Arrow.utcnow().int_timestamp,
+    }
+    min_date = Arrow(2017, 11, 14).datetime
+    max_date = Arrow(2017, 11, 15).datetime
+    pairlist = ['UNITTEST/BTC']
+
+    lean_stats = generate_lean_strategy_stats(pairlist, content, min_date, max_date)
+    full_stats = generate_strategy_stats(pairlist, 'DefStrat', content, min_date, max_date,
+                                         market_change=0)
+    assert 'trades' not in lean_stats
+    assert 'results_per_pair' not in lean_stats
+    assert 'strategy_name' not in lean_stats
+    assert lean_stats['total_trades'] == len(results)
+    # All lean metrics match the full report
+    for key, value in lean_stats.items():
+        assert full_stats[key] == value, key
+
+    assert generate_lean_strategy_stats(pairlist, {'results': {}}, min_date, max_date) == {}
+
+
 def test_generate_pair_metrics():
 
     results = pd.DataFrame(
@@ -4,10 +4,13 @@ import logging
 import time
 from unittest.mock import MagicMock, PropertyMock
 
+import arrow
+import numpy as np
 import pytest
 import time_machine
 
 from freqtrade.constants import AVAILABLE_PAIRLISTS
+from freqtrade.data.converter import ohlcv_to_dataframe
 from freqtrade.enums import CandleType, RunMode
 from freqtrade.exceptions import OperationalException
 from freqtrade.persistence import Trade
@@ -1028,6 +1031,100 @@ def test_rangestabilityfilter_caching(mocker, markets, default_conf, tickers, oh
     assert freqtrade.exchange.refresh_latest_ohlcv.call_count == previous_call_count
 
 
+def test_pairlistmanager_shared_candles(mocker, markets, default_conf, tickers):
+    default_conf['pairlists'] = [{'method': 'VolumePairList', 'number_assets': 10},
+                                 {'method': 'AgeFilter', 'min_days_listed': 2,
+                                  'max_days_listed': 5},
+                                 {'method': 'VolatilityFilter', 'lookback_days': 3,
+                                  'min_volatility': 0, 'max_volatility': 100},
+                                 {'method': 'RangeStabilityFilter', 'lookback_days': 10,
+                                  'min_rate_of_change': 0.01}]
+
+    mocker.patch.multiple('freqtrade.exchange.Exchange',
+                          markets=PropertyMock(return_value=markets),
+                          exchange_has=MagicMock(return_value=True),
+                          get_tickers=tickers
+                          )
+    # Daily candles of the last 11 days
+    start = arrow.utcnow().floor('day').shift(days=-11)
+    candles = [[start.shift(days=i).int_timestamp * 1000, 1, 1.1 + i / 100, 0.9, 1, 10]
+               for i in range(11)]
+    # Listed 4 days ago
+    young = candles[-4:]
+    pairs = ['ETH/BTC', 'TKN/BTC', 'LTC/BTC', 'XRP/BTC', 'BLK/BTC']
+    ohlcv_data = {
+        (pair, '1d', CandleType.SPOT): ohlcv_to_dataframe(
+            young if pair == 'XRP/BTC' else candles, '1d', pair=pair, fill_missing=True,
+            drop_incomplete=False)
+        for pair in pairs
+    }
+    refresh_mock = MagicMock(return_value=ohlcv_data)
+    mocker.patch('freqtrade.exchange.Exchange.refresh_latest_ohlcv', refresh_mock)
+
+    freqtrade = get_patched_freqtradebot(mocker, default_conf)
+    freqtrade.pairlists.refresh_pairlist()
+
+    # All Pairlist Filters use the same candles - fetched once, as far back as needed.
+    assert refresh_mock.call_count == 1
+    assert set(refresh_mock.call_args[0][0]) == {(p, '1d', CandleType.SPOT) for p in pairs}
+    assert refresh_mock.call_args[1]['since_ms'] == start.int_timestamp * 1000
+    # AgeFilter only sees the candles of the last 6 days - so only XRP/BTC is young enough.
+    assert freqtrade.pairlists.whitelist == ['XRP/BTC']
+    # Candles are not kept once the pairlist is refreshed.
+    assert freqtrade.pairlists._candles == {}
+
+    # Candles fetched further back are trimmed to the requested start
+    eth = ('ETH/BTC', '1d', CandleType.SPOT)
+    freqtrade.pairlists.get_candles([eth], start.int_timestamp * 1000)
+    assert refresh_mock.call_count == 2
+    res = freqtrade.pairlists.get_candles([eth], start.shift(days=5).int_timestamp * 1000)
+    assert refresh_mock.call_count == 2
+    assert len(res[eth]) == 6
+    assert res[eth].iloc[0]['date'] == start.shift(days=5).datetime
+
+
+def test_pairlistmanager_ticker_table(mocker, markets, default_conf, tickers):
+    default_conf['pairlists'] = [{'method': 'VolumePairList', 'number_assets': 10},
+                                 {'method': 'SpreadFilter', 'max_spread_ratio': 0.1}]
+    mocker.patch.multiple('freqtrade.exchange.Exchange',
+                          markets=PropertyMock(return_value=markets),
+                          exchange_has=MagicMock(return_value=True),
+                          get_tickers=tickers
+                          )
+    freqtrade = get_patched_freqtradebot(mocker, default_conf)
+    pm = freqtrade.pairlists
+    tickers_dict = tickers()
+    tickers_dict['ETH/BTC']['bid'] = None
+    tickers_dict['NOMARKET/BTC'] = {'symbol': 'NOMARKET/BTC', 'last': 1.0}
+
+    table = pm.ticker_table(tickers_dict)
+    assert list(table.index) == list(tickers_dict.keys())
+    assert table.loc['ETH/BTC', 'last'] == tickers_dict['ETH/BTC']['last']
+    assert np.isnan(table.loc['ETH/BTC', 'bid'])
+    assert table.loc['ETH/BTC', 'quote'] == 'BTC'
+    assert table.loc['ETH/BTC', 'tradable']
+    assert table.loc['ETH/BTC', 'active']
+    assert table.loc['ETH/BTC', 'price_precision'] == 8
+    assert table.loc['ETH/BTC', 'amount_min'] == 0.01
+    # Pair without market
+    assert table.loc['NOMARKET/BTC', 'quote'] == ''
+    assert not table.loc['NOMARKET/BTC', 'tradable']
+    assert np.isnan(table.loc['NOMARKET/BTC', 'amount_min'])
+    assert np.isnan(table.loc['NOMARKET/BTC', 'quoteVolume'])
+
+    # Built once per refresh, and shared by all Pairlist Handlers
+    tables = []
+    ticker_table = pm.ticker_table
+    mocker.patch.object(pm, 'ticker_table',
+                        side_effect=lambda t: tables.append(ticker_table(t)) or tables[-1])
+    pm.refresh_pairlist()
+    assert len(tables) > 1
+    assert all(t is tables[0] for t in tables)
+    assert pm._ticker_table is None
+    # ETH/BTC has no bid
+    assert pm.whitelist == ['TKN/BTC', 'BLK/BTC', 'LTC/BTC', 'XRP/BTC']
+
+
 def test_spreadfilter_invalid_data(mocker, default_conf, markets, tickers, caplog):
     default_conf['pairlists'] = [{'method': 'VolumePairList', 'number_assets': 10},
                                  {'method': 'SpreadFilter', 'max_spread_ratio': 0.1}]
@@ -141,3 +141,40 @@ def test_PairLocks_reason(use_db):
 
     PairLocks.reset_locks()
     PairLocks.use_db = True
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_PairLocks_backtest_index():
+    PairLocks.timeframe = '5m'
+    PairLocks.use_db = False
+    start = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    # Locks are not necessarily created in order of their end time
+    for minutes in [60, 10, 30, 20, 50, 40]:
+        PairLocks.lock_pair('ETH/BTC', start + timedelta(minutes=minutes), now=start)
+    PairLocks.lock_pair('*', start + timedelta(minutes=15), 'global', now=start)
+    assert len(PairLocks.get_all_locks()) == 7
+    # Lock end is rounded up to the next candle
+    assert [lock.lock_end_time for lock in PairLocks._pair_locks['ETH/BTC']] == [
+        start + timedelta(minutes=m) for m in [15, 25, 35, 45, 55, 65]]
+
+    assert len(PairLocks.get_pair_locks('ETH/BTC', start + timedelta(minutes=36))) == 3
+    # Lock end time is inclusive
+    assert len(PairLocks.get_pair_locks('ETH/BTC', start + timedelta(minutes=45))) == 3
+    assert len(PairLocks.get_pair_locks('ETH/BTC', start + timedelta(minutes=5))) == 6
+    assert len(PairLocks.get_pair_locks(None, start + timedelta(minutes=5))) == 7
+    assert not PairLocks.is_pair_locked('ETH/BTC', start + timedelta(minutes=66))
+
+    assert PairLocks.is_pair_locked('XRP/BTC', start + timedelta(minutes=20))
+    assert not PairLocks.is_pair_locked('XRP/BTC', start + timedelta(minutes=21))
+    assert PairLocks.get_pair_longest_lock('ETH/BTC', start).lock_end_time == start + timedelta(
+        minutes=65)
+
+    PairLocks.unlock_pair('ETH/BTC', start + timedelta(minutes=50))
+    assert not PairLocks.is_pair_locked('ETH/BTC', start + timedelta(minutes=50))
+    # Expired locks are not touched by unlocking
+    assert len(PairLocks.get_pair_locks('ETH/BTC', start)) == 4
+
+    PairLocks.reset_locks()
+    assert PairLocks._pair_locks == {}
+    assert not PairLocks.is_pair_locked('ETH/BTC', start)
+    PairLocks.use_db = True
@@ -1,12 +1,15 @@
 import random
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
+import pandas as pd
 import pytest
 
 from freqtrade import constants
+from freqtrade.data.btanalysis import calculate_max_drawdown
 from freqtrade.enums import SellType
-from freqtrade.persistence import PairLocks, Trade
+from freqtrade.persistence import LocalTrade, PairLocks, Trade
 from freqtrade.plugins.protectionmanager import ProtectionManager
+from freqtrade.plugins.protections.trade_window import TradeWindow
 from tests.conftest import get_patched_freqtradebot, log_has_re
 
 
@@ -360,6 +363,95 @@ def test_MaxDrawdown(mocker, default_conf, fee, caplog):
     assert log_has_re(message, caplog)
 
 
+def test_protections_backtesting(mocker, default_conf, fee):
+    default_conf['protections'] = [
+        {"method": "StoplossGuard", "lookback_period": 60, "stop_duration": 60, "trade_limit": 2},
+        {"method": "LowProfitPairs", "lookback_period": 60, "stop_duration": 60, "trade_limit": 2},
+        {"method": "MaxDrawdown", "lookback_period": 60, "stop_duration": 60, "trade_limit": 3,
+         "max_allowed_drawdown": 0.05},
+    ]
+    freqtrade = get_patched_freqtradebot(mocker, default_conf)
+    stoploss_guard, low_profit, max_drawdown = freqtrade.protections._protection_handlers
+    Trade.use_db = False
+    Trade.reset_trades()
+    now = datetime.utcnow()
+
+    Trade.add_bt_trade(generate_mock_trade(
+        'XRP/BTC', fee.return_value, False, sell_reason=SellType.STOP_LOSS.value,
+        min_ago_open=100, min_ago_close=50, profit_rate=0.9,
+    ))
+    Trade.add_bt_trade(generate_mock_trade(
+        'ETH/BTC', fee.return_value, False, sell_reason=SellType.ROI.value,
+        min_ago_open=100, min_ago_close=40, profit_rate=1.2,
+    ))
+    assert stoploss_guard.stop_per_pair('XRP/BTC', now) == (False, None, None)
+    assert stoploss_guard.global_stop(now) == (False, None, None)
+    assert low_profit.stop_per_pair('XRP/BTC', now) == (False, None, None)
+    assert max_drawdown.global_stop(now) == (False, None, None)
+
+    trade = generate_mock_trade(
+        'XRP/BTC', fee.return_value, False, sell_reason=SellType.STOP_LOSS.value,
+        min_ago_open=100, min_ago_close=20, profit_rate=0.9,
+    )
+    Trade.add_bt_trade(trade)
+    until = trade.close_date.replace(tzinfo=timezone.utc) + timedelta(minutes=60)
+    assert stoploss_guard.stop_per_pair('XRP/BTC', now)[:2] == (True, until)
+    assert stoploss_guard.stop_per_pair('ETH/BTC', now) == (False, None, None)
+    assert stoploss_guard.global_stop(now)[:2] == (True, until)
+    assert low_profit.stop_per_pair('XRP/BTC', now)[:2] == (True, until)
+    assert low_profit.stop_per_pair('ETH/BTC', now) == (False, None, None)
+    assert max_drawdown.global_stop(now)[:2] == (True, until)
+
+    window = max_drawdown.get_trade_window(now - timedelta(minutes=60))
+    trades_df = pd.DataFrame([t.to_json() for t in Trade.trades])
+    assert window.count() == 3
+    assert window.max_drawdown() == pytest.approx(
+        calculate_max_drawdown(trades_df, value_col='close_profit')[0])
+    window = low_profit.get_trade_window(now - timedelta(minutes=60))
+    assert window.profit('XRP/BTC') == pytest.approx(
+        sum(t.close_profit for t in Trade.trades if t.pair == 'XRP/BTC'))
+
+    # All trades expired
+    later = now + timedelta(minutes=45)
+    assert stoploss_guard.stop_per_pair('XRP/BTC', later) == (False, None, None)
+    assert low_profit.stop_per_pair('XRP/BTC', later) == (False, None, None)
+    assert max_drawdown.global_stop(later) == (False, None, None)
+    assert max_drawdown.get_trade_window(later - timedelta(minutes=60)).count() == 0
+
+    # Evaluating an earlier date again rebuilds the window
+    assert stoploss_guard.stop_per_pair('XRP/BTC', now)[:2] == (True, until)
+
+    # New backtest
+    Trade.reset_trades()
+    assert stoploss_guard.stop_per_pair('XRP/BTC', now) == (False, None, None)
+    assert stoploss_guard.get_trade_window(now - timedelta(minutes=60)).count() == 0
+    Trade.use_db = True
+
+
+def test_trade_window_profit_exact():
+    start = datetime(2022, 1, 1, tzinfo=timezone.utc)
+    profits = [0.1, 0.2, 0.3, -0.7, 1e-17, 0.05, 0.11, None, -0.03, 0.07, 0.3, 0.0] * 5
+    # Trades given in an order different from their close dates (e.g. ordered by id)
+    trades = [LocalTrade(pair=['XRP/BTC', 'ETH/BTC'][i % 2], close_profit=profit,
+                         close_date=start + timedelta(minutes=(i * 7) % 60))
+              for i, profit in enumerate(profits)]
+    window = TradeWindow.from_trades(trades)
+
+    for minutes in range(0, 60, 3):
+        look_back_until = start + timedelta(minutes=minutes)
+        window.expire(look_back_until)
+        remaining = [t for t in trades if t.close_date > look_back_until]
+        assert window.count() == len(remaining)
+        # Same result (not only approximately) as summing the trades in their original order
+        assert window.profit() == sum(t.close_profit for t in remaining if t.close_profit)
+        for pair in ('XRP/BTC', 'ETH/BTC'):
+            assert window.profit(pair) == sum(t.close_profit for t in remaining
+                                              if t.pair == pair and t.close_profit)
+    window.expire(start + timedelta(minutes=60))
+    assert window.count() == 0
+    assert window.profit() == 0.0
+
+
 @pytest.mark.parametrize("protectionconf,desc_expected,exception_expected", [
     ({"method": "StoplossGuard", "lookback_period": 60, "trade_limit": 2, "stop_duration": 60},
      "[{'StoplossGuard': 'StoplossGuard - Frequent Stoploss Guard, "
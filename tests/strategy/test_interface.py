@@ -1,23 +1,27 @@
 # pragma pylint: disable=missing-docstring, C0103
 import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import arrow
 import pytest
-from pandas import DataFrame
+from pandas import DataFrame, Series, date_range
+from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.data.history import load_data
-from freqtrade.enums import SellType, SignalDirection
+from freqtrade.enums import RunMode, SellType, SignalDirection
 from freqtrade.exceptions import OperationalException, StrategyError
 from freqtrade.optimize.space import SKDecimal
 from freqtrade.persistence import PairLocks, Trade
 from freqtrade.resolvers import StrategyResolver
 from freqtrade.strategy.hyper import (BaseParameter, BooleanParameter, CategoricalParameter,
-                                      DecimalParameter, IntParameter, RealParameter)
+                                      DecimalParameter, IndicatorCache, IntParameter, RealParameter)
 from freqtrade.strategy.interface import SellCheckTuple
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
 from tests.conftest import CURRENT_TEST_STRATEGY, TRADE_SIDES, log_has, log_has_re
@@ -103,6 +107,32 @@ def test_analyze_pair_empty(default_conf, mocker, caplog, ohlcv_history):
     assert log_has('Empty dataframe for pair ETH/BTC', caplog)
 
 
+@pytest.mark.parametrize('workers', [1, 4])
+def test_analyze(mocker, ohlcv_history, workers) -> None:
+    strategy = StrategyTestV3({'internals': {'analysis_workers': workers}})
+    strategy.dp = DataProvider({'runmode': RunMode.DRY_RUN}, None, None)
+    # dp.ohlcv() returns a copy
+    mocker.patch.object(strategy.dp, 'ohlcv',
+                        side_effect=lambda *args, **kwargs: ohlcv_history.copy())
+    pairs = ['ETH/BTC', 'LTC/BTC', 'XRP/BTC', 'NEO/BTC', 'TKN/BTC']
+    strategy.analyze(pairs)
+
+    for pair in pairs:
+        df, _ = strategy.dp.get_analyzed_dataframe(pair, strategy.timeframe)
+        assert len(df) == len(ohlcv_history)
+        assert 'enter_long' in df
+
+    # Errors are raised in pair order, after all pairs are analyzed.
+    def analyze_pair(pair):
+        if pair in ('LTC/BTC', 'NEO/BTC'):
+            raise OperationalException(pair)
+
+    analyze_mock = mocker.patch.object(strategy, 'analyze_pair', side_effect=analyze_pair)
+    with pytest.raises(OperationalException, match='LTC/BTC'):
+        strategy.analyze(pairs)
+    assert analyze_mock.call_count == (2 if workers == 1 else len(pairs))
+
+
 def test_get_signal_empty(default_conf, caplog):
     assert (None, None) == _STRATEGY.get_latest_candle(
         'foo', default_conf['timeframe'], DataFrame()
@@ -612,6 +642,79 @@ def test__analyze_ticker_internal_skip_analyze(ohlcv_history, mocker, caplog) ->
     assert log_has('Skipping TA Analysis for already analyzed candle', caplog)
 
 
+def test__analyze_ticker_internal_incremental(mocker, caplog) -> None:
+    caplog.set_level(logging.DEBUG)
+
+    def populate_indicators(dataframe, metadata):
+        dataframe['sma'] = dataframe['close'].rolling(3).mean()
+        return dataframe
+
+    def populate_entry(dataframe, metadata):
+        dataframe['enter_long'] = (dataframe['close'] > dataframe['sma']).astype(int)
+        return dataframe
+
+    ind_mock = MagicMock(side_effect=populate_indicators)
+    mocker.patch.multiple(
+        'freqtrade.strategy.interface.IStrategy',
+        advise_indicators=ind_mock,
+        advise_entry=MagicMock(side_effect=populate_entry),
+        advise_exit=MagicMock(side_effect=lambda x, meta: x),
+    )
+    strategy = StrategyTestV3({})
+    strategy.dp = DataProvider({'runmode': RunMode.DRY_RUN}, None, None)
+    strategy.process_only_new_candles = True
+    strategy.incremental_candle_count = 5
+
+    close = Series(range(110), dtype=float).mod(7) + 10
+    candles = DataFrame({'date': date_range('2022-01-01', periods=110, freq='5min', tz='UTC'),
+                         'open': close, 'high': close + 1, 'low': close - 1, 'close': close,
+                         'volume': 1.0})
+
+    def assert_analyzed(ret, dataframe):
+        # Warm-up candles of the full analysis differ (older candles are no longer available)
+        assert_frame_equal(ret.iloc[2:],
+                           populate_entry(populate_indicators(dataframe.copy(), {}), {}).iloc[2:])
+
+    # First analysis - full dataframe
+    df = candles.iloc[:100].reset_index(drop=True)
+    ret = strategy._analyze_ticker_internal(df.copy(), {'pair': 'ETH/BTC'})
+    assert len(ind_mock.call_args[0][0]) == 100
+    assert_analyzed(ret, df)
+
+    # 2 new candles - only these (and 5 candles before them) are analyzed
+    df = candles.iloc[2:102].reset_index(drop=True)
+    ret = strategy._analyze_ticker_internal(df.copy(), {'pair': 'ETH/BTC'})
+    assert len(ind_mock.call_args[0][0]) == 7
+    assert log_has('Incremental TA Analysis of 2 candles', caplog)
+    assert_analyzed(ret, df)
+    assert strategy.dp.get_analyzed_dataframe('ETH/BTC', strategy.timeframe)[0] is ret
+
+    # Last candle changed
+    strategy.process_only_new_candles = False
+    df.loc[99, 'close'] = 5
+    ret = strategy._analyze_ticker_internal(df.copy(), {'pair': 'ETH/BTC'})
+    assert len(ind_mock.call_args[0][0]) == 6
+    assert_analyzed(ret, df)
+
+    # Gap in the candles - full analysis
+    df = candles.iloc[list(range(5, 50)) + list(range(51, 106))].reset_index(drop=True)
+    ret = strategy._analyze_ticker_internal(df.copy(), {'pair': 'ETH/BTC'})
+    assert len(ind_mock.call_args[0][0]) == 100
+    assert_analyzed(ret, df)
+
+    # Window longer than the dataframe - full analysis
+    strategy.incremental_candle_count = 100
+    df = candles.iloc[10:110].reset_index(drop=True)
+    ret = strategy._analyze_ticker_internal(df.copy(), {'pair': 'ETH/BTC'})
+    assert len(ind_mock.call_args[0][0]) == 100
+
+    # Not used outside of dry/live mode
+    strategy.incremental_candle_count = 5
+    strategy.dp = DataProvider({'runmode': RunMode.OTHER}, None, None)
+    strategy._analyze_ticker_internal(df.copy(), {'pair': 'ETH/BTC'})
+    assert len(ind_mock.call_args[0][0]) == 100
+
+
 @pytest.mark.usefixtures("init_persistence")
 def test_is_pair_locked(default_conf):
     PairLocks.timeframe = default_conf['timeframe']
@@ -800,6 +903,141 @@ def test_hyperopt_parameters():
     assert list(boolpar.range) == [True, False]
 
 
+def test_parameter_cached_indicator(mocker, ohlcv_history):
+    cache = IndicatorCache()
+    mocker.patch('freqtrade.strategy.hyper.indicator_cache', cache)
+    intpar = IntParameter(low=1, high=20, default=5, space='buy')
+    intpar.name = 'buy_period'
+    intpar._strategy_name = 'StrategyTestV3'
+    intpar._cache_indicators = True
+    calls = []
+
+    def rolling_mean(df, value):
+        calls.append(value)
+        return df['close'].rolling(value).mean()
+
+    result = intpar.cached_indicator(ohlcv_history, {'pair': 'UNITTEST/BTC'}, 'sma', rolling_mean)
+    assert calls == [5]
+    assert result.equals(ohlcv_history['close'].rolling(5).mean())
+    # Modifying the result does not modify the cached result
+    result.iloc[-1] = 0
+
+    result = intpar.cached_indicator(ohlcv_history, {'pair': 'UNITTEST/BTC'}, 'sma', rolling_mean)
+    assert calls == [5]
+    assert result.equals(ohlcv_history['close'].rolling(5).mean())
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+    # Different parameter value, pair or data need a new calculation
+    intpar.value = 7
+    intpar.cached_indicator(ohlcv_history, {'pair': 'UNITTEST/BTC'}, 'sma', rolling_mean)
+    intpar.cached_indicator(ohlcv_history, {'pair': 'UNITTEST/USDT'}, 'sma', rolling_mean)
+    intpar.cached_indicator(ohlcv_history.iloc[:-1], {'pair': 'UNITTEST/BTC'}, 'sma',
+                            rolling_mean)
+    assert calls == [5, 7, 7, 7]
+    intpar.value = 5
+    intpar.cached_indicator(ohlcv_history, {'pair': 'UNITTEST/BTC'}, 'sma', rolling_mean)
+    assert calls == [5, 7, 7, 7]
+    assert len(cache) == 4
+
+    # Numpy results are returned as Series
+    result = intpar.cached_indicator(ohlcv_history, {'pair': 'UNITTEST/BTC'}, 'close',
+                                     lambda df, value: df['close'].values * value)
+    assert isinstance(result, Series)
+    assert result.index.equals(ohlcv_history.index)
+
+    # Closures over different columns are told apart by the indicator name
+    for column in ['open', 'close']:
+        result = intpar.cached_indicator(ohlcv_history, {'pair': 'UNITTEST/BTC'},
+                                         f'sma_{column}',
+                                         lambda df, value: df[column].rolling(value).mean())
+        assert result.equals(ohlcv_history[column].rolling(5).mean())
+
+    # Newly created functions (e.g. partials) use the cached result
+    calls.clear()
+    hits = cache.hits
+    for _ in range(2):
+        intpar.cached_indicator(ohlcv_history, {'pair': 'UNITTEST/BTC'}, 'sma_partial',
+                                partial(rolling_mean))
+    assert calls == [5]
+    assert cache.hits == hits + 1
+
+    # Same parameter and indicator names in another strategy
+    calls.clear()
+    intpar._strategy_name = 'OtherStrategy'
+    intpar.cached_indicator(ohlcv_history, {'pair': 'UNITTEST/BTC'}, 'sma', rolling_mean)
+    assert calls == [5]
+
+    # Without caching (dry-run / live) - candles may change in place
+    intpar._cache_indicators = False
+    hits, misses = cache.hits, cache.misses
+    for _ in range(2):
+        result = intpar.cached_indicator(ohlcv_history, {'pair': 'UNITTEST/BTC'}, 'sma',
+                                         rolling_mean)
+        assert result.equals(ohlcv_history['close'].rolling(5).mean())
+    assert calls == [5, 5, 5]
+    assert (cache.hits, cache.misses) == (hits, misses)
+
+
+def test_indicator_cache_memory_limit(ohlcv_history):
+    result_size = ohlcv_history['close'].memory_usage(index=False)
+    cache = IndicatorCache(max_memory=result_size * 2)
+    for key in ['a', 'b', 'c']:
+        cache.get(key, ohlcv_history, lambda: ohlcv_history['close'])
+    # Least recently used result was evicted
+    assert len(cache) == 2
+    assert cache.memory == result_size * 2
+    assert 'a' not in cache._results
+
+    # Access "b" - so "c" is evicted next
+    cache.get('b', ohlcv_history, lambda: ohlcv_history['close'])
+    cache.get('d', ohlcv_history, lambda: ohlcv_history['close'])
+    assert list(cache._results) == ['b', 'd']
+
+    # Results exceeding the memory limit are not cached
+    cache.get('e', ohlcv_history, lambda: ohlcv_history[['open', 'high', 'low', 'close']])
+    assert 'e' not in cache._results
+    assert cache.memory == result_size * 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.memory == 0
+
+
+def test_parameter_cached_indicator_concurrent(mocker, ohlcv_history):
+    result_size = ohlcv_history['close'].memory_usage(index=False)
+    # Small cache - so results are evicted while other threads read and store results
+    cache = IndicatorCache(max_memory=result_size * 5)
+    mocker.patch('freqtrade.strategy.hyper.indicator_cache', cache)
+    pairs = [f'PAIR{i}/BTC' for i in range(4)]
+
+    def rolling_mean(df, value):
+        return df['close'].rolling(value).mean()
+
+    def analyze(pair):
+        intpar = IntParameter(low=1, high=20, default=5, space='buy')
+        intpar.name = 'buy_period'
+        intpar._cache_indicators = True
+        for value in list(range(1, 8)) * 20:
+            intpar.value = value
+            result = intpar.cached_indicator(ohlcv_history, {'pair': pair}, 'sma', rolling_mean)
+            assert result.equals(ohlcv_history['close'].rolling(value).mean())
+        return True
+
+    # Switch threads often, to provoke races
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=len(pairs)) as executor:
+            assert all(executor.map(analyze, pairs * 2))
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert cache.hits + cache.misses == len(pairs) * 2 * 7 * 20
+    assert len(cache) == 5
+    assert cache.memory == sum(size for _, size in cache._results.values())
+
+
 def test_auto_hyperopt_interface(default_conf):
     default_conf.update({'strategy': 'HyperoptableStrategy'})
     PairLocks.timeframe = default_conf['timeframe']
@@ -830,6 +1068,27 @@ def test_auto_hyperopt_interface(default_conf):
         [x for x in strategy.detect_parameters('sell')]
 
 
+@pytest.mark.parametrize('runmode,cache_indicators', [
+    (RunMode.DRY_RUN, False),
+    (RunMode.LIVE, False),
+    (RunMode.BACKTEST, True),
+    (RunMode.HYPEROPT, True),
+])
+def test_auto_hyperopt_interface_indicator_cache(default_conf, mocker, runmode, cache_indicators):
+    cache = IndicatorCache()
+    cache.get('key', DataFrame(), lambda: Series(dtype=float))
+    mocker.patch('freqtrade.strategy.hyper.indicator_cache', cache)
+    default_conf.update({'strategy': 'HyperoptableStrategy', 'runmode': runmode,
+                         'spaces': ['default']})
+    strategy = StrategyResolver.load_strategy(default_conf)
+
+    # Loading a strategy clears the cache
+    assert len(cache) == 0
+    for _, param in strategy.enumerate_parameters():
+        assert param._strategy_name == 'HyperoptableStrategy'
+        assert param._cache_indicators is cache_indicators
+
+
 def test_auto_hyperopt_interface_loadparams(default_conf, mocker, caplog):
     default_conf.update({'strategy': 'HyperoptableStrategy'})
     del default_conf['stoploss']
@@ -625,6 +625,67 @@ def test_process_trade_handling(default_conf_usdt, ticker_usdt, limit_buy_order_
     assert len(trades) == 1
 
 
+@pytest.mark.parametrize('batch_pricing', [False, True])
+def test_process_batch_pricing(default_conf_usdt, ticker_usdt, limit_buy_order_usdt_open, fee,
+                               mocker, batch_pricing) -> None:
+    default_conf_usdt['exchange']['batch_pricing'] = batch_pricing
+    patch_RPCManager(mocker)
+    patch_exchange(mocker)
+    mocker.patch.multiple(
+        'freqtrade.exchange.Exchange',
+        fetch_ticker=ticker_usdt,
+        create_order=MagicMock(return_value=limit_buy_order_usdt_open),
+        fetch_order=MagicMock(return_value=limit_buy_order_usdt_open),
+        get_fee=fee,
+    )
+    freqtrade = FreqtradeBot(default_conf_usdt)
+    patch_get_signal(freqtrade)
+    refresh_rates_mock = mocker.patch('freqtrade.exchange.Exchange.refresh_rates')
+    clear_rates_mock = mocker.patch('freqtrade.exchange.Exchange.clear_rates')
+
+    freqtrade.process()
+    assert len(Trade.get_open_trades()) == 1
+    assert clear_rates_mock.call_count == 1
+
+    freqtrade.process()
+    assert clear_rates_mock.call_count == 2
+    if batch_pricing:
+        assert refresh_rates_mock.call_count == 2
+        refresh_rates_mock.assert_called_with(['ETH/USDT'])
+    else:
+        assert refresh_rates_mock.call_count == 0
+
+
+def test_process_between_candles(default_conf_usdt, ticker_usdt, limit_buy_order_usdt_open, fee,
+                                 mocker) -> None:
+    patch_RPCManager(mocker)
+    patch_exchange(mocker)
+    mocker.patch.multiple(
+        'freqtrade.exchange.Exchange',
+        fetch_ticker=ticker_usdt,
+        create_order=MagicMock(return_value=limit_buy_order_usdt_open),
+        fetch_order=MagicMock(return_value=limit_buy_order_usdt_open),
+        get_fee=fee,
+    )
+    freqtrade = FreqtradeBot(default_conf_usdt)
+    patch_get_signal(freqtrade)
+    refresh_mock = mocker.patch('freqtrade.data.dataprovider.DataProvider.refresh')
+    analyze_mock = mocker.patch.object(freqtrade.strategy, 'analyze')
+    exit_mock = mocker.spy(freqtrade, 'exit_positions')
+
+    freqtrade.process()
+    assert refresh_mock.call_count == 1
+    assert analyze_mock.call_count == 1
+    assert exit_mock.call_count == 1
+    assert len(Trade.get_open_trades()) == 1
+
+    # Open orders and trades are handled - without refreshing candles or analyzing
+    freqtrade.process_between_candles()
+    assert refresh_mock.call_count == 1
+    assert analyze_mock.call_count == 1
+    assert exit_mock.call_count == 2
+
+
 def test_process_trade_no_whitelist_pair(default_conf_usdt, ticker_usdt, limit_buy_order_usdt,
                                          fee, mocker) -> None:
     """ Test process with trade not in pair list """
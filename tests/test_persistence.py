@@ -1941,6 +1941,56 @@ def test_get_trades_proxy(fee, use_db, is_short):
     Trade.use_db = True
 
 
+def test_get_trades_proxy_backtest_index(fee):
+    Trade.use_db = False
+    Trade.reset_trades()
+    start = datetime(2022, 1, 1, tzinfo=timezone.utc)
+    pairs = ['ETH/BTC', 'XRP/BTC', 'NEO/BTC']
+    # Closed trades, not added in close date order
+    for i in [3, 0, 1, 7, 5, 2, 4, 6, 8]:
+        LocalTrade.add_bt_trade(LocalTrade(
+            pair=pairs[i % 3], stake_amount=0.001, amount=1, open_rate=1, fee_open=fee.return_value,
+            fee_close=fee.return_value, is_open=False, open_date=start,
+            close_date=start + timedelta(hours=i), close_profit_abs=0.0,
+        ))
+    open_trade = LocalTrade(
+        pair='ETH/BTC', stake_amount=0.001, amount=1, open_rate=1, fee_open=fee.return_value,
+        fee_close=fee.return_value, is_open=True, open_date=start + timedelta(hours=9),
+    )
+    LocalTrade.add_bt_trade(open_trade)
+
+    def expected(pair=None, close_date=None, trades=None):
+        return sorted(
+            (t for t in trades or LocalTrade.trades if (not pair or t.pair == pair)
+             and (not close_date or t.close_date > close_date)), key=id)
+
+    assert len(Trade.get_trades_proxy(is_open=False)) == 9
+    for pair in [None, *pairs]:
+        for hours in [None, -1, 0, 3, 4, 8]:
+            close_date = start + timedelta(hours=hours) if hours is not None else None
+            trades = Trade.get_trades_proxy(pair=pair, is_open=False, close_date=close_date)
+            assert sorted(trades, key=id) == expected(pair, close_date)
+
+    trades = Trade.get_trades_proxy(pair='ETH/BTC')
+    assert sorted(trades, key=id) == sorted(expected('ETH/BTC') + [open_trade], key=id)
+    assert Trade.get_trades_proxy(pair='ETH/BTC', is_open=True) == [open_trade]
+    assert Trade.get_trades_proxy(pair='ETH/BTC', close_date=start + timedelta(hours=5)) == [
+        LocalTrade.trades[-2]]
+
+    # Closing a trade adds it to the index
+    open_trade.is_open = False
+    open_trade.close_date = start + timedelta(hours=10)
+    open_trade.close_profit_abs = 0.0
+    LocalTrade.close_bt_trade(open_trade)
+    assert Trade.get_trades_proxy(is_open=True) == []
+    assert Trade.get_trades_proxy(
+        pair='ETH/BTC', is_open=False, close_date=start + timedelta(hours=6)) == [open_trade]
+
+    Trade.reset_trades()
+    assert Trade.get_trades_proxy(pair='ETH/BTC', is_open=False) == []
+    Trade.use_db = True
+
+
 def test_get_trades_backtest():
     Trade.use_db = False
     with pytest.raises(NotImplementedError, match=r"`Trade.get_trades\(\)` not .*"):
@@ -1,9 +1,11 @@
 import logging
 import time
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, PropertyMock
 
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.enums import State
+from freqtrade.exceptions import TemporaryError
 from freqtrade.worker import Worker
 from tests.conftest import get_patched_worker, log_has, log_has_re
 
@@ -78,6 +80,72 @@ def test_throttle_with_assets(mocker, default_conf) -> None:
     result = worker._throttle(throttled_func, throttle_secs=0.1)
     assert result == -1
 
+    # Positional arguments are passed to the function, not used as timeframes
+    result = worker._throttle(throttled_func, 0.1, 42)
+    assert result == 42
+
+
+def test_throttle_candle_close(mocker, default_conf) -> None:
+    worker = get_patched_worker(mocker, default_conf)
+    sleep_mock = mocker.patch('freqtrade.worker.time.sleep')
+    # 2022-01-01 00:04:58 UTC
+    start = datetime(2022, 1, 1, 0, 4, 58, tzinfo=timezone.utc).timestamp()
+    mocker.patch('freqtrade.worker.time.time', return_value=start)
+
+    worker._throttle(MagicMock(__name__='func'), throttle_secs=10, timeframes=['5m', '1h'],
+                     timeframe_offset=1.0)
+    # Wakes up 1s after the 00:05 candle close - instead of sleeping 10s
+    assert sleep_mock.call_args[0][0] == 3
+
+    worker._throttle(MagicMock(__name__='func'), throttle_secs=2, timeframes=['5m'],
+                     timeframe_offset=1.0)
+    assert sleep_mock.call_args[0][0] == 2
+
+    # Within the offset after candle close - wait for the offset
+    mocker.patch('freqtrade.worker.time.time', return_value=start + 2.5)
+    worker._throttle(MagicMock(__name__='func'), throttle_secs=10, timeframes=['5m'],
+                     timeframe_offset=1.0)
+    assert sleep_mock.call_args[0][0] == 0.5
+
+
+def test_worker_process_on_candle_close(mocker, default_conf) -> None:
+    default_conf['internals'] = {'process_on_candle_close': True, 'candle_close_offset_secs': 2}
+    worker = get_patched_worker(mocker, default_conf)
+    process_mock = mocker.patch('freqtrade.freqtradebot.FreqtradeBot.process')
+    between_mock = mocker.patch('freqtrade.freqtradebot.FreqtradeBot.process_between_candles')
+    mocker.patch('freqtrade.worker.time.sleep')
+    start = datetime(2022, 1, 1, 0, 4, 50, tzinfo=timezone.utc).timestamp()
+    time_mock = mocker.patch('freqtrade.worker.time.time', return_value=start)
+
+    # First iteration - full
+    worker._worker(old_state=None)
+    assert process_mock.call_count == 1
+    assert between_mock.call_count == 0
+    assert worker._next_candle_run == start + 12
+
+    # Before candle close (+ offset)
+    time_mock.return_value = start + 11
+    worker._worker(old_state=State.RUNNING)
+    assert process_mock.call_count == 1
+    assert between_mock.call_count == 1
+
+    time_mock.return_value = start + 12
+    worker._worker(old_state=State.RUNNING)
+    assert process_mock.call_count == 2
+    assert between_mock.call_count == 1
+    assert worker._next_candle_run == start + 312
+
+    # Failed iterations are repeated
+    process_mock.side_effect = TemporaryError('timeout')
+    time_mock.return_value = start + 312
+    worker._worker(old_state=State.RUNNING)
+    assert process_mock.call_count == 3
+    assert worker._next_candle_run == start + 312
+    process_mock.side_effect = None
+    worker._worker(old_state=State.RUNNING)
+    assert process_mock.call_count == 4
+    assert between_mock.call_count == 1
+
 
 def test_worker_heartbeat_running(default_conf, mocker, caplog):
     message = r"Bot heartbeat\. PID=.*state='RUNNING'"